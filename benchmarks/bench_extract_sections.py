@@ -0,0 +1,101 @@
+"""Benchmark docs section extraction on a large synthetic reference page.
+
+Compares the linear walker in ``docs_differ`` against the previous
+``descendants`` + ``get_text()`` loop, which re-extracted the text of every
+nested block.  The page is parsed and stripped once up front so only the
+section walk is timed.
+
+Usage::
+
+    python benchmarks/bench_extract_sections.py [--rows 2000] [--depth 4] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import time
+
+from bs4 import BeautifulSoup
+
+from claude_code_mastery.docs_differ import HTML_PARSER, _walk_sections
+
+
+def naive_walk(main) -> dict[str, str]:
+    """The pre-walker implementation, kept here for comparison."""
+    sections: dict[str, str] = {}
+    current_heading = "__intro__"
+    current_parts: list[str] = []
+    for el in main.descendants:
+        if el.name in ("h1", "h2", "h3", "h4"):
+            text = " ".join(current_parts).strip()
+            if text:
+                sections[current_heading] = text
+            current_heading = el.get_text(strip=True)
+            current_parts = []
+        elif el.name in ("p", "li", "code", "pre", "td"):
+            t = el.get_text(strip=True)
+            if t:
+                current_parts.append(t)
+    text = " ".join(current_parts).strip()
+    if text:
+        sections[current_heading] = text
+    return sections
+
+
+def _nested_list(row: int, depth: int) -> str:
+    """``depth`` levels of <ul><li> with inline code at every level."""
+    html = f"<pre><code>claude --flag-{row} value</code></pre>"
+    for level in range(depth):
+        html = f"<ul><li>Level {level} uses <code>opt-{row}-{level}</code>{html}</li></ul>"
+    return html
+
+
+def synthetic_page(rows: int, depth: int) -> str:
+    """A CLI-reference-like page: tables whose cells hold nested lists."""
+    parts = ["<html><body><main><h1>CLI reference</h1>"]
+    for section in range(max(1, rows // 50)):
+        parts.append(f"<h2>Section {section}</h2><table>")
+        for row in range(50):
+            parts.append(
+                f"<tr><td><code>--flag-{section}-{row}</code></td>"
+                f"<td>{_nested_list(row, depth)}</td></tr>"
+            )
+        parts.append("</table>")
+    parts.append("</main></body></html>")
+    return "".join(parts)
+
+
+def _time(fn, main, repeat: int) -> tuple[float, dict]:
+    timings, result = [], {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(main)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = synthetic_page(args.rows, args.depth)
+    soup = BeautifulSoup(html, HTML_PARSER)
+    main_el = soup.select_one("main")
+
+    naive_t, naive = _time(naive_walk, main_el, args.repeat)
+    linear_t, linear = _time(_walk_sections, main_el, args.repeat)
+
+    naive_chars = sum(len(t) for t in naive.values())
+    linear_chars = sum(len(t) for t in linear.values())
+
+    print(f"page: {len(html) / 1024:.0f} KiB, {args.rows} rows, nesting depth {args.depth}, "
+          f"parser={HTML_PARSER}")
+    print(f"naive   : {naive_t * 1000:8.1f} ms  ({naive_chars:,} chars of section text)")
+    print(f"linear  : {linear_t * 1000:8.1f} ms  ({linear_chars:,} chars of section text)")
+    print(f"speedup : {naive_t / linear_t:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Microbenchmark: KeywordMatcher vs per-keyword ``in`` scans.
+
+For each keyword table (relevance, tags, week topics, gap signals,
+synonyms) times ``{kw for kw in table if kw in text}`` — what the
+consumers used to do — against ``KeywordMatcher.find``.  The last row is
+the analyzer's real pattern: three tables scanned separately per update
+vs one matcher over their union whose hit set is shared.
+
+The fallback backend is the ``in`` scan itself; the Aho-Corasick backend
+is measured when ``pyahocorasick`` is installed.
+
+Usage::
+
+    python benchmarks/bench_keywords.py [--updates 2000] [--length 500]
+"""
+
+import argparse
+import random
+import time
+
+from claude_code_mastery import keywords
+from claude_code_mastery.analyzer import (
+    CURRICULUM_TOPIC_MAP,
+    _DEPRECATION_SIGNALS,
+    _KNOWN_TOPICS,
+    _NEW_SIGNALS,
+    _UPDATE_SIGNALS,
+)
+from claude_code_mastery.keywords import KeywordMatcher
+from claude_code_mastery.semantic import _SYNONYMS
+from claude_code_mastery.sources import CLAUDE_CODE_KEYWORDS, TAG_MAP
+
+WEEK_TOPICS = [t for info in CURRICULUM_TOPIC_MAP.values() for t in info["topics"]]
+SIGNALS = _DEPRECATION_SIGNALS + _NEW_SIGNALS + _UPDATE_SIGNALS
+SYNONYM_TERMS = [t for a, b in _SYNONYMS for t in a | b]
+
+KEYWORD_SETS = {
+    "relevance": CLAUDE_CODE_KEYWORDS,
+    "tags": list(TAG_MAP),
+    "week topics": WEEK_TOPICS,
+    "gap signals": SIGNALS,
+    "synonyms": SYNONYM_TERMS,
+    "topic keys": _KNOWN_TOPICS,
+}
+ANALYZER_TABLES = [WEEK_TOPICS, SIGNALS, _KNOWN_TOPICS]
+
+FILLER = (
+    "the release notes describe improvements to performance and stability "
+    "across the board with several fixes for edge cases reported by users"
+).split()
+
+
+def synthetic_texts(count: int, length: int, seed: int = 0) -> list[str]:
+    """Lowercased update-like texts with a sprinkling of real keywords."""
+    rng = random.Random(seed)
+    vocabulary = [kw.lower() for kws in KEYWORD_SETS.values() for kw in kws]
+    texts = []
+    for _ in range(count):
+        words: list[str] = []
+        while sum(len(w) + 1 for w in words) < length:
+            words.append(rng.choice(vocabulary) if rng.random() < 0.08 else rng.choice(FILLER))
+        texts.append(" ".join(words))
+    return texts
+
+
+def _time(fn, texts: list[str], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--length", type=int, default=500)
+    args = parser.parse_args()
+
+    texts = synthetic_texts(args.updates, args.length)
+    backends = ["scan"] + (["ahocorasick"] if keywords._ahocorasick is not None else [])
+    print(f"{args.updates} texts of ~{args.length} chars; backends: {', '.join(backends)}\n")
+    header = f"{'keyword set':<12} {'kws':>4} {'in-scan':>10}"
+    print(header + "".join(f" {b:>20}" for b in backends))
+
+    for name, kws in KEYWORD_SETS.items():
+        kw_list = list(kws)
+
+        def naive(text, kw_list=kw_list):
+            return {kw for kw in kw_list if kw in text}
+
+        naive_t = _time(naive, texts)
+        row = f"{name:<12} {len(kw_list):>4} {naive_t * 1000:7.1f} ms"
+        for backend in backends:
+            matcher = KeywordMatcher(kw_list, use_automaton=backend == "ahocorasick")
+            assert all(matcher.find(t) == naive(t) for t in texts[:200])
+            t = _time(matcher.find, texts)
+            row += f" {t * 1000:9.1f} ms ({naive_t / t:4.1f}x)"
+        print(row)
+
+    # Analyzer: three separate table scans vs one shared pass over the union
+    def separate(text):
+        return [{kw for kw in table if kw in text} for table in ANALYZER_TABLES]
+
+    union = [kw for table in ANALYZER_TABLES for kw in table]
+    naive_t = _time(separate, texts)
+    row = f"{'analyzer':<12} {len(union):>4} {naive_t * 1000:7.1f} ms"
+    for backend in backends:
+        matcher = KeywordMatcher(union, use_automaton=backend == "ahocorasick")
+        t = _time(matcher.find, texts)
+        row += f" {t * 1000:9.1f} ms ({naive_t / t:4.1f}x)"
+    print(row)
+
+
+if __name__ == "__main__":
+    main()
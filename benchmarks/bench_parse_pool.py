@@ -0,0 +1,171 @@
+"""Benchmark: scraper parsing inline vs on the parse pool.
+
+Serves a multi-source fixture set — blog, changelog, YouTube and docs
+pages sized like the real ones, all arriving within a few milliseconds of
+each other — through a mock transport, and runs the four scrapers
+concurrently with the parse step:
+
+- ``inline``: on the event loop (what the scrapers used to do),
+- ``thread``: on the default thread pool,
+- ``process``: on a process pool.
+
+For each mode it reports the wall-clock time of the whole run and the
+longest event-loop stall seen by a 1 ms heartbeat task — the delay any
+other in-flight request or MCP message would suffer.  The thread pool
+mainly cuts the stall (parsing still holds the GIL); the process pool also
+cuts wall-clock time when more than one core is available.
+
+Usage::
+
+    python benchmarks/bench_parse_pool.py [--scale 1.0] [--workers 4] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from claude_code_mastery import parse_pool, sources
+from claude_code_mastery.parse_pool import configure_parse_pool, shutdown_parse_pool
+
+WORDS = (
+    "claude code agent hooks mcp server sdk model release notes improve "
+    "performance developer tool context window subagent memory plugin"
+).split()
+
+
+def _sentence(rng: random.Random, n: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def blog_page(rng: random.Random, articles: int) -> str:
+    now = datetime.now(timezone.utc)
+    parts = ["<html><body><main>"]
+    for i in range(articles):
+        parts.append(
+            f'<article><a href="/news/post-{i}"><h3>{_sentence(rng, 6)}</h3>'
+            f"<p>{_sentence(rng, 40)}</p><time datetime=\"{(now - timedelta(days=i % 60)).isoformat()}\"></time>"
+            f'<div class="card"><span>{_sentence(rng)}</span><img src="/i/{i}.png"></div></a></article>'
+        )
+    return "".join(parts) + "</main></body></html>"
+
+
+def changelog_page(rng: random.Random, entries: int) -> str:
+    parts = ["<html><body>"]
+    for i in range(entries):
+        parts.append(f"<h2>Release {i}</h2>")
+        parts.extend(f"<p>{_sentence(rng, 25)}</p>" for _ in range(6))
+        parts.append(f"<ul>{''.join(f'<li>{_sentence(rng)}</li>' for _ in range(10))}</ul>")
+    return "".join(parts) + "</body></html>"
+
+
+def youtube_page(rng: random.Random, videos: int) -> str:
+    renderers = ",".join(
+        f'{{"videoRenderer":{{"videoId":"v{i:08d}","title":{{"runs":[{{"text":"{_sentence(rng, 6)}"}}]}},'
+        f'"descriptionSnippet":{{"runs":[{{"text":"{_sentence(rng, 20)}"}}]}}}}}}'
+        for i in range(videos)
+    )
+    filler = "".join(f'<div class="yt-{i}"><span>{_sentence(rng)}</span></div>' for i in range(videos * 10))
+    return (
+        f"<html><head><script>var cfg = {{}};</script></head><body>{filler}"
+        f"<script>var ytInitialData = {{\"contents\":[{renderers}]}};</script></body></html>"
+    )
+
+
+def docs_page(rng: random.Random, links: int) -> str:
+    nav = "".join(f'<a href="/en/docs/claude-code/page-{i}">{_sentence(rng, 3)} {i}</a>' for i in range(links))
+    body = "".join(f"<p>{_sentence(rng, 30)}</p>" for _ in range(links * 4))
+    return f'<html><body><nav>{nav}</nav><main>{body}</main></body></html>'
+
+
+def fixture_set(scale: float) -> dict[str, str]:
+    rng = random.Random(0)
+    return {
+        sources.ANTHROPIC_BLOG_URL: blog_page(rng, int(400 * scale)),
+        sources.ANTHROPIC_CHANGELOG_URL: changelog_page(rng, int(150 * scale)),
+        "https://www.youtube.com/@anthropic-ai/videos": youtube_page(rng, int(300 * scale)),
+        sources.CLAUDE_CODE_DOCS_URL: docs_page(rng, int(300 * scale)),
+    }
+
+
+async def _run_once(pages: dict[str, str]) -> tuple[float, float]:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.005)
+        url = str(request.url)
+        return httpx.Response(200, text=pages[url]) if url in pages else httpx.Response(404)
+
+    stall = 0.0
+    running = True
+
+    async def heartbeat():
+        nonlocal stall
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        results = await asyncio.gather(
+            sources.fetch_anthropic_blog(30, client),
+            sources.fetch_anthropic_changelog(30, client),
+            sources.fetch_anthropic_youtube(30, client),
+            sources.fetch_claude_code_docs(client),
+        )
+    wall = time.perf_counter() - start
+    running = False
+    await beat
+    assert all(results), "every scraper should find updates in the fixtures"
+    return wall, stall
+
+
+async def _inline(parse, *args):
+    return parse(*args)
+
+
+def bench(mode: str, pages: dict[str, str], workers: int, repeat: int) -> tuple[float, float]:
+    real_run_parse = sources.run_parse
+    if mode == "inline":
+        sources.run_parse = _inline
+    else:
+        configure_parse_pool(mode, workers)
+        asyncio.run(parse_pool.run_parse(len, ""))  # Start the workers outside the timing
+    try:
+        runs = [asyncio.run(_run_once(pages)) for _ in range(repeat)]
+    finally:
+        sources.run_parse = real_run_parse
+        shutdown_parse_pool()
+    return min(w for w, _ in runs), min(s for _, s in runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply fixture page sizes")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = fixture_set(args.scale)
+    total_kb = sum(len(p) for p in pages.values()) / 1024
+    print(f"{len(pages)} pages, {total_kb:.0f} KiB total; {args.workers} workers; {os.cpu_count()} CPUs\n")
+    print(f"{'mode':<8} {'wall':>10} {'max loop stall':>16}")
+
+    baseline = None
+    for mode in ("inline", "thread", "process"):
+        wall, stall = bench(mode, pages, args.workers, args.repeat)
+        baseline = baseline or (wall, stall)
+        print(
+            f"{mode:<8} {wall * 1000:7.0f} ms ({baseline[0] / wall:3.1f}x)"
+            f" {stall * 1000:8.1f} ms ({baseline[1] / stall:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,23 @@ Uses a multi-layered gap detection approach:
 3. Tag-based matching (fallback)
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import re
 from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime, timezone
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterable, AsyncIterator, Optional
 
 from .sources import Update
-from .semantic import SemanticIndex, is_semantically_covered, find_best_week
+from .semantic import SemanticMatch, get_index
+from .keywords import KeywordMatcher
+from .outline import get_outline
+from .cache import load_gap_results, store_gap_results
 
 logger = logging.getLogger(__name__)
 
@@ -142,9 +149,124 @@ CURRICULUM_TOPIC_MAP = {
 }
 
 
+# --- Keyword tables ---
+
+# High-signal phrases for cross-source dedup, checked in this order
+_KNOWN_TOPICS = [
+    "opus 4.6", "opus 4", "sonnet 4.5", "haiku 4.5",
+    "agent teams", "agent sdk", "cowork",
+    "auto memory", "fast mode", "plan mode",
+    "task management", "mcp",
+]
+_DEPRECATION_SIGNALS = ["deprecated", "removed", "no longer", "replaced by", "breaking change", "sunset"]
+_NEW_SIGNALS = ["introducing", "new feature", "now available", "just shipped", "launched", "announcing", "release"]
+_UPDATE_SIGNALS = ["updated", "improved", "enhanced", "faster", "better", "changed", "upgrade"]
+
+# (trigger in update, any of these in the curriculum) → topic already covered.
+# Multi-word phrases specific enough to confirm coverage.
+_COVERAGE_PHRASES = [
+    # Model names
+    ("opus 4.6", ["opus 4.6"]),
+    ("sonnet 4.5", ["sonnet 4.5"]),
+    ("haiku 4.5", ["haiku 4.5"]),
+    # Tools and features
+    ("agent sdk", ["agent sdk"]),
+    ("claudedesk", ["claudedesk"]),
+    ("rtk", ["rtk"]),
+    ("token killer", ["rtk", "token killer"]),
+    ("obsidian", ["obsidian"]),
+    ("cleanup script", ["cleanup strategies", "~/.claude directory"]),
+    ("developer platform", ["developer platform", "platform.claude.com"]),
+    ("model context protocol", ["model context protocol", "mcp"]),
+    ("cowork", ["cowork"]),
+    # Core Claude Code features (broad but curriculum-relevant)
+    ("hooks", ["hook events", "hook types", "/hooks"]),
+    ("skills", ["skill frontmatter", "skill.md", "custom slash"]),
+    ("subagent", ["subagent", "built-in subagent"]),
+    ("custom command", ["custom commands", ".claude/commands"]),
+    ("permission", ["permission mode", "allowedtools", "bypasspermissions"]),
+    ("mcp server", ["mcp server", "mcp serve", "mcp tool"]),
+    ("ide integration", ["vs code", "jetbrains", "ide integration"]),
+    ("environment variable", ["claude_model", "anthropic_api_key", "environment variable"]),
+    # Version-specific mentions
+    ("v2.1.", ["v2.1."]),
+]
+
+# One matcher over every table: an update's text is scanned once and the
+# hit set is shared by week matching, gap classification and topic keys.
+_KEYWORD_MATCHER = KeywordMatcher(
+    [topic for info in CURRICULUM_TOPIC_MAP.values() for topic in info["topics"]]
+    + _KNOWN_TOPICS + _DEPRECATION_SIGNALS + _NEW_SIGNALS + _UPDATE_SIGNALS
+    + [trigger for trigger, _ in _COVERAGE_PHRASES]
+)
+_COVERAGE_PHRASE_MATCHER = KeywordMatcher(
+    phrase for _, required_any in _COVERAGE_PHRASES for phrase in required_any
+)
+
+_URL_RE = re.compile(r"https?://[^\s<>()\[\]\"'`]+")
+_VERSION_RE = re.compile(r"v\d+\.\d+\.\d+")
+
+
+@lru_cache(maxsize=1024)
+def _keyword_hits(text: str) -> frozenset[str]:
+    """All analyzer keywords occurring in ``text`` (lowercased update text)."""
+    return frozenset(_KEYWORD_MATCHER.find(text))
+
+
+# --- Curriculum index ---
+
+class CurriculumIndex:
+    """Lookups over the curriculum, built once per analysis run.
+
+    Per-update coverage checks then cost O(update) instead of re-lowering
+    and re-scanning the whole curriculum for every update.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        urls = {u.rstrip(".,;:!?") for u in _URL_RE.findall(text)}
+        self.urls: frozenset[str] = frozenset(urls | {u.rstrip("/") for u in urls})
+        self.versions: frozenset[str] = frozenset(_VERSION_RE.findall(self.lower))
+        # Which of the _COVERAGE_PHRASES' curriculum-side phrases are present
+        self.phrase_hits: frozenset[str] = frozenset(_COVERAGE_PHRASE_MATCHER.find(self.lower))
+        self._contains: dict[str, bool] = {}
+
+    def has_url(self, url: str) -> bool:
+        return url.rstrip("/") in self.urls
+
+    def contains(self, phrase: str) -> bool:
+        """Substring check on the lowercased curriculum, memoised per phrase."""
+        if phrase not in self._contains:
+            self._contains[phrase] = phrase in self.lower
+        return self._contains[phrase]
+
+
+_last_curriculum_index: Optional[CurriculumIndex] = None
+
+
+def get_curriculum_index(curriculum: "str | CurriculumIndex") -> CurriculumIndex:
+    """Return ``curriculum`` as a ``CurriculumIndex`` (reusing the last one built)."""
+    global _last_curriculum_index
+    if isinstance(curriculum, CurriculumIndex):
+        return curriculum
+    cached = _last_curriculum_index
+    if cached is None or (cached.text is not curriculum and cached.text != curriculum):
+        cached = _last_curriculum_index = CurriculumIndex(curriculum)
+    return cached
+
+
 # --- Analysis Functions ---
 
-def analyze_gaps(updates: list[Update], curriculum_content: Optional[str] = None) -> list[CurriculumGap]:
+# Bump when per-update analysis logic changes, to invalidate memoised results
+GAP_ANALYSIS_VERSION = 1
+
+
+def analyze_gaps(
+    updates: list[Update],
+    curriculum_content: Optional[str] = None,
+    memoize: bool = True,
+) -> list[CurriculumGap]:
     """
     Compare updates against the curriculum and identify gaps.
 
@@ -152,89 +274,226 @@ def analyze_gaps(updates: list[Update], curriculum_content: Optional[str] = None
     1. GitHub releases are grouped into a single summary (feature releases vs bugfix-only).
     2. Cross-source duplicates on the same topic are merged into one gap.
 
+    Per-update results are memoised in the cache DB keyed by the update's
+    full content and a curriculum fingerprint, so only new updates (or all
+    of them, after the curriculum changes) are classified and scored.
+    Cross-source dedup always runs over the merged set.
+
     Args:
         updates: List of recent updates from various sources
         curriculum_content: Optional raw markdown of the current curriculum file
+        memoize: Reuse and store per-update results (default True)
 
     Returns:
         List of identified gaps with suggestions
     """
-    # --- Build semantic index (if curriculum provided) ---
-    sem_index = None
-    if curriculum_content:
-        sem_index = SemanticIndex()
-        if sem_index.build(curriculum_content, CURRICULUM_TOPIC_MAP):
-            logger.info("Semantic index ready for enhanced gap analysis")
-        else:
-            logger.info("Semantic index unavailable — using heuristic matching only")
-            sem_index = None
+    stream = GapStream(curriculum_content, memoize=memoize)
+    stream.add(updates)
+    return stream.gaps()
+
 
-    # --- Pass 1: consolidate GitHub releases ---
-    release_updates = [u for u in updates if u.source == "github_releases"]
-    other_updates = [u for u in updates if u.source != "github_releases"]
+class GapStream:
+    """Incremental gap analysis over batches of updates.
 
-    consolidated = list(other_updates)  # start with non-release updates
-    if release_updates:
-        consolidated.extend(_consolidate_releases(release_updates))
+    ``add`` analyses one batch — typically one source's updates as they
+    arrive — and returns the gaps on topics not reported earlier in the
+    stream, so callers can show results progressively.  ``gaps`` returns
+    the full list with cross-source duplicates merged, exactly as
+    ``analyze_gaps`` would for everything added.  GitHub releases should
+    arrive in one batch (they do: one source) to be consolidated together.
+    """
+
+    def __init__(self, curriculum_content: Optional[str] = None, memoize: bool = True):
+        self.curriculum_content = curriculum_content
+        self.memoize = memoize
+        self._fingerprint = _curriculum_fingerprint(curriculum_content)
+        self._raw_gaps: list[CurriculumGap] = []
+        self._topics: set[str] = set()
+
+    def add(self, updates: list[Update]) -> list[CurriculumGap]:
+        raw_gaps = self._analyze(updates)
+        self._raw_gaps.extend(raw_gaps)
+        new_gaps = []
+        for gap in raw_gaps:
+            key = _topic_key(gap)
+            if key not in self._topics:
+                self._topics.add(key)
+                new_gaps.append(gap)
+        return new_gaps
+
+    def gaps(self) -> list[CurriculumGap]:
+        # --- Pass 3: cross-source deduplication ---
+        # On copies: dedup mutates the representative gap, and gaps() may be
+        # called again or the progressive gaps already handed out
+        gaps = _deduplicate_cross_source([replace(g) for g in self._raw_gaps])
+
+        # Sort by priority (high first)
+        priority_order = {"high": 0, "medium": 1, "low": 2}
+        gaps.sort(key=lambda g: priority_order.get(g.priority, 3))
+
+        return gaps
+
+    def _analyze(self, updates: list[Update]) -> list[CurriculumGap]:
+        # --- Pass 1: consolidate GitHub releases ---
+        release_updates = [u for u in updates if u.source == "github_releases"]
+        other_updates = [u for u in updates if u.source != "github_releases"]
+
+        consolidated = list(other_updates)  # start with non-release updates
+        if release_updates:
+            consolidated.extend(_consolidate_releases(release_updates))
+            logger.info(
+                "Consolidated %d GitHub releases into %d summary update(s)",
+                len(release_updates), len(consolidated) - len(other_updates),
+            )
+
+        # --- Pass 2: per-update analysis (memoised) ---
+        update_hashes = [_update_fingerprint(u) for u in consolidated]
+        results = load_gap_results(self._fingerprint, update_hashes) if self.memoize else {}
+        pending = [i for i, h in enumerate(update_hashes) if h not in results]
+
+        if pending:
+            new_results = _analyze_pending(
+                [consolidated[i] for i in pending], self.curriculum_content,
+            )
+            results.update(
+                (update_hashes[i], result) for i, result in zip(pending, new_results)
+            )
+            if self.memoize:
+                store_gap_results(
+                    self._fingerprint,
+                    {update_hashes[i]: results[update_hashes[i]] for i in pending},
+                )
         logger.info(
-            "Consolidated %d GitHub releases into %d summary update(s)",
-            len(release_updates), len(consolidated) - len(other_updates),
+            "Gap analysis: %d update(s) analysed, %d reused from memo",
+            len(pending), len(consolidated) - len(pending),
         )
 
-    # --- Pass 2: build raw gaps (skip already-covered topics) ---
-    raw_gaps = []
-    skipped_covered = 0
-    skipped_semantic = 0
-    for update in consolidated:
-        update_text = f"{update.title} {update.content}".lower()
+        raw_gaps = []
+        skipped_covered = 0
+        skipped_semantic = 0
+        for update, update_hash in zip(consolidated, update_hashes):
+            result = results[update_hash]
+            if result.get("skipped") == "heuristic":
+                skipped_covered += 1
+            elif result.get("skipped") == "semantic":
+                skipped_semantic += 1
+            elif "gap" in result:
+                # Fresh object each run — dedup mutates suggestion/source_count
+                raw_gaps.append(CurriculumGap(update=update, **result["gap"]))
+
+        if skipped_covered:
+            logger.info("Skipped %d updates already covered (heuristic)", skipped_covered)
+        if skipped_semantic:
+            logger.info("Skipped %d updates already covered (semantic)", skipped_semantic)
 
-        affected_weeks = _find_affected_weeks(update_text)
+        return raw_gaps
 
-        # Try semantic week matching for unmatched updates
-        if affected_weeks == [0] and sem_index:
-            semantic_week = sem_index.best_week(update_text)
-            if semantic_week and semantic_week > 0:
-                affected_weeks = [semantic_week]
 
-        gap_type = _classify_gap(update, update_text, curriculum_content)
+async def iter_gaps(
+    batches: AsyncIterable[list[Update]],
+    curriculum_content: Optional[str] = None,
+    stream: Optional[GapStream] = None,
+) -> AsyncIterator[CurriculumGap]:
+    """Yield gaps as batches of updates arrive (first gap per topic).
 
-        # Skip topics that are already covered in the curriculum
-        if gap_type == "already_covered":
-            skipped_covered += 1
+    Each batch is analysed in a worker thread so fetches still in flight
+    keep progressing.  Pass a ``GapStream`` to get the merged
+    ``stream.gaps()`` once the iterator is exhausted.
+    """
+    stream = stream or GapStream(curriculum_content)
+    async for batch in batches:
+        if not batch:
             continue
+        for gap in await asyncio.to_thread(stream.add, list(batch)):
+            yield gap
 
-        # Secondary check: semantic matching for topics the heuristic missed
-        # Use a higher threshold (0.30) to avoid false positives from broad curriculum terms
-        if curriculum_content and sem_index and gap_type != "deprecated":
-            if is_semantically_covered(update_text, curriculum_content, threshold=0.30, index=sem_index):
-                skipped_semantic += 1
-                continue
 
-        priority = _assess_priority(update, gap_type, affected_weeks)
-        suggestion = _generate_suggestion(update, affected_weeks, gap_type)
+def _curriculum_fingerprint(curriculum_content: Optional[str]) -> str:
+    """Identify the curriculum version (and analysis logic) results depend on."""
+    digest = hashlib.sha256(f"v{GAP_ANALYSIS_VERSION}\0".encode())
+    digest.update(json.dumps(CURRICULUM_TOPIC_MAP, sort_keys=True).encode())
+    digest.update((curriculum_content or "").encode())
+    return digest.hexdigest()[:32]
 
-        if suggestion:
-            raw_gaps.append(CurriculumGap(
-                update=update,
-                affected_weeks=affected_weeks,
-                gap_type=gap_type,
-                priority=priority,
-                suggestion=suggestion,
-            ))
 
-    if skipped_covered:
-        logger.info("Skipped %d updates already covered (heuristic)", skipped_covered)
-    if skipped_semantic:
-        logger.info("Skipped %d updates already covered (semantic)", skipped_semantic)
+def _update_fingerprint(update: Update) -> str:
+    """Hash of every update field the analysis reads.
 
-    # --- Pass 3: cross-source deduplication ---
-    gaps = _deduplicate_cross_source(raw_gaps)
+    Not ``_content_hash``: that only covers the first 200 characters of
+    content and ignores url/tags, which coverage and suggestions depend on.
+    ``date`` is left out: scrapers without a published date stamp updates
+    with the fetch time, which would make every re-scrape a memo miss.
+    """
+    raw = json.dumps(
+        [update.source, update.title, update.content, update.url, update.tags],
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
 
-    # Sort by priority (high first)
-    priority_order = {"high": 0, "medium": 1, "low": 2}
-    gaps.sort(key=lambda g: priority_order.get(g.priority, 3))
 
-    return gaps
+def _analyze_pending(updates: list[Update], curriculum_content: Optional[str]) -> list[dict]:
+    """Classify and score updates with no memoised result.
+
+    Returns one JSON-serialisable result per update: ``{"skipped": reason}``,
+    ``{"gap": {...CurriculumGap fields...}}`` or ``{}`` (no suggestion).
+    """
+    # --- Build semantic index (if curriculum provided) ---
+    sem_index = None
+    if curriculum_content:
+        sem_index = get_index(curriculum_content, CURRICULUM_TOPIC_MAP)
+        if sem_index:
+            logger.info("Semantic index ready for enhanced gap analysis")
+        else:
+            logger.info("Semantic index unavailable — using heuristic matching only")
+
+    curriculum_index = get_curriculum_index(curriculum_content) if curriculum_content else None
+    update_texts = [f"{u.title} {u.content}".lower() for u in updates]
+
+    # Semantic week + coverage for every update in one batched query.
+    # Coverage uses a higher threshold (0.30) to avoid false positives
+    # from broad curriculum terms.
+    matches = sem_index.match_batch(update_texts, coverage_threshold=0.30) if sem_index else None
+
+    return [
+        _analyze_update(update, update_text, curriculum_index, matches[i] if matches else None)
+        for i, (update, update_text) in enumerate(zip(updates, update_texts))
+    ]
+
+
+def _analyze_update(
+    update: Update,
+    update_text: str,
+    curriculum_index: Optional[CurriculumIndex],
+    match: Optional[SemanticMatch],
+) -> dict:
+    affected_weeks = _find_affected_weeks(update_text)
+
+    # Try semantic week matching for unmatched updates
+    if affected_weeks == [0] and match:
+        semantic_week = match.best_week
+        if semantic_week and semantic_week > 0:
+            affected_weeks = [semantic_week]
+
+    gap_type = _classify_gap(update, update_text, curriculum_index)
+
+    # Skip topics that are already covered in the curriculum
+    if gap_type == "already_covered":
+        return {"skipped": "heuristic"}
+
+    # Secondary check: semantic matching for topics the heuristic missed
+    if match and gap_type != "deprecated" and match.covered:
+        return {"skipped": "semantic"}
+
+    priority = _assess_priority(update, gap_type, affected_weeks)
+    suggestion = _generate_suggestion(update, affected_weeks, gap_type)
+    if not suggestion:
+        return {}
+
+    return {"gap": {
+        "affected_weeks": affected_weeks,
+        "gap_type": gap_type,
+        "priority": priority,
+        "suggestion": suggestion,
+    }}
 
 
 def _consolidate_releases(releases: list[Update]) -> list[Update]:
@@ -320,14 +579,9 @@ def _topic_key(gap: CurriculumGap) -> str:
     text = f"{gap.update.title} {gap.update.content}".lower()
 
     # Check for known high-signal phrases
-    known_topics = [
-        "opus 4.6", "opus 4", "sonnet 4.5", "haiku 4.5",
-        "agent teams", "agent sdk", "cowork",
-        "auto memory", "fast mode", "plan mode",
-        "task management", "mcp",
-    ]
-    for topic in known_topics:
-        if topic in text:
+    hits = _keyword_hits(text)
+    for topic in _KNOWN_TOPICS:
+        if topic in hits:
             return topic
 
     # Fall back to affected-weeks tuple as grouping key
@@ -380,15 +634,12 @@ def _deduplicate_cross_source(gaps: list[CurriculumGap]) -> list[CurriculumGap]:
 
 def _find_affected_weeks(text: str) -> list[int]:
     """Find which curriculum weeks are affected by this update."""
-    affected = []
-    
-    for week_num, info in CURRICULUM_TOPIC_MAP.items():
-        for topic in info["topics"]:
-            if topic in text:
-                if week_num not in affected:
-                    affected.append(week_num)
-                break
-    
+    hits = _keyword_hits(text)
+    affected = [
+        week_num for week_num, info in CURRICULUM_TOPIC_MAP.items()
+        if any(topic in hits for topic in info["topics"])
+    ]
+
     # If no existing week matches, this might be a new topic
     if not affected:
         affected = [0]  # 0 = needs new section or appendix
@@ -396,41 +647,46 @@ def _find_affected_weeks(text: str) -> list[int]:
     return sorted(affected)
 
 
-def _classify_gap(update: Update, text: str, curriculum_content: Optional[str]) -> str:
-    """Classify the type of gap."""
+def _classify_gap(
+    update: Update, text: str, curriculum: "str | CurriculumIndex | None",
+) -> str:
+    """Classify the type of gap.
+
+    ``curriculum`` may be the raw markdown or a prebuilt ``CurriculumIndex``.
+    """
+    signals = _keyword_hits(text)
 
     # Check for deprecation signals
-    deprecation_signals = ["deprecated", "removed", "no longer", "replaced by", "breaking change", "sunset"]
-    if any(signal in text for signal in deprecation_signals):
+    if any(signal in signals for signal in _DEPRECATION_SIGNALS):
         return "deprecated"
 
     # If curriculum content is provided, check if the topic is already covered
-    if curriculum_content:
-        if _topic_already_covered(update, text, curriculum_content):
+    index = get_curriculum_index(curriculum) if curriculum else None
+    if index:
+        if _topic_already_covered(update, text, index):
             return "already_covered"
 
     # Check for new feature signals
-    new_signals = ["introducing", "new feature", "now available", "just shipped", "launched", "announcing", "release"]
-    if any(signal in text for signal in new_signals):
+    if any(signal in signals for signal in _NEW_SIGNALS):
         return "new_feature"
 
     # Check for updates to existing features
-    update_signals = ["updated", "improved", "enhanced", "faster", "better", "changed", "upgrade"]
-    if any(signal in text for signal in update_signals):
+    if any(signal in signals for signal in _UPDATE_SIGNALS):
         return "updated"
 
     # If curriculum content is provided, check if topic exists by tags
-    if curriculum_content:
+    if index:
         key_terms = [t for t in update.tags if t not in ["claude-code"]]
         if key_terms:
-            content_lower = curriculum_content.lower()
-            if not any(term.replace("-", " ") in content_lower for term in key_terms):
+            if not any(index.contains(term.replace("-", " ")) for term in key_terms):
                 return "new_topic"
 
     return "new_feature"
 
 
-def _topic_already_covered(update: Update, text: str, curriculum_content: str) -> bool:
+def _topic_already_covered(
+    update: Update, text: str, curriculum: "str | CurriculumIndex",
+) -> bool:
     """Check if an update's core topic is already covered in the curriculum.
 
     Uses multiple heuristic checks:
@@ -438,46 +694,19 @@ def _topic_already_covered(update: Update, text: str, curriculum_content: str) -
     2. URL matching (if the same URL is already referenced)
     3. Version-specific strings (e.g., "v2.1.32", "opus 4.6")
     """
-    content_lower = curriculum_content.lower()
+    index = get_curriculum_index(curriculum)
 
     # Check 1: If the update URL is already in the curriculum, it's covered
-    if update.url and update.url in curriculum_content:
+    if update.url and index.has_url(update.url):
         return True
 
-    # Check 2: Extract distinctive phrases from the title and check curriculum
-    # These are multi-word phrases that are specific enough to confirm coverage
+    # Check 2: Distinctive phrases from the title/content, looked up in the
+    # precomputed curriculum phrase hits
     title_lower = update.title.lower()
-    _COVERAGE_PHRASES = [
-        # Model names
-        ("opus 4.6", ["opus 4.6"]),
-        ("sonnet 4.5", ["sonnet 4.5"]),
-        ("haiku 4.5", ["haiku 4.5"]),
-        # Tools and features
-        ("agent sdk", ["agent sdk"]),
-        ("claudedesk", ["claudedesk"]),
-        ("rtk", ["rtk"]),
-        ("token killer", ["rtk", "token killer"]),
-        ("obsidian", ["obsidian"]),
-        ("cleanup script", ["cleanup strategies", "~/.claude directory"]),
-        ("developer platform", ["developer platform", "platform.claude.com"]),
-        ("model context protocol", ["model context protocol", "mcp"]),
-        ("cowork", ["cowork"]),
-        # Core Claude Code features (broad but curriculum-relevant)
-        ("hooks", ["hook events", "hook types", "/hooks"]),
-        ("skills", ["skill frontmatter", "skill.md", "custom slash"]),
-        ("subagent", ["subagent", "built-in subagent"]),
-        ("custom command", ["custom commands", ".claude/commands"]),
-        ("permission", ["permission mode", "allowedtools", "bypasspermissions"]),
-        ("mcp server", ["mcp server", "mcp serve", "mcp tool"]),
-        ("ide integration", ["vs code", "jetbrains", "ide integration"]),
-        ("environment variable", ["claude_model", "anthropic_api_key", "environment variable"]),
-        # Version-specific mentions
-        ("v2.1.", ["v2.1."]),
-    ]
-
+    hits = _keyword_hits(text)
     for trigger, required_any in _COVERAGE_PHRASES:
-        if trigger in title_lower or trigger in text:
-            if any(phrase in content_lower for phrase in required_any):
+        if trigger in hits or trigger in title_lower:
+            if any(phrase in index.phrase_hits for phrase in required_any):
                 logger.debug(
                     "Topic '%s' already covered (matched: %s)",
                     update.title[:50], trigger,
@@ -485,9 +714,9 @@ def _topic_already_covered(update: Update, text: str, curriculum_content: str) -
                 return True
 
     # Check 3: Extract version numbers from content and check if any are referenced
-    version_matches = re.findall(r'v\d+\.\d+\.\d+', text)
+    version_matches = _VERSION_RE.findall(text)
     if version_matches:
-        covered_versions = sum(1 for v in version_matches if v in content_lower)
+        covered_versions = sum(1 for v in version_matches if v in index.versions)
         if covered_versions >= len(version_matches) * 0.5:  # >50% of versions mentioned
             logger.debug(
                 "Topic '%s' likely covered (%d/%d versions found in curriculum)",
@@ -631,27 +860,49 @@ def generate_update_report(gaps: list[CurriculumGap]) -> str:
     return report
 
 
+# Curriculum files read this process: {resolved path: (st_mtime_ns, st_size, text)}
+_curriculum_file_cache: dict[Path, tuple[int, int, str]] = {}
+
+
 def load_curriculum_file(path: str) -> Optional[str]:
-    """Load curriculum markdown file from disk."""
+    """Load curriculum markdown file from disk.
+
+    Served from memory while the file's mtime and size are unchanged, so
+    repeated tool calls and scheduler ticks only ``stat`` the file.
+    """
     try:
         p = Path(path).expanduser().resolve()
-        if p.exists():
-            return p.read_text(encoding="utf-8")
-        logger.warning("Curriculum file not found: %s", p)
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            _curriculum_file_cache.pop(p, None)
+            logger.warning("Curriculum file not found: %s", p)
+            return None
+        cached = _curriculum_file_cache.get(p)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        text = p.read_text(encoding="utf-8")
+        _curriculum_file_cache[p] = (st.st_mtime_ns, st.st_size, text)
+        return text
     except Exception as e:
         logger.error("Failed to load curriculum file %s: %s", path, e)
     return None
 
 
 def save_curriculum_file(path: str, content: str) -> bool:
-    """Save updated curriculum to disk."""
+    """Save updated curriculum to disk (and to the in-memory file cache)."""
+    p = None
     try:
         p = Path(path).expanduser().resolve()
         p.parent.mkdir(parents=True, exist_ok=True)
         p.write_text(content, encoding="utf-8")
+        st = p.stat()
+        _curriculum_file_cache[p] = (st.st_mtime_ns, st.st_size, content)
         logger.info("Saved curriculum file: %s (%d chars)", p, len(content))
         return True
     except Exception as e:
+        if p is not None:
+            _curriculum_file_cache.pop(p, None)
         logger.error("Failed to save curriculum file %s: %s", path, e)
         return False
 
@@ -741,28 +992,18 @@ def apply_single_update(curriculum_content: str, update: CurriculumUpdate) -> st
     update_block = f"\n\n{update.content}\n"
 
     if update.action == "append" and update.week > 0:
-        week_pattern = re.compile(
-            rf'^(#{{1,3}})\s+(?:WEEK|Week|week)\s+{update.week}\b',
-            re.MULTILINE,
-        )
-        match = week_pattern.search(curriculum_content)
+        outline = get_outline(curriculum_content)
+        week = outline.week(update.week)
 
-        if not match:
+        if week is None:
             # Week not found — append at end
             return curriculum_content + update_block
 
-        week_pos = match.start()
-
-        # Find next week/phase/appendix header after this week
-        next_section = re.compile(
-            rf'^#{{1,3}}\s+(?:(?:WEEK|Week|week)\s+{update.week + 1}\b|(?:Phase|PHASE|Appendix|APPENDIX))',
-            re.MULTILINE,
-        )
-        next_match = next_section.search(curriculum_content, match.end())
-        next_boundary = next_match.start() if next_match else len(curriculum_content)
+        # Next week/phase/appendix header after this week
+        next_boundary = outline.week_boundary(update.week, week.body)
 
         # Find last --- separator before boundary
-        sep_pos = curriculum_content.rfind("\n---", week_pos, next_boundary)
+        sep_pos = outline.last_separator(week.start, next_boundary)
         insert_pos = sep_pos if sep_pos != -1 else next_boundary
 
         return curriculum_content[:insert_pos] + update_block + curriculum_content[insert_pos:]
@@ -779,18 +1020,125 @@ def apply_single_update(curriculum_content: str, update: CurriculumUpdate) -> st
                 f"Use action='append' instead."
             )
 
-        next_header = re.compile(r'^#{1,3}\s+', re.MULTILINE)
         search_start = section_idx + len(update.section)
-        next_match = next_header.search(curriculum_content, search_start)
+        next_header = get_outline(curriculum_content).next_header(search_start)
 
-        if next_match:
+        if next_header:
             return (
                 curriculum_content[:section_idx]
                 + update_block + "\n"
-                + curriculum_content[next_match.start():]
+                + curriculum_content[next_header.start:]
             )
         else:
             return curriculum_content[:section_idx] + update_block
 
     else:
         raise ValueError(f"Invalid action '{update.action}'. Use 'append', 'replace', or 'new'.")
+
+
+# --- Batch apply ---
+
+_BARE_HEADER_RE = re.compile(r'^#{1,3}\s*$', re.MULTILINE)
+_LINE_START_HASH_RE = re.compile(r'^#', re.MULTILINE)
+
+
+def apply_updates(
+    curriculum_content: str,
+    updates: list[CurriculumUpdate],
+) -> tuple[str, list[Optional[ValueError]]]:
+    """Apply several CurriculumUpdates, as if by ``apply_single_update`` in order.
+
+    Locates every insertion point against the original text in one header
+    scan, then assembles the result with a single join instead of copying
+    the whole curriculum once per update.  Batches where an earlier update
+    could move a later one's insertion point (replacements, inserted
+    headers or ``---`` separators, appends that run to the end of the
+    document after an appendix) are applied sequentially, so the output is
+    always identical to the sequential path.
+
+    Returns the new content and, per update, None or the ValueError that
+    ``apply_single_update`` would have raised (that update is skipped).
+    """
+    plan = _plan_batch_inserts(curriculum_content, updates)
+    if plan is None:
+        return _apply_sequentially(curriculum_content, updates)
+
+    inserts, errors = plan
+    inserts.sort(key=lambda item: (item[0], item[1]))
+    pieces = []
+    last = 0
+    for pos, _, block in inserts:
+        pieces.append(curriculum_content[last:pos])
+        pieces.append(block)
+        last = pos
+    pieces.append(curriculum_content[last:])
+    return "".join(pieces), errors
+
+
+def _apply_sequentially(
+    curriculum_content: str,
+    updates: list[CurriculumUpdate],
+) -> tuple[str, list[Optional[ValueError]]]:
+    errors: list[Optional[ValueError]] = []
+    for update in updates:
+        try:
+            curriculum_content = apply_single_update(curriculum_content, update)
+            errors.append(None)
+        except ValueError as e:
+            errors.append(e)
+    return curriculum_content, errors
+
+
+def _plan_batch_inserts(
+    curriculum_content: str,
+    updates: list[CurriculumUpdate],
+) -> Optional[tuple[list[tuple[int, int, str]], list[Optional[ValueError]]]]:
+    """Insertion points ``(pos, seq, block)`` in original coordinates.
+
+    Returns None when the batch has to be applied sequentially.
+    """
+    # A bare "#" line could combine with inserted text into a header
+    if _BARE_HEADER_RE.search(curriculum_content):
+        return None
+    for update in updates:
+        if update.action == "replace" and update.week > 0:
+            return None
+        # Checked on the inserted block: content may start with "---" or "#"
+        update_block = f"\n\n{update.content}\n"
+        if "\n---" in update_block or _LINE_START_HASH_RE.search(update_block):
+            return None
+        if "\n" in update.section:
+            return None
+
+    outline = get_outline(curriculum_content)
+    end = len(curriculum_content)
+    inserts: list[tuple[int, int, str]] = []
+    errors: list[Optional[ValueError]] = []
+    appendix_seen = False
+    for seq, update in enumerate(updates):
+        update_block = f"\n\n{update.content}\n"
+        errors.append(None)
+
+        if update.action == "append" and update.week > 0:
+            week = outline.week(update.week)
+            if week is None:
+                inserts.append((end, seq, update_block))
+                continue
+            next_boundary = outline.week_boundary(update.week, week.body)
+            if next_boundary == end and appendix_seen:
+                return None  # The appendix's header/separator would bound it
+            sep_pos = outline.last_separator(week.start, next_boundary)
+            insert_pos = sep_pos if sep_pos != -1 else next_boundary
+            inserts.append((insert_pos, seq, update_block))
+
+        elif update.action == "new" or update.week == 0:
+            appendix_block = f"\n\n---\n\n### Appendix: {update.section}\n\n{update.content}\n"
+            inserts.append((end, seq, appendix_block))
+            appendix_seen = True
+
+        else:
+            errors[-1] = ValueError(
+                f"Invalid action '{update.action}'. Use 'append', 'replace', or 'new'."
+            )
+
+    return inserts, errors
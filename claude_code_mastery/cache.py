@@ -1,9 +1,20 @@
-"""Local cache for tracking seen updates and curriculum state."""
+"""Local cache for tracking seen updates and curriculum state.
+
+Seen/applied update tracking lives in a SQLite database (WAL mode) so each
+mark is a single indexed insert rather than a rewrite of the whole file.
+An existing ``update_cache.json`` is imported on first use.
+
+Seen keys carry a ``seen_at`` timestamp that is refreshed whenever the key
+is marked again, so eviction (size cap and TTL) always drops the entries
+that have gone longest without appearing in a feed.
+"""
 
 import json
 import logging
 import shutil
-from datetime import datetime, timezone
+import sqlite3
+import threading
+from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -11,15 +22,59 @@ logger = logging.getLogger(__name__)
 
 
 DEFAULT_CACHE_DIR = Path.home() / ".claude-code-mastery"
-CACHE_FILE = "update_cache.json"
+CACHE_FILE = "update_cache.json"  # Legacy JSON store, migrated into CACHE_DB_FILE
+CACHE_DB_FILE = "update_cache.db"
 CURRICULUM_STATE_FILE = "curriculum_state.json"
 MAX_SEEN_UPDATES = 500
-
-# In-memory singletons — avoids repeated disk reads
-_cache_instance: Optional[dict] = None
+SEEN_TTL_DAYS = 180  # Keys not re-seen for this long are forgotten
+MAX_GAP_MEMO_ROWS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    key     TEXT PRIMARY KEY,
+    seen_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS applied (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    key        TEXT NOT NULL,
+    details    TEXT NOT NULL,
+    applied_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS seen_by_time ON seen (seen_at);
+CREATE TABLE IF NOT EXISTS gap_memo (
+    curriculum  TEXT NOT NULL,
+    update_hash TEXT NOT NULL,
+    result      TEXT NOT NULL,
+    PRIMARY KEY (curriculum, update_hash)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    source     TEXT PRIMARY KEY,
+    last_date  TEXT NOT NULL,
+    last_id    TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- Row count kept by triggers so size eviction never has to COUNT(*)
+INSERT OR IGNORE INTO meta (name, value) VALUES ('seen_count', (SELECT COUNT(*) FROM seen));
+CREATE TRIGGER IF NOT EXISTS seen_count_insert AFTER INSERT ON seen BEGIN
+    UPDATE meta SET value = value + 1 WHERE name = 'seen_count';
+END;
+CREATE TRIGGER IF NOT EXISTS seen_count_delete AFTER DELETE ON seen BEGIN
+    UPDATE meta SET value = value - 1 WHERE name = 'seen_count';
+END;
+"""
+
+# In-memory singletons — avoids repeated disk reads / reconnects
+_db: Optional[sqlite3.Connection] = None
+_db_path: Optional[Path] = None
+_db_thread: Optional[int] = None  # Thread that opened _db; others use _thread_db
+_thread_db = threading.local()
+_db_ready: set[Path] = set()  # Database files whose schema/migration has run
 _state_instance: Optional[dict] = None
-# Tracks insertion order so we can trim oldest entries
-_seen_order: list[str] = []
 
 
 def get_cache_dir() -> Path:
@@ -29,89 +84,267 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
-def load_cache() -> dict:
-    """Load the update cache from disk (once per session, then in-memory)."""
-    global _cache_instance, _seen_order
-    if _cache_instance is not None:
-        return _cache_instance
+def _now() -> str:
+    # Fixed-width (always with microseconds) so timestamps sort as strings
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
 
-    cache_file = get_cache_dir() / CACHE_FILE
-    if cache_file.exists():
-        try:
-            data = json.loads(cache_file.read_text(encoding="utf-8"))
-            seen_list = data.get("seen_updates", [])
-            data["seen_updates"] = set(seen_list)
-            # Preserve disk order as our best approximation of insertion order
-            _seen_order = list(seen_list)
-            _cache_instance = data
-            return _cache_instance
-        except Exception as e:
-            logger.warning("Failed to load cache from %s: %s", cache_file, e)
 
-    _seen_order = []
-    _cache_instance = {"seen_updates": set(), "last_check": None, "applied_updates": []}
-    return _cache_instance
+def get_db() -> sqlite3.Connection:
+    """Return this thread's cache database connection, opening it on first use.
+
+    Callers open explicit transactions (``BEGIN``), so a connection must
+    never be shared between threads: work handed to ``asyncio.to_thread``
+    would otherwise run inside — or commit — a transaction the event loop
+    thread has open.  The first thread to use the cache owns ``_db``; every
+    other thread gets its own connection to the same WAL database.
+    """
+    global _db, _db_path, _db_thread
+    path = get_cache_dir() / CACHE_DB_FILE
+    thread = threading.get_ident()
+    if _db is None or _db_thread == thread:
+        if _db is not None and _db_path == path:
+            return _db
+        if _db is not None:
+            _db.close()
+        _db, _db_path, _db_thread = _connect(path), path, thread
+        return _db
+
+    conn = getattr(_thread_db, "conn", None)
+    if conn is not None and _thread_db.path == path:
+        return conn
+    if conn is not None:
+        conn.close()
+    _thread_db.conn, _thread_db.path = _connect(path), path
+    return _thread_db.conn
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if path not in _db_ready:
+        conn.execute("PRAGMA journal_mode=WAL")  # Persistent: set once per file
+        conn.executescript(_SCHEMA)
+        _migrate_json_cache(conn)
+        _db_ready.add(path)
+    return conn
+
+
+def _migrate_json_cache(conn: sqlite3.Connection) -> None:
+    """Import a legacy ``update_cache.json`` once, then rename it aside."""
+    json_file = get_cache_dir() / CACHE_FILE
+    if not json_file.exists():
+        return
+    try:
+        data = json.loads(json_file.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning("Failed to read legacy cache %s: %s", json_file, e)
+        return
+
+    migrated_at = _now()
+    with conn:
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT OR IGNORE INTO seen (key, seen_at) VALUES (?, ?)",
+            [(key, migrated_at) for key in data.get("seen_updates", [])],
+        )
+        conn.executemany(
+            "INSERT INTO applied (key, details, applied_at) VALUES (?, ?, ?)",
+            [
+                (a.get("key", ""), a.get("details", ""), a.get("applied_at", migrated_at))
+                for a in data.get("applied_updates", [])
+            ],
+        )
+        if data.get("last_check"):
+            _set_meta(conn, "last_check", data["last_check"])
+    json_file.rename(json_file.with_name(CACHE_FILE + ".migrated"))
+    logger.info("Migrated %s into %s", CACHE_FILE, CACHE_DB_FILE)
+
+
+def _set_meta(conn: sqlite3.Connection, name: str, value: Optional[str]) -> None:
+    conn.execute(
+        "INSERT INTO meta (name, value) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+        (name, value),
+    )
+
 
+def load_cache() -> dict:
+    """Return a snapshot of the update cache as a plain dict.
 
-def save_cache(cache: dict) -> None:
-    """Save the update cache to disk."""
-    global _cache_instance
-    _cache_instance = cache
-    cache_file = get_cache_dir() / CACHE_FILE
-    # Convert set to sorted list for JSON serialization
-    serializable = {
-        **cache,
-        "seen_updates": sorted(cache["seen_updates"]),
+    Kept for callers of the old JSON store; prefer the targeted helpers
+    (``is_update_seen``, ``get_applied_updates`` …) which do not load
+    everything.
+    """
+    conn = get_db()
+    return {
+        "seen_updates": {row[0] for row in conn.execute("SELECT key FROM seen")},
+        "last_check": get_last_check_time(),
+        "applied_updates": get_applied_updates(),
     }
-    cache_file.write_text(json.dumps(serializable, indent=2), encoding="utf-8")
+
+
+def save_cache(cache: dict) -> None:
+    """Write a ``load_cache()``-style dict back to the database.
+
+    Seen keys are replaced by ``cache["seen_updates"]``; applied entries
+    beyond those already stored are appended (the table is append-only).
+    """
+    conn = get_db()
+    seen = set(cache.get("seen_updates", ()))
+    now = _now()
+    with conn:
+        conn.execute("BEGIN")
+        stored = {row[0] for row in conn.execute("SELECT key FROM seen")}
+        conn.executemany("DELETE FROM seen WHERE key = ?", [(k,) for k in stored - seen])
+        conn.executemany(
+            "INSERT INTO seen (key, seen_at) VALUES (?, ?)",
+            [(k, now) for k in seen - stored],
+        )
+        applied = cache.get("applied_updates", [])
+        (count,) = conn.execute("SELECT COUNT(*) FROM applied").fetchone()
+        conn.executemany(
+            "INSERT INTO applied (key, details, applied_at) VALUES (?, ?, ?)",
+            [(a.get("key", ""), a.get("details", ""), a.get("applied_at", now)) for a in applied[count:]],
+        )
+        _set_meta(conn, "last_check", cache.get("last_check"))
+        _evict_seen(conn)
 
 
 def mark_update_seen(update_key: str) -> None:
     """Mark an update as seen."""
-    global _seen_order
-    cache = load_cache()
-    if update_key not in cache["seen_updates"]:
-        cache["seen_updates"].add(update_key)
-        _seen_order.append(update_key)
-    cache["last_check"] = datetime.now(timezone.utc).isoformat()
-    _trim_seen(cache)
-    save_cache(cache)
+    mark_updates_seen([update_key])
 
 
 def mark_updates_seen(update_keys: list[str]) -> None:
-    """Mark multiple updates as seen in a single write."""
-    global _seen_order
-    cache = load_cache()
-    for key in update_keys:
-        if key not in cache["seen_updates"]:
-            cache["seen_updates"].add(key)
-            _seen_order.append(key)
-    cache["last_check"] = datetime.now(timezone.utc).isoformat()
-    _trim_seen(cache)
-    save_cache(cache)
+    """Mark multiple updates as seen in a single transaction.
+
+    Keys already present are touched (``seen_at`` refreshed) so an update
+    still showing up in feeds is never evicted and re-notified.
+    """
+    conn = get_db()
+    now = _now()
+    with conn:
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO seen (key, seen_at) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET seen_at = excluded.seen_at",
+            [(key, now) for key in update_keys],
+        )
+        _set_meta(conn, "last_check", now)
+        _evict_seen(conn)
 
 
 def mark_update_applied(update_key: str, details: str) -> None:
     """Mark an update as applied to the curriculum."""
-    cache = load_cache()
-    cache["applied_updates"].append({
-        "key": update_key,
-        "details": details,
-        "applied_at": datetime.now(timezone.utc).isoformat(),
-    })
-    save_cache(cache)
+    conn = get_db()
+    conn.execute(
+        "INSERT INTO applied (key, details, applied_at) VALUES (?, ?, ?)",
+        (update_key, details, _now()),
+    )
+
+
+def get_applied_updates(limit: Optional[int] = None) -> list[dict]:
+    """Applied updates, oldest first; ``limit`` returns only the newest N."""
+    conn = get_db()
+    if limit is None:
+        rows = conn.execute("SELECT key, details, applied_at FROM applied ORDER BY id").fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT key, details, applied_at FROM applied ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()[::-1]
+    return [{"key": k, "details": d, "applied_at": at} for k, d, at in rows]
+
+
+def count_applied_updates() -> int:
+    """Number of updates applied so far."""
+    (count,) = get_db().execute("SELECT COUNT(*) FROM applied").fetchone()
+    return count
+
+
+def count_seen_updates() -> int:
+    """Number of update keys currently tracked as seen."""
+    return _seen_count(get_db())
+
+
+def _seen_count(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM meta WHERE name = 'seen_count'").fetchone()
+    return int(row[0]) if row else 0
 
 
 def is_update_seen(update_key: str) -> bool:
-    """Check if an update has already been seen (O(1) set lookup)."""
-    cache = load_cache()
-    return update_key in cache["seen_updates"]
+    """Check if an update has already been seen (primary-key lookup)."""
+    row = get_db().execute("SELECT 1 FROM seen WHERE key = ?", (update_key,)).fetchone()
+    return row is not None
 
 
 def get_last_check_time() -> Optional[str]:
     """Get the timestamp of the last update check."""
-    cache = load_cache()
-    return cache.get("last_check")
+    row = get_db().execute("SELECT value FROM meta WHERE name = 'last_check'").fetchone()
+    return row[0] if row else None
+
+
+def load_gap_results(curriculum_fingerprint: str, update_hashes: list[str]) -> dict[str, dict]:
+    """Stored per-update analysis results for this curriculum version.
+
+    Returns ``{update_hash: result}`` for the hashes that have one.
+    """
+    conn = get_db()
+    results: dict[str, dict] = {}
+    # Stay well under SQLite's bound-parameter limit
+    for start in range(0, len(update_hashes), 500):
+        chunk = update_hashes[start:start + 500]
+        rows = conn.execute(
+            f"SELECT update_hash, result FROM gap_memo WHERE curriculum = ? "
+            f"AND update_hash IN ({','.join('?' * len(chunk))})",
+            (curriculum_fingerprint, *chunk),
+        )
+        for update_hash, result in rows:
+            results[update_hash] = json.loads(result)
+    return results
+
+
+def store_gap_results(curriculum_fingerprint: str, results: dict[str, dict]) -> None:
+    """Store per-update analysis results.
+
+    Results for any other curriculum version are dropped — they can never
+    be reused once the curriculum has changed.
+    """
+    conn = get_db()
+    with conn:
+        conn.execute("BEGIN")
+        conn.execute("DELETE FROM gap_memo WHERE curriculum != ?", (curriculum_fingerprint,))
+        conn.executemany(
+            "INSERT OR REPLACE INTO gap_memo (curriculum, update_hash, result) VALUES (?, ?, ?)",
+            [(curriculum_fingerprint, h, json.dumps(r)) for h, r in results.items()],
+        )
+        conn.execute(
+            "DELETE FROM gap_memo WHERE rowid IN (SELECT rowid FROM gap_memo "
+            "ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+            (MAX_GAP_MEMO_ROWS,),
+        )
+
+
+def load_watermarks() -> dict[str, dict]:
+    """Stored per-source high-water marks: ``{source: {"date", "last_id"}}``."""
+    rows = get_db().execute("SELECT source, last_date, last_id FROM watermarks")
+    return {source: {"date": date, "last_id": last_id} for source, date, last_id in rows}
+
+
+def store_watermarks(marks: dict[str, dict]) -> None:
+    """Replace the high-water marks of the given sources."""
+    conn = get_db()
+    now = _now()
+    with conn:
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT OR REPLACE INTO watermarks (source, last_date, last_id, updated_at) VALUES (?, ?, ?, ?)",
+            [(source, m["date"], m["last_id"], now) for source, m in marks.items()],
+        )
+
+
+def clear_watermarks() -> None:
+    """Forget every watermark, so the next incremental run reads full windows."""
+    get_db().execute("DELETE FROM watermarks")
 
 
 def get_update_key(source: str, title: str) -> str:
@@ -188,12 +421,39 @@ def create_curriculum_backup(curriculum_path: str) -> Optional[str]:
         return None
 
 
-def _trim_seen(cache: dict) -> None:
-    """Trim seen_updates to MAX_SEEN_UPDATES, dropping the oldest entries."""
-    global _seen_order
-    if len(cache["seen_updates"]) > MAX_SEEN_UPDATES:
-        # Keep the most recently added keys
-        keep = set(_seen_order[-MAX_SEEN_UPDATES:])
-        cache["seen_updates"] = cache["seen_updates"] & keep
-        _seen_order = [k for k in _seen_order if k in cache["seen_updates"]]
-        logger.info("Trimmed seen_updates from %d to %d", len(cache["seen_updates"]) + (MAX_SEEN_UPDATES - len(keep)), len(cache["seen_updates"]))
+def evict_seen(max_entries: Optional[int] = None, ttl_days: Optional[float] = None) -> int:
+    """Evict expired and excess seen keys, oldest ``seen_at`` first.
+
+    Defaults to ``MAX_SEEN_UPDATES`` / ``SEEN_TTL_DAYS``.  Returns the
+    number of keys removed.
+    """
+    conn = get_db()
+    with conn:
+        conn.execute("BEGIN")
+        return _evict_seen(conn, max_entries, ttl_days)
+
+
+def _evict_seen(
+    conn: sqlite3.Connection,
+    max_entries: Optional[int] = None,
+    ttl_days: Optional[float] = None,
+) -> int:
+    """Both passes walk the ``seen_at`` index, so cost is O(evicted)."""
+    max_entries = MAX_SEEN_UPDATES if max_entries is None else max_entries
+    ttl_days = SEEN_TTL_DAYS if ttl_days is None else ttl_days
+
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=ttl_days)).isoformat(timespec="microseconds")
+    expired = conn.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,)).rowcount
+
+    excess = _seen_count(conn) - max_entries
+    evicted = 0
+    if excess > 0:
+        evicted = conn.execute(
+            "DELETE FROM seen WHERE rowid IN "
+            "(SELECT rowid FROM seen ORDER BY seen_at, rowid LIMIT ?)",
+            (excess,),
+        ).rowcount
+
+    if expired or evicted:
+        logger.info("Evicted %d expired and %d excess seen update(s)", expired, evicted)
+    return expired + evicted
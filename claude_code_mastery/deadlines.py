@@ -0,0 +1,135 @@
+"""Deadlines, a shared time budget and hedged requests for source fetches.
+
+``fetch_all_updates`` fans out to nine sources whose fetchers each carry a
+10–15 s httpx timeout, and scrapers can hang well past that (slow TLS,
+trickling bodies).  Without an overall limit one bad source stalls the
+whole MCP tool call.  ``run_source`` bounds each source by a soft
+per-source deadline and by what is left of the run's ``FetchBudget``; a
+source that misses either raises ``TimeoutError`` (the caller records it
+and keeps every other source's results).
+
+Known-flaky sources can be *hedged*: if the first request has not answered
+by the source's usual p90 latency (learned in-process by
+``LatencyTracker``), a second identical request is started and whichever
+first finishes without raising wins.  A hedged fetcher must therefore
+raise on failure rather than return an empty result, or a fast failure
+would beat a working hedge; only successful attempts are recorded as
+latency samples.  Hedging needs a few latency samples before it kicks
+in, so a cold process never doubles its traffic.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+FETCH_BUDGET = 45.0  # Seconds for a whole fetch_all_updates run
+SOURCE_DEADLINE = 20.0  # Seconds any one source (or its fallback) may take
+HEDGE_PERCENTILE = 0.9
+HEDGE_MIN_SAMPLES = 5
+LATENCY_WINDOW = 50  # Samples kept per source
+
+
+class LatencyTracker:
+    """Recent successful-request latencies per source."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, source: str, seconds: float) -> None:
+        self._samples[source].append(seconds)
+
+    def percentile(self, source: str, q: float) -> Optional[float]:
+        """The ``q`` quantile (nearest rank) of ``source``'s latencies, if any."""
+        samples = sorted(self._samples.get(source, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def hedge_delay(self, source: str) -> Optional[float]:
+        """When to send a hedge request, or None until enough samples exist."""
+        if len(self._samples.get(source, ())) < HEDGE_MIN_SAMPLES:
+            return None
+        return self.percentile(source, HEDGE_PERCENTILE)
+
+
+_latencies = LatencyTracker()
+
+
+class FetchBudget:
+    """A deadline shared by every source in one fetch run."""
+
+    def __init__(self, seconds: float = FETCH_BUDGET):
+        self.seconds = seconds
+        self._deadline = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self._deadline - time.monotonic())
+
+
+async def run_source(
+    name: str,
+    fetch: Callable[[], Awaitable[Any]],
+    budget: FetchBudget,
+    deadline: float = SOURCE_DEADLINE,
+    hedge: bool = False,
+    latencies: Optional[LatencyTracker] = None,
+) -> Any:
+    """Run ``fetch()`` within ``deadline`` and the remaining ``budget``.
+
+    ``fetch`` is a factory so a hedge can issue a second request.  Raises
+    ``TimeoutError`` naming which limit was hit.
+    """
+    latencies = latencies or _latencies
+    remaining = budget.remaining()
+    if remaining <= 0:
+        raise TimeoutError(f"fetch budget of {budget.seconds:g}s exhausted before start")
+    timeout = min(deadline, remaining)
+
+    hedge_delay = latencies.hedge_delay(name) if hedge else None
+    attempt = _hedged(name, fetch, hedge_delay, latencies) if hedge_delay is not None \
+        else _timed(name, fetch, latencies)
+    try:
+        return await asyncio.wait_for(attempt, timeout)
+    except asyncio.TimeoutError:
+        limit = "fetch budget" if remaining < deadline else "source deadline"
+        raise TimeoutError(f"no result within {timeout:.1f}s ({limit})") from None
+
+
+async def _timed(name: str, fetch: Callable[[], Awaitable[Any]], latencies: LatencyTracker) -> Any:
+    """Await ``fetch()``, recording its latency only if it succeeds."""
+    start = time.monotonic()
+    result = await fetch()
+    latencies.record(name, time.monotonic() - start)
+    return result
+
+
+async def _hedged(
+    name: str,
+    fetch: Callable[[], Awaitable[Any]],
+    delay: float,
+    latencies: LatencyTracker,
+) -> Any:
+    """First successful result of ``fetch()``, re-issued once after ``delay``."""
+    tasks = [asyncio.ensure_future(_timed(name, fetch, latencies))]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            logger.info("Hedging '%s': no response after %.2fs", name, delay)
+            tasks.append(asyncio.ensure_future(_timed(name, fetch, latencies)))
+
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
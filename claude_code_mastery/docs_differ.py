@@ -4,27 +4,70 @@ Snapshots the Claude Code documentation tree and detects changes between
 runs. This catches every docs change — not just what gets announced on the
 blog — by comparing the actual page content paragraph by paragraph.
 
-Storage: ~/.claude-code-mastery/docs_snapshots/
+Storage: ~/.claude-code-mastery/docs_snapshots/ — a content-addressed
+store.  Section bodies live once under ``objects/`` keyed by
+``_section_hash``; each snapshot is a small manifest of page → heading →
+hash under ``manifests/``; ``refs.json`` names the ``latest`` and
+``previous`` manifests.  Unchanged sections cost nothing to keep, so the
+full history is retained and any two snapshots can be diffed offline.
 """
 
+import asyncio
 import hashlib
+import importlib.util
 import json
 import logging
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
 
 import httpx
 from bs4 import BeautifulSoup
 
 from .sources import Update, HEADERS
 from .cache import get_cache_dir
+from .http_cache import cached_get
+from .http_client import borrow_client
+from .keywords import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
 SNAPSHOT_DIR_NAME = "docs_snapshots"
 DOCS_BASE_URL = "https://docs.anthropic.com/en/docs/claude-code"
+DOCS_FETCH_TIMEOUT = 20.0
+DOCS_CRAWL_CONCURRENCY = 8   # pages in flight per wave
+DOCS_PER_HOST_LIMIT = 4      # politeness cap on concurrent requests to one host
+MAX_SNAPSHOT_HISTORY = 180   # manifests kept by prune_snapshots (≈6 months of daily runs)
+
+OBJECTS_DIR_NAME = "objects"
+MANIFESTS_DIR_NAME = "manifests"
+REFS_FILE = "refs.json"
+
+# BeautifulSoup tree builder: lxml's C parser when installed, else the stdlib one
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Keyword → tag, checked in this order by _extract_diff_tags
+DIFF_TAG_MAP = {
+    "hook": "hooks",
+    "mcp": "mcp",
+    "skill": "skills",
+    "agent": "agents",
+    "permission": "permissions",
+    "subagent": "subagents",
+    "memory": "memory",
+    "cli": "cli",
+    "sdk": "sdk",
+    "settings": "settings",
+    "ide": "ide",
+    "security": "security",
+}
+_DIFF_TAG_MATCHER = KeywordMatcher(DIFF_TAG_MAP)
+
+_HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4"))
+_TEXT_TAGS = frozenset(("p", "li", "code", "pre", "td"))
 
 # Pages to crawl (relative to base).  We discover more dynamically.
 SEED_PATHS = [
@@ -55,58 +98,143 @@ def _snapshot_dir() -> Path:
     return d
 
 
-def _snapshot_path(label: str = "latest") -> Path:
+def _legacy_snapshot_path(label: str) -> Path:
+    """Whole-snapshot JSON file written before the content-addressed store."""
     return _snapshot_dir() / f"docs_{label}.json"
 
 
+def _store_dir(name: str) -> Path:
+    d = _snapshot_dir() / name
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def _section_hash(text: str) -> str:
     """Hash a normalised text block for comparison."""
     normalised = re.sub(r"\s+", " ", text.strip().lower())
     return hashlib.sha256(normalised.encode()).hexdigest()[:16]
 
 
-async def _fetch_page(client: httpx.AsyncClient, url: str) -> Optional[str]:
-    """Fetch a single docs page, return HTML or None."""
+def _page_fingerprint(sections: dict) -> str:
+    """Roll up a page's section hashes (Merkle node over sorted headings)."""
+    digest = hashlib.sha256()
+    for heading in sorted(sections):
+        digest.update(f"{heading}\0{sections[heading]['hash']}\0".encode())
+    return digest.hexdigest()[:16]
+
+
+def _snapshot_fingerprint(pages: dict) -> str:
+    """Roll up page fingerprints into a root hash for the whole snapshot."""
+    digest = hashlib.sha256()
+    for url in sorted(pages):
+        digest.update(f"{url}\0{_fingerprint_of(pages[url])}\0".encode())
+    return digest.hexdigest()[:16]
+
+
+def _fingerprint_of(page: dict) -> str:
+    return page.get("fingerprint") or _page_fingerprint(page.get("sections", {}))
+
+
+def _root_of(snapshot: dict) -> str:
+    return snapshot.get("root") or _snapshot_fingerprint(snapshot.get("pages", {}))
+
+
+def _parse_page(html: str) -> dict:
+    """Parse a docs page into its sections and outgoing docs links."""
+    sections, links = _process_page(html)
+    return {"sections": sections, "links": links}
+
+
+async def _fetch_page(client: httpx.AsyncClient, url: str) -> Optional[dict]:
+    """Fetch and parse a single docs page, return ``_parse_page`` output or None.
+
+    Goes through the conditional-GET cache, so an unchanged page is neither
+    re-downloaded nor re-parsed.
+    """
     try:
-        resp = await client.get(url, headers=HEADERS)
-        if resp.status_code == 200:
-            return resp.text
-        logger.debug("Docs page %s returned %d", url, resp.status_code)
+        return await cached_get(
+            client, url, _parse_page, f"docs-page-v2-{HTML_PARSER}",
+            headers=HEADERS, timeout=DOCS_FETCH_TIMEOUT, offload=True,
+        )
+    except httpx.HTTPStatusError as e:
+        logger.debug("Docs page %s returned %d", url, e.response.status_code)
     except httpx.HTTPError as e:
         logger.debug("Failed to fetch %s: %s", url, e)
     return None
 
 
+def _process_page(html: str) -> tuple[dict[str, str], list[str]]:
+    """Parse a docs page once and return ``(sections, links)``.
+
+    Links are collected first, from the whole page (the sidebar is where
+    most of them live); then nav/sidebar/footer are stripped and the
+    remaining main content is split into headed sections.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    links = _links_from_soup(soup)
+    sections = _sections_from_soup(soup)
+    return sections, links
+
+
 def _extract_sections(html: str) -> dict[str, str]:
     """Extract headed sections from a docs page.
 
     Returns {section_title: section_text} where title is the nearest
     heading and text is the content until the next heading.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    return _sections_from_soup(BeautifulSoup(html, HTML_PARSER))
+
 
+def _discover_links(html: str) -> list[str]:
+    """Find links to other Claude Code docs pages."""
+    return _links_from_soup(BeautifulSoup(html, HTML_PARSER))
+
+
+def _sections_from_soup(soup: BeautifulSoup) -> dict[str, str]:
     # Remove nav, sidebar, footer — keep only article / main content
     for tag in soup.select("nav, header, footer, .sidebar, .navigation, script, style"):
         tag.decompose()
 
     main = soup.select_one("main, article, .docs-content, [role='main']") or soup
+    return _walk_sections(main)
+
 
+def _walk_sections(main) -> dict[str, str]:
+    """Split the content under ``main`` into {heading: text} sections.
+
+    Iterative pre-order walk.  A text block's text is taken once and its
+    subtree is not entered, so nested blocks (a ``<code>`` in an ``<li>`` in
+    a ``<td>``) are neither re-extracted nor duplicated — linear in page size.
+    """
     sections: dict[str, str] = {}
     current_heading = "__intro__"
     current_parts: list[str] = []
 
-    for el in main.descendants:
-        if el.name in ("h1", "h2", "h3", "h4"):
+    stack = list(reversed(main.contents))
+    while stack:
+        el = stack.pop()
+        name = el.name
+        if name is None:
+            continue  # Bare strings outside a text block are not content
+        if name in _HEADING_TAGS:
             # Save previous section
             text = " ".join(current_parts).strip()
             if text:
                 sections[current_heading] = text
             current_heading = el.get_text(strip=True)
             current_parts = []
-        elif el.name in ("p", "li", "code", "pre", "td"):
+        elif name in _TEXT_TAGS:
             t = el.get_text(strip=True)
             if t:
                 current_parts.append(t)
+        else:
+            stack.extend(reversed(el.contents))
 
     # Save last section
     text = " ".join(current_parts).strip()
@@ -116,9 +244,7 @@ def _extract_sections(html: str) -> dict[str, str]:
     return sections
 
 
-def _discover_links(html: str) -> list[str]:
-    """Find links to other Claude Code docs pages."""
-    soup = BeautifulSoup(html, "html.parser")
+def _links_from_soup(soup: BeautifulSoup) -> list[str]:
     links: list[str] = []
     for a in soup.select("a[href*='/docs/claude-code']"):
         href = a.get("href", "")
@@ -128,12 +254,24 @@ def _discover_links(html: str) -> list[str]:
             if path.startswith("/"):
                 path = f"https://docs.anthropic.com{path}"
             links.append(path)
-    return list(set(links))
+    return sorted(set(links))
 
 
-async def snapshot_docs() -> dict:
+async def snapshot_docs(
+    client: Optional[httpx.AsyncClient] = None,
+    concurrency: int = DOCS_CRAWL_CONCURRENCY,
+    per_host: int = DOCS_PER_HOST_LIMIT,
+) -> dict:
     """Crawl all Claude Code docs pages and return a snapshot dict.
 
+    Pass a pooled ``client`` (e.g. the one used by ``fetch_all_updates``)
+    to reuse its connections; otherwise a temporary one is opened.
+
+    Each wave is fetched concurrently — at most ``concurrency`` pages in
+    flight and ``per_host`` per host — with parsing done off the event
+    loop.  Results are merged in sorted URL order, so the snapshot does not
+    depend on which request finishes first.
+
     Snapshot structure::
 
         {
@@ -143,10 +281,12 @@ async def snapshot_docs() -> dict:
                     "sections": {
                         "<heading>": {"text": "...", "hash": "..."},
                         ...
-                    }
+                    },
+                    "fingerprint": "<hash over the page's section hashes>",
                 },
                 ...
-            }
+            },
+            "root": "<hash over all page fingerprints>",
         }
     """
     snapshot: dict = {
@@ -161,36 +301,46 @@ async def snapshot_docs() -> dict:
         urls_to_crawl.add(url.rstrip("/"))
 
     crawled: set[str] = set()
+    slots = asyncio.Semaphore(max(1, concurrency))
+    host_slots: dict[str, asyncio.Semaphore] = {}
 
-    async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
+    async def fetch(url: str) -> Optional[dict]:
+        host = urlsplit(url).netloc
+        host_slot = host_slots.setdefault(host, asyncio.Semaphore(max(1, per_host)))
+        async with slots, host_slot:
+            return await _fetch_page(client, url)
+
+    async with borrow_client(client, timeout=DOCS_FETCH_TIMEOUT) as client:
         # Crawl in waves (max 3 waves to avoid infinite loops)
         for wave in range(3):
-            pending = urls_to_crawl - crawled
+            pending = sorted(urls_to_crawl - crawled)
             if not pending:
                 break
             logger.info("Docs crawl wave %d: %d pages", wave + 1, len(pending))
 
-            for url in sorted(pending):
-                html = await _fetch_page(client, url)
-                crawled.add(url)
-                if not html:
+            pages = await asyncio.gather(*(fetch(url) for url in pending))
+            crawled.update(pending)
+
+            for url, page in zip(pending, pages):
+                if not page:
                     continue
 
-                sections = _extract_sections(html)
                 page_data: dict = {"sections": {}}
-                for heading, text in sections.items():
+                for heading, text in page["sections"].items():
                     page_data["sections"][heading] = {
-                        "text": text[:2000],  # Cap for storage
+                        "text": text,
                         "hash": _section_hash(text),
                     }
+                page_data["fingerprint"] = _page_fingerprint(page_data["sections"])
                 snapshot["pages"][url] = page_data
 
                 # Discover new links
-                for link in _discover_links(html):
+                for link in page["links"]:
                     normalised = link.rstrip("/")
                     if normalised not in crawled:
                         urls_to_crawl.add(normalised)
 
+    snapshot["root"] = _snapshot_fingerprint(snapshot["pages"])
     logger.info(
         "Docs snapshot complete: %d pages, %d total sections",
         len(snapshot["pages"]),
@@ -199,25 +349,225 @@ async def snapshot_docs() -> dict:
     return snapshot
 
 
+# --- Content-addressed snapshot store ---
+
+def _object_path(section_hash: str) -> Path:
+    return _store_dir(OBJECTS_DIR_NAME) / section_hash[:2] / f"{section_hash}.txt"
+
+
+def _partial_marker(section_hash: str) -> Path:
+    return _object_path(section_hash).with_suffix(".partial")
+
+
+def _put_object(section_hash: str, text: str, partial: bool = False) -> None:
+    """Store ``text`` under ``section_hash`` unless already present.
+
+    ``partial`` bodies (legacy snapshots kept only the first 2000
+    characters under the full text's hash) are flagged with a marker, so
+    the first complete body stored under that hash replaces them.
+    """
+    path = _object_path(section_hash)
+    marker = _partial_marker(section_hash)
+    if path.exists() and (partial or not marker.exists()):
+        return  # Content-addressed: same hash, same body
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if partial:
+        marker.touch()
+    _atomic_write(path, text)
+    if not partial:
+        marker.unlink(missing_ok=True)
+
+
+def _get_object(section_hash: str) -> str:
+    try:
+        return _object_path(section_hash).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        logger.warning("Docs snapshot object %s is missing", section_hash)
+        return ""
+
+
+def _manifest_path(snapshot_id: str) -> Path:
+    return _store_dir(MANIFESTS_DIR_NAME) / f"{snapshot_id}.json"
+
+
+def _read_refs() -> dict[str, str]:
+    path = _snapshot_dir() / REFS_FILE
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning("Failed to read snapshot refs %s: %s", path, e)
+        return {}
+
+
+def set_snapshot_ref(label: str, snapshot_id: str) -> None:
+    """Point ``label`` (e.g. ``latest``) at a stored snapshot."""
+    refs = _read_refs()
+    refs[label] = snapshot_id
+    _atomic_write(_snapshot_dir() / REFS_FILE, json.dumps(refs, indent=2, sort_keys=True))
+
+
+def _snapshot_id(timestamp: str, manifest_json: str) -> str:
+    """Sortable id: compact UTC timestamp plus a short manifest digest."""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        dt = datetime.now(timezone.utc)
+    stamp = dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return f"{stamp}-{hashlib.sha256(manifest_json.encode()).hexdigest()[:8]}"
+
+
 def save_snapshot(snapshot: dict, label: str = "latest") -> Path:
-    """Persist a snapshot to disk."""
-    path = _snapshot_path(label)
-    path.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
-    logger.info("Saved docs snapshot to %s", path)
+    """Persist a snapshot to the store and point ``label`` at it.
+
+    Section bodies go to the object store (skipped when already present);
+    the manifest only records page → heading → hash.
+    """
+    manifest: dict = {
+        "timestamp": snapshot.get("timestamp", ""),
+        "root": _root_of(snapshot),
+        "pages": {},
+    }
+    for url, page in snapshot.get("pages", {}).items():
+        sections: dict[str, str] = {}
+        for heading, sec in page.get("sections", {}).items():
+            _put_object(sec["hash"], sec.get("text", ""), sec.get("truncated", False))
+            sections[heading] = sec["hash"]
+        manifest["pages"][url] = {"sections": sections, "fingerprint": _fingerprint_of(page)}
+
+    manifest_json = json.dumps(manifest, sort_keys=True)
+    snapshot_id = _snapshot_id(manifest["timestamp"], manifest_json)
+    path = _manifest_path(snapshot_id)
+    if not path.exists():
+        _atomic_write(path, manifest_json)
+    set_snapshot_ref(label, snapshot_id)
+    snapshot["id"] = snapshot_id
+    logger.info("Saved docs snapshot %s as %s", snapshot_id, label)
     return path
 
 
-def load_snapshot(label: str = "latest") -> Optional[dict]:
-    """Load a saved snapshot from disk."""
-    path = _snapshot_path(label)
-    if not path.exists():
+def list_snapshots() -> list[dict]:
+    """List stored snapshots, oldest first.
+
+    Each entry: ``{"id", "timestamp", "labels"}``.
+    """
+    labels_by_id: dict[str, list[str]] = {}
+    for label, snapshot_id in _read_refs().items():
+        labels_by_id.setdefault(snapshot_id, []).append(label)
+
+    snapshots = []
+    for path in sorted(_store_dir(MANIFESTS_DIR_NAME).glob("*.json")):
+        snapshot_id = path.stem
+        snapshots.append({
+            "id": snapshot_id,
+            "timestamp": datetime.strptime(snapshot_id.split("-")[0], "%Y%m%dT%H%M%SZ")
+                         .replace(tzinfo=timezone.utc).isoformat(),
+            "labels": sorted(labels_by_id.get(snapshot_id, [])),
+        })
+    return snapshots
+
+
+def _migrate_legacy_snapshots() -> None:
+    """Import ``docs_previous.json`` / ``docs_latest.json`` into the store once."""
+    for label in ("previous", "latest"):
+        path = _legacy_snapshot_path(label)
+        if not path.exists():
+            continue
+        try:
+            legacy = json.loads(path.read_text(encoding="utf-8"))
+            for page in legacy.get("pages", {}).values():
+                for sec in page.get("sections", {}).values():
+                    # Legacy files capped text at 2000 chars but hashed the full section
+                    sec["truncated"] = _section_hash(sec.get("text", "")) != sec["hash"]
+            save_snapshot(legacy, label)
+            path.unlink()
+            logger.info("Migrated legacy docs snapshot %s into the store", path.name)
+        except Exception as e:
+            logger.warning("Failed to migrate legacy snapshot %s: %s", path, e)
+
+
+def _resolve_snapshot(ref: str) -> Optional[str]:
+    """Resolve a label, a snapshot id, or an id prefix (e.g. ``20260101``).
+
+    A prefix resolves to the newest snapshot starting with it, so a date
+    picks the last snapshot taken that day.
+    """
+    refs = _read_refs()
+    if not refs:
+        _migrate_legacy_snapshots()
+        refs = _read_refs()
+    if ref in refs:
+        return refs[ref]
+    if _manifest_path(ref).exists():
+        return ref
+    matches = [s["id"] for s in list_snapshots() if s["id"].startswith(ref)]
+    return matches[-1] if matches else None
+
+
+def load_snapshot(label: str = "latest", with_text: bool = True) -> Optional[dict]:
+    """Load a stored snapshot by label, id or id prefix.
+
+    With ``with_text=False`` only hashes are loaded (enough for
+    ``diff_snapshots``); section bodies are read from the object store
+    otherwise.
+    """
+    snapshot_id = _resolve_snapshot(label)
+    if snapshot_id is None:
         return None
+    path = _manifest_path(snapshot_id)
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        manifest = json.loads(path.read_text(encoding="utf-8"))
     except Exception as e:
         logger.warning("Failed to load snapshot %s: %s", path, e)
         return None
 
+    pages: dict = {}
+    for url, page in manifest.get("pages", {}).items():
+        sections = {}
+        for heading, section_hash in page.get("sections", {}).items():
+            sections[heading] = {"hash": section_hash}
+            if with_text:
+                sections[heading]["text"] = _get_object(section_hash)
+        pages[url] = {
+            "sections": sections,
+            "fingerprint": page.get("fingerprint") or _page_fingerprint(sections),
+        }
+    return {
+        "id": snapshot_id,
+        "timestamp": manifest.get("timestamp", ""),
+        "root": manifest.get("root") or _snapshot_fingerprint(pages),
+        "pages": pages,
+    }
+
+
+def prune_snapshots(keep: int = MAX_SNAPSHOT_HISTORY) -> int:
+    """Drop all but the newest ``keep`` manifests (labelled ones are always
+    kept) and garbage-collect objects no remaining manifest references.
+
+    Returns the number of manifests removed.
+    """
+    snapshots = list_snapshots()
+    older = snapshots[:max(0, len(snapshots) - keep)]
+    removable = [s for s in older if not s["labels"]]
+    for s in removable:
+        _manifest_path(s["id"]).unlink(missing_ok=True)
+    if not removable:
+        return 0
+
+    live: set[str] = set()
+    for path in _store_dir(MANIFESTS_DIR_NAME).glob("*.json"):
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        for page in manifest.get("pages", {}).values():
+            live.update(page.get("sections", {}).values())
+    for obj in _store_dir(OBJECTS_DIR_NAME).glob("*/*.txt"):
+        if obj.stem not in live:
+            obj.unlink()
+            obj.with_suffix(".partial").unlink(missing_ok=True)
+
+    logger.info("Pruned %d old docs snapshot(s)", len(removable))
+    return len(removable)
+
 
 def diff_snapshots(old: dict, new: dict) -> list[dict]:
     """Compare two snapshots and return a list of changes.
@@ -231,14 +581,26 @@ def diff_snapshots(old: dict, new: dict) -> list[dict]:
             "old_text": "..." | None,
             "new_text": "..." | None,
         }
+
+    Uses the Merkle fingerprints: equal root hashes mean no changes at
+    all, and a page whose fingerprint is unchanged is skipped without
+    looking at its sections.  Fingerprints missing from older snapshots
+    are computed on the fly.
     """
     changes: list[dict] = []
+    if _root_of(old) == _root_of(new):
+        return changes
+
     old_pages = old.get("pages", {})
     new_pages = new.get("pages", {})
 
     all_urls = set(old_pages.keys()) | set(new_pages.keys())
 
     for url in sorted(all_urls):
+        if url in old_pages and url in new_pages and \
+                _fingerprint_of(old_pages[url]) == _fingerprint_of(new_pages[url]):
+            continue
+
         old_page = old_pages.get(url, {}).get("sections", {})
         new_page = new_pages.get(url, {}).get("sections", {})
 
@@ -305,29 +667,29 @@ def changes_to_updates(changes: list[dict]) -> list[Update]:
 
 def _extract_diff_tags(title: str, content: str) -> list[str]:
     """Extract tags from a diff change."""
-    combined = f"{title} {content}".lower()
+    hits = _DIFF_TAG_MATCHER.find(f"{title} {content}".lower())
     tags = ["docs-change"]
-    tag_map = {
-        "hook": "hooks",
-        "mcp": "mcp",
-        "skill": "skills",
-        "agent": "agents",
-        "permission": "permissions",
-        "subagent": "subagents",
-        "memory": "memory",
-        "cli": "cli",
-        "sdk": "sdk",
-        "settings": "settings",
-        "ide": "ide",
-        "security": "security",
-    }
-    for keyword, tag in tag_map.items():
-        if keyword in combined and tag not in tags:
+    for keyword, tag in DIFF_TAG_MAP.items():
+        if keyword in hits and tag not in tags:
             tags.append(tag)
     return tags
 
 
-async def run_docs_diff() -> tuple[list[Update], str]:
+def _summarise_changes(changes: list[dict], updates: list[Update]) -> str:
+    added = sum(1 for c in changes if c["type"] == "added")
+    removed = sum(1 for c in changes if c["type"] == "removed")
+    modified = sum(1 for c in changes if c["type"] == "modified")
+
+    return (
+        f"📝 Documentation changes detected:\n"
+        f"- {added} section(s) added\n"
+        f"- {modified} section(s) modified\n"
+        f"- {removed} section(s) removed\n"
+        f"- {len(updates)} update(s) generated for analysis"
+    )
+
+
+async def run_docs_diff(client: Optional[httpx.AsyncClient] = None) -> tuple[list[Update], str]:
     """Main entry point: snapshot docs, diff against previous, return updates.
 
     Returns:
@@ -337,7 +699,7 @@ async def run_docs_diff() -> tuple[list[Update], str]:
     old_snapshot = load_snapshot("latest")
 
     # Take new snapshot
-    new_snapshot = await snapshot_docs()
+    new_snapshot = await snapshot_docs(client)
 
     if old_snapshot is None:
         # First run — save baseline, no diffs yet
@@ -357,24 +719,43 @@ async def run_docs_diff() -> tuple[list[Update], str]:
     changes = diff_snapshots(old_snapshot, new_snapshot)
 
     # Rotate: current latest → previous, new → latest
-    save_snapshot(old_snapshot, "previous")
+    set_snapshot_ref("previous", old_snapshot["id"])
     save_snapshot(new_snapshot, "latest")
+    prune_snapshots()
 
     if not changes:
         return [], "✅ No documentation changes detected since last snapshot."
 
     updates = changes_to_updates(changes)
+    return updates, _summarise_changes(changes, updates)
 
-    added = sum(1 for c in changes if c["type"] == "added")
-    removed = sum(1 for c in changes if c["type"] == "removed")
-    modified = sum(1 for c in changes if c["type"] == "modified")
 
-    summary = (
-        f"📝 Documentation changes detected:\n"
-        f"- {added} section(s) added\n"
-        f"- {modified} section(s) modified\n"
-        f"- {removed} section(s) removed\n"
-        f"- {len(updates)} update(s) generated for analysis"
-    )
+def compare_snapshots(since: str, until: str = "latest") -> tuple[list[Update], str]:
+    """Diff two stored snapshots without crawling.
+
+    ``since`` / ``until`` are labels, snapshot ids, or id prefixes such as a
+    date (``20260101``).  Only changed sections have their text loaded.
+
+    Returns:
+        (updates, summary_message)
+    """
+    old_snapshot = load_snapshot(since, with_text=False)
+    new_snapshot = load_snapshot(until, with_text=False)
+    missing = [ref for ref, snap in ((since, old_snapshot), (until, new_snapshot)) if snap is None]
+    if missing:
+        available = ", ".join(s["id"] for s in list_snapshots()[-10:]) or "none"
+        return [], f"❌ Unknown docs snapshot(s): {', '.join(missing)}. Recent snapshots: {available}"
+
+    changes = diff_snapshots(old_snapshot, new_snapshot)
+    if not changes:
+        return [], f"✅ No documentation changes between {old_snapshot['id']} and {new_snapshot['id']}."
 
-    return updates, summary
+    for change in changes:
+        for side, snap in (("old", old_snapshot), ("new", new_snapshot)):
+            section = snap["pages"].get(change["page"], {}).get("sections", {}).get(change["section"])
+            if section is not None:
+                change[f"{side}_text"] = _get_object(section["hash"])
+
+    updates = changes_to_updates(changes)
+    summary = _summarise_changes(changes, updates)
+    return updates, f"{summary}\n- Compared {old_snapshot['id']} → {new_snapshot['id']}"
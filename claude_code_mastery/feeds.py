@@ -0,0 +1,228 @@
+"""Streaming Atom/RSS reader.
+
+The feed fetchers only ever use the first 20–50 entries, and for
+date-sorted feeds only those inside the ``days_back`` window, yet used to
+download the whole body and build a full ``ElementTree`` of it.
+``read_feed`` streams the response (``aiter_bytes``) into an
+``XMLPullParser``, turns each completed entry element into a plain dict,
+detaches it from the tree, and closes the response as soon as the entry
+cap — or, for feeds sorted newest-first, the first entry older than the
+cutoff — is reached.  Memory and bytes read are bounded by what is used,
+not by the feed's size.
+
+Conditional GET goes through ``http_cache.cached_stream``, which stores
+the entries but not the body (it was never fully read).  The stored
+entries remember the cutoff they were read down to; a later request is
+only made conditional — and a ``304`` answered from the store — when those
+entries cover its window.  A wider window re-reads the feed.
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterator, Optional
+
+import httpx
+from bs4 import BeautifulSoup
+
+from .http_cache import ResponseCache, cached_stream
+from .parse_pool import run_parse
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+RSS_ITEM = "item"
+
+
+@dataclass(frozen=True)
+class FeedSpec:
+    """How to read one feed.
+
+    ``extract`` turns a finished entry element into a JSON-serialisable
+    dict.  ``finish`` (optional, module-level so it can run on the parse
+    pool) post-processes the collected dicts — e.g. HTML-to-text of Atom
+    content.  ``entry_date`` marks the feed as sorted newest-first and
+    returns an entry's date; reading stops at the first entry older than
+    the cutoff.  Bump ``parse_key`` when any of these change.
+    """
+    entry_tag: str
+    extract: Callable[[ET.Element], dict]
+    limit: int
+    parse_key: str
+    finish: Optional[Callable[[list[dict]], list[dict]]] = None
+    entry_date: Optional[Callable[[dict], Optional[datetime]]] = None
+
+
+class EntryStream:
+    """Incremental parser yielding each entry dict as its element closes.
+
+    Finished entries are removed from their parent, so the tree held by
+    the parser never grows past one entry.
+    """
+
+    def __init__(self, spec: FeedSpec):
+        self.spec = spec
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: list[ET.Element] = []
+
+    def feed(self, data: bytes | str) -> Iterator[dict]:
+        self._parser.feed(data)
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            if element.tag == self.spec.entry_tag:
+                entry = self.spec.extract(element)
+                if self._stack:
+                    self._stack[-1].remove(element)
+                yield entry
+
+
+class _Collector:
+    """Applies the entry cap and date cutoff to a stream of entries."""
+
+    def __init__(self, spec: FeedSpec, cutoff: Optional[datetime]):
+        self.spec = spec
+        self.cutoff = cutoff
+        self.entries: list[dict] = []
+        self.stopped_at_cutoff = False
+
+    def add(self, entry: dict) -> bool:
+        """Keep ``entry`` if wanted; False once no further entries are."""
+        if self.cutoff is not None and self.spec.entry_date is not None:
+            date = self.spec.entry_date(entry)
+            if date is not None and date < self.cutoff:
+                self.stopped_at_cutoff = True
+                return False
+        self.entries.append(entry)
+        return len(self.entries) < self.spec.limit
+
+    def result(self) -> dict:
+        """Stored form: the entries and the cutoff they are complete down to."""
+        return {
+            "entries": self.entries,
+            "cutoff": self.cutoff.isoformat() if self.stopped_at_cutoff else None,
+        }
+
+
+def parse_feed(text: str, spec: FeedSpec, cutoff: Optional[datetime] = None) -> list[dict]:
+    """Parse an already-downloaded feed body the way ``read_feed`` streams one."""
+    collector = _Collector(spec, cutoff)
+    stream = EntryStream(spec)
+    for entry in stream.feed(text):
+        if not collector.add(entry):
+            break
+    return spec.finish(collector.entries) if spec.finish else collector.entries
+
+
+def _covers(stored: Any, cutoff: Optional[datetime]) -> bool:
+    """True if stored entries include everything a read down to ``cutoff`` would."""
+    if not isinstance(stored, dict) or "entries" not in stored:
+        return False
+    if stored.get("cutoff") is None:
+        return True
+    return cutoff is not None and cutoff >= datetime.fromisoformat(stored["cutoff"])
+
+
+async def read_feed(
+    client: httpx.AsyncClient,
+    url: str,
+    spec: FeedSpec,
+    *,
+    cutoff: Optional[datetime] = None,
+    headers: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    cache: Optional[ResponseCache] = None,
+) -> list[dict]:
+    """Stream ``url`` and return up to ``spec.limit`` entry dicts.
+
+    Entries older than ``cutoff`` are left unread when the feed is sorted
+    (``spec.entry_date``); otherwise the caller filters by date.  Non-2xx
+    responses raise ``httpx.HTTPStatusError``.
+    """
+    async def consume(response: httpx.Response) -> dict:
+        collector = _Collector(spec, cutoff)
+        stream = EntryStream(spec)
+        wanted = True
+        async for chunk in response.aiter_bytes():
+            for item in stream.feed(chunk):
+                wanted = collector.add(item)
+                if not wanted:
+                    break
+            if not wanted:
+                break
+        logger.debug(
+            "Feed %s: %d entries from %d bytes%s", url, len(collector.entries),
+            response.num_bytes_downloaded, "" if wanted else " (stopped early)",
+        )
+        if spec.finish:
+            collector.entries = await run_parse(spec.finish, collector.entries)
+        return collector.result()
+
+    result = await cached_stream(
+        client, url, consume, spec.parse_key,
+        headers=headers, timeout=timeout, cache=cache,
+        reusable=lambda stored: _covers(stored, cutoff),
+    )
+    return result["entries"]
+
+
+# --- Atom / RSS entry extraction ---
+
+def _text(element: Optional[ET.Element]) -> str:
+    return element.text.strip() if element is not None and element.text else ""
+
+
+def extract_atom_entry(element: ET.Element) -> dict:
+    """Title, date, alternate link, category and raw HTML content of an Atom entry."""
+    link_el = element.find(f"{{{ATOM_NS}}}link[@rel='alternate']")
+    category_el = element.find(f"{{{ATOM_NS}}}category")
+    content_el = element.find(f"{{{ATOM_NS}}}content")
+    return {
+        "title": _text(element.find(f"{{{ATOM_NS}}}title")),
+        "date": _text(element.find(f"{{{ATOM_NS}}}updated")),
+        "url": link_el.get("href", "") if link_el is not None else "",
+        "category": category_el.get("term", "") if category_el is not None else "",
+        "content": content_el.text if content_el is not None and content_el.text else "",
+    }
+
+
+def extract_rss_item(element: ET.Element) -> dict:
+    """Title, link and publication date of an RSS item."""
+    return {
+        "title": _text(element.find("title")),
+        "url": _text(element.find("link")),
+        "date": _text(element.find("pubDate")),
+    }
+
+
+def atom_bodies(entries: list[dict], separator: str = "\n") -> list[dict]:
+    """Replace each entry's HTML ``content`` with a 500-char plain-text ``body``."""
+    for entry in entries:
+        html = entry.pop("content", "")
+        entry["body"] = BeautifulSoup(html, "html.parser").get_text(
+            separator=separator, strip=True,
+        )[:500] if html else ""
+    return entries
+
+
+def atom_entry_date(entry: dict) -> Optional[datetime]:
+    """An Atom entry's ISO 8601 ``updated`` date, if parseable."""
+    try:
+        date = datetime.fromisoformat(entry["date"].replace("Z", "+00:00"))
+    except (KeyError, ValueError):
+        return None
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+
+def rss_item_date(entry: dict) -> Optional[datetime]:
+    """An RSS item's RFC 2822 ``pubDate``, if parseable."""
+    try:
+        date = parsedate_to_datetime(entry["date"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
@@ -0,0 +1,284 @@
+"""Conditional-GET response cache for feeds and scraped pages.
+
+Stores each response's validators (``ETag`` / ``Last-Modified``), its body,
+and the fetcher's parsed result on disk.  The next request for the same URL
+sends ``If-None-Match`` / ``If-Modified-Since``; on a ``304 Not Modified``
+the stored parse result is returned as-is, so an unchanged source costs one
+round-trip and no parse CPU.
+
+Storage: ~/.claude-code-mastery/http_cache/<sha256(url)>.json — pruned on
+write: entries unused for ``HTTP_CACHE_TTL_DAYS`` are dropped, then the
+least recently used ones until the directory fits ``HTTP_CACHE_MAX_BYTES``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+from .cache import get_cache_dir
+from .parse_pool import run_parse
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_DIR_NAME = "http_cache"
+HTTP_CACHE_TTL_DAYS = 30  # Entries not used for this long are dropped
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+HTTP_CACHE_PRUNE_EVERY = 50  # Writes between prunes (the first write always prunes)
+
+
+@dataclass
+class CacheEntry:
+    """A stored response: validators, body, and parse results by parser key."""
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body: str = ""
+    fetched_at: str = ""
+    parsed: dict = field(default_factory=dict)  # {parse_key: JSON-serialisable result}
+
+    def validator_headers(self) -> dict[str, str]:
+        """Conditional request headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk store of ``CacheEntry`` objects, one JSON file per URL.
+
+    A file's mtime is its last use (reads touch it), which ``prune`` ages
+    entries by.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self._directory = directory
+        self._writes = 0
+
+    @property
+    def directory(self) -> Path:
+        d = self._directory or (get_cache_dir() / HTTP_CACHE_DIR_NAME)
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.directory / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        path = self._path(url)
+        if not path.exists():
+            return None
+        try:
+            entry = CacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+        except Exception as e:
+            logger.debug("Ignoring unreadable HTTP cache entry %s: %s", path, e)
+            return None
+        # Guard against digest collisions
+        if entry.url != url:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def discard(self, url: str) -> None:
+        self._path(url).unlink(missing_ok=True)
+
+    def put(self, entry: CacheEntry) -> None:
+        path = self._path(entry.url)
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning("Failed to write HTTP cache entry for %s: %s", entry.url, e)
+        if self._writes % HTTP_CACHE_PRUNE_EVERY == 0:
+            self.prune()
+        self._writes += 1
+
+    def prune(
+        self,
+        max_bytes: Optional[int] = None,
+        ttl_days: Optional[float] = None,
+    ) -> int:
+        """Drop expired entries, then least recently used ones over the size cap.
+
+        Defaults to ``HTTP_CACHE_MAX_BYTES`` / ``HTTP_CACHE_TTL_DAYS``.
+        Returns the number of entries removed.
+        """
+        max_bytes = HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        ttl_days = HTTP_CACHE_TTL_DAYS if ttl_days is None else ttl_days
+        cutoff = time.time() - ttl_days * 86400
+
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed concurrently
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if mtime >= cutoff and total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info("Pruned %d HTTP cache entr%s", removed, "y" if removed == 1 else "ies")
+        return removed
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache (under ``get_cache_dir()``)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache()
+    return _default_cache
+
+
+async def _run_parse(parse: Callable[[str], Any], text: str, offload: bool) -> Any:
+    if offload:
+        return await run_parse(parse, text)
+    return parse(text)
+
+
+async def cached_get(
+    client: httpx.AsyncClient,
+    url: str,
+    parse: Callable[[str], Any],
+    parse_key: str,
+    *,
+    headers: Optional[dict] = None,
+    params: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    cache: Optional[ResponseCache] = None,
+    offload: bool = False,
+) -> Any:
+    """GET ``url`` conditionally and return ``parse(body)``.
+
+    ``parse_key`` names the parser (bump it when the parser changes) so a
+    stored result is only reused by the parser that produced it.  Results
+    must be JSON-serialisable.  Non-2xx responses raise
+    ``httpx.HTTPStatusError`` like ``raise_for_status()``.
+
+    With ``offload=True`` the parse runs on the parse pool (``parse_pool``)
+    so a large page does not block the event loop while other requests are
+    in flight; ``parse`` must then be a picklable module-level function.
+    """
+    cache = cache or get_response_cache()
+    cache_key = str(httpx.URL(url, params=params)) if params else url
+    entry = cache.get(cache_key)
+
+    request_headers = dict(headers or {})
+    if entry:
+        request_headers.update(entry.validator_headers())
+
+    kwargs: dict = {"headers": request_headers, "params": params}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    response = await client.get(url, **kwargs)
+
+    if response.status_code == 304 and entry:
+        logger.debug("HTTP cache: %s not modified", cache_key)
+        if parse_key in entry.parsed:
+            return entry.parsed[parse_key]
+        result = await _run_parse(parse, entry.body, offload)
+        entry.parsed[parse_key] = result
+        cache.put(entry)
+        return result
+
+    response.raise_for_status()
+    result = await _run_parse(parse, response.text, offload)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        if entry:
+            cache.discard(cache_key)  # Server stopped sending validators
+        return result
+
+    cache.put(CacheEntry(
+        url=cache_key,
+        etag=etag,
+        last_modified=last_modified,
+        body=response.text,
+        fetched_at=datetime.now(timezone.utc).isoformat(),
+        parsed={parse_key: result},
+    ))
+    return result
+
+
+async def cached_stream(
+    client: httpx.AsyncClient,
+    url: str,
+    consume: Callable[[httpx.Response], Awaitable[Any]],
+    parse_key: str,
+    *,
+    headers: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    cache: Optional[ResponseCache] = None,
+    reusable: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """Streaming ``cached_get``: GET ``url`` and return ``await consume(response)``.
+
+    ``consume`` reads as much of the streamed body as it needs, so the
+    body itself is never stored — only the result, under ``parse_key``.
+    A stored result is offered for revalidation (and returned on a
+    ``304``) only if ``reusable(result)`` is true, e.g. when it covers the
+    caller's window; otherwise the request is unconditional.
+    """
+    cache = cache or get_response_cache()
+    entry = cache.get(url)
+    reuse = (
+        entry is not None and parse_key in entry.parsed
+        and (reusable is None or reusable(entry.parsed[parse_key]))
+    )
+
+    request_headers = dict(headers or {})
+    if reuse:
+        request_headers.update(entry.validator_headers())
+
+    kwargs: dict = {"headers": request_headers}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+
+    async with client.stream("GET", url, **kwargs) as response:
+        if response.status_code == 304 and reuse:
+            logger.debug("HTTP cache: %s not modified", url)
+            return entry.parsed[parse_key]
+        response.raise_for_status()
+        result = await consume(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+    if etag or last_modified:
+        cache.put(CacheEntry(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=datetime.now(timezone.utc).isoformat(),
+            parsed={parse_key: result},
+        ))
+    elif entry:
+        cache.discard(url)  # Server stopped sending validators
+    return result
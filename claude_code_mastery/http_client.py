@@ -0,0 +1,83 @@
+"""Shared HTTP client for all network fetchers.
+
+Every fetcher used to open its own ``httpx.AsyncClient``, so each run paid
+a fresh TCP + TLS handshake per source (and per URL for sources that try
+several). This module provides one session-scoped client with per-host
+connection pooling, keep-alive, and HTTP/2 when the optional ``h2``
+package is installed (``pip install httpx[http2]``).
+
+Usage::
+
+    async with http_session() as client:
+        result = await fetch_all_updates(7, client=client)
+        snapshot = await snapshot_docs(client=client)
+
+Fetchers accept an optional ``client``.  When it is omitted they borrow a
+short-lived one via ``borrow_client()`` so they still work standalone.
+"""
+
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 15.0
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 30.0  # seconds an idle pooled connection is kept open
+
+_http2_available: Optional[bool] = None
+
+
+def http2_available() -> bool:
+    """Return True if the ``h2`` package is installed (checked once)."""
+    global _http2_available
+    if _http2_available is None:
+        _http2_available = importlib.util.find_spec("h2") is not None
+        if not _http2_available:
+            logger.debug("h2 not installed — shared HTTP client will use HTTP/1.1")
+    return _http2_available
+
+
+def create_client(timeout: float = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """Create a pooled client. Callers own it and must close it."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        http2=http2_available(),
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+@asynccontextmanager
+async def http_session(timeout: float = DEFAULT_TIMEOUT) -> AsyncIterator[httpx.AsyncClient]:
+    """Open a pooled client for the duration of a run and close it afterwards."""
+    client = create_client(timeout)
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def borrow_client(
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield ``client`` if given, otherwise a temporary session.
+
+    A borrowed client is never closed here — its owner decides its lifetime.
+    """
+    if client is not None:
+        yield client
+        return
+    async with http_session(timeout) as own_client:
+        yield own_client
@@ -0,0 +1,63 @@
+"""Compiled multi-keyword matching.
+
+Relevance checks, tagging, week matching, gap classification and synonym
+expansion all ask the same question — "which of these keywords occur in
+this text?" — and used to answer it with one ``kw in text`` scan per
+keyword, per consumer.  ``KeywordMatcher`` compiles a keyword set once and
+returns every hit in one call, so a text can be scanned once for the union
+of several consumers' keywords and the hit set shared between them.
+
+Backends:
+- ``pyahocorasick`` (optional, ``pip install pyahocorasick``): an
+  Aho-Corasick automaton — one linear pass over the text regardless of the
+  number of keywords.
+- Fallback: per-keyword ``in`` checks.  CPython's substring search runs in
+  C and, for keyword sets of this size, beats any pure-Python or regex
+  multi-pattern scan (see ``benchmarks/bench_keywords.py``).
+
+Matching is case-sensitive, like ``in`` — callers lowercase the text.
+"""
+
+import importlib.util
+import logging
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+_ahocorasick = None
+if importlib.util.find_spec("ahocorasick") is not None:
+    import ahocorasick as _ahocorasick
+
+
+class KeywordMatcher:
+    """Find which of a fixed set of keywords occur in a text.
+
+    ``find(text)`` returns the same set as
+    ``{kw for kw in keywords if kw in text}``.
+    """
+
+    def __init__(self, keywords: Iterable[str], use_automaton: bool = True):
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(kw for kw in keywords if kw))
+        self._automaton = None
+        if use_automaton and _ahocorasick is not None and self.keywords:
+            automaton = _ahocorasick.Automaton()
+            for kw in self.keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @property
+    def backend(self) -> str:
+        return "ahocorasick" if self._automaton is not None else "scan"
+
+    def find(self, text: str) -> set[str]:
+        """All keywords occurring anywhere in ``text``."""
+        if self._automaton is not None:
+            return {kw for _, kw in self._automaton.iter(text)}
+        return {kw for kw in self.keywords if kw in text}
+
+    def any(self, text: str) -> bool:
+        """True if at least one keyword occurs in ``text`` (stops at the first)."""
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(kw in text for kw in self.keywords)
@@ -0,0 +1,219 @@
+"""Parsed structure of the curriculum markdown.
+
+Applying updates, building the semantic index and reporting all need the
+same facts about the curriculum — where each week, phase and appendix
+header sits and where the ``---`` separators are — and used to re-derive
+them with their own full-document regex scans on every call.
+``CurriculumOutline`` finds every h1–h3 header and separator in one pass
+and answers those questions from the result; ``get_outline`` caches it by
+content hash so unchanged text is never re-scanned.
+
+Offsets are ``str`` indices (characters, not bytes) into the text the
+outline was built from.
+"""
+
+import bisect
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Every h1–h3 header line.  ``\s+`` may span blank lines, exactly like the
+# header patterns this replaces, so offsets match theirs.
+_HEADER_RE = re.compile(r"^(#{1,3})\s+", re.MULTILINE)
+
+# Matched at a header's body (just after the ``#``s and whitespace)
+_WEEK_RE = re.compile(r"(?:WEEK|Week|week)\s+(\d+)\b")
+_WEEK_TITLE_RE = re.compile(r"(?:WEEK|Week|week)\s+(\d+)\s*[:\-—]?\s*(.*)")
+_PHASE_RE = re.compile(r"Phase|PHASE")
+_APPENDIX_RE = re.compile(r"Appendix|APPENDIX")
+_APPENDIX_TITLE_RE = re.compile(r"(?:Appendix|APPENDIX)\s+([A-Z])\s*[:\-—]?\s*(.*)")
+
+SEPARATOR = "\n---"
+
+MAX_CACHED_OUTLINES = 4
+
+
+@dataclass
+class OutlineNode:
+    """One h1–h3 header and the span it heads.
+
+    ``start`` is the first ``#``, ``body`` the first character after the
+    header marker, ``end`` the start of the next header of the same or a
+    higher level (or the end of the text).
+    """
+    kind: str  # "week", "phase", "appendix" or "heading"
+    level: int  # 1–3
+    title: str
+    start: int
+    body: int
+    end: int
+    week: Optional[int] = None
+    children: list["OutlineNode"] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Section:
+    """An indexable span of curriculum text."""
+    week: int  # 0 = appendix
+    title: str
+    start: int
+    end: int
+
+
+class CurriculumOutline:
+    """Headers, separators and section spans of one curriculum text."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.nodes: list[OutlineNode] = []
+        for match in _HEADER_RE.finditer(text):
+            body = match.end()
+            line_end = text.find("\n", body)
+            week = _WEEK_RE.match(text, body)
+            # "Week 01" is not week 1 to the apply patterns
+            if week and week.group(1) != str(int(week.group(1))):
+                week = None
+            if week:
+                kind = "week"
+            elif _PHASE_RE.match(text, body):
+                kind = "phase"
+            elif _APPENDIX_RE.match(text, body):
+                kind = "appendix"
+            else:
+                kind = "heading"
+            self.nodes.append(OutlineNode(
+                kind=kind,
+                level=len(match.group(1)),
+                title=text[body:line_end if line_end != -1 else len(text)].strip(),
+                start=match.start(),
+                body=body,
+                end=len(text),
+                week=int(week.group(1)) if week else None,
+            ))
+        self._starts = [node.start for node in self.nodes]
+
+        self.separators: list[int] = []
+        pos = text.find(SEPARATOR)
+        while pos != -1:
+            self.separators.append(pos)
+            pos = text.find(SEPARATOR, pos + 1)
+
+        # Nest by level; a node ends where the next same-or-higher one starts
+        self.roots: list[OutlineNode] = []
+        stack: list[OutlineNode] = []
+        for node in self.nodes:
+            while stack and stack[-1].level >= node.level:
+                stack.pop().end = node.start
+            (stack[-1].children if stack else self.roots).append(node)
+            stack.append(node)
+
+        self._weeks: dict[int, OutlineNode] = {}
+        for node in self.nodes:
+            if node.kind == "week":
+                self._weeks.setdefault(node.week, node)
+
+    # --- Lookups ---
+
+    def week(self, number: int) -> Optional[OutlineNode]:
+        """The first header for week ``number``."""
+        return self._weeks.get(number)
+
+    @property
+    def weeks(self) -> list[OutlineNode]:
+        return [node for node in self.nodes if node.kind == "week"]
+
+    @property
+    def appendices(self) -> list[OutlineNode]:
+        return [node for node in self.nodes if node.kind == "appendix"]
+
+    def next_header(self, pos: int) -> Optional[OutlineNode]:
+        """The first header starting at or after ``pos``."""
+        i = bisect.bisect_left(self._starts, pos)
+        return self.nodes[i] if i < len(self.nodes) else None
+
+    def week_boundary(self, number: int, pos: int) -> int:
+        """Where the content appended to a week must stop.
+
+        The start of the first week ``number + 1``, phase or appendix
+        header at or after ``pos``, else the end of the text.
+        """
+        for i in range(bisect.bisect_left(self._starts, pos), len(self.nodes)):
+            node = self.nodes[i]
+            if node.kind in ("phase", "appendix") or (node.kind == "week" and node.week == number + 1):
+                return node.start
+        return len(self.text)
+
+    def last_separator(self, start: int, end: int) -> int:
+        """Like ``text.rfind("\\n---", start, end)``."""
+        i = bisect.bisect_right(self.separators, end - len(SEPARATOR)) - 1
+        if i >= 0 and self.separators[i] >= start:
+            return self.separators[i]
+        return -1
+
+    # --- Sections for indexing ---
+
+    def week_sections(self) -> list[Section]:
+        """Week sections: each week header's title line to the next week header."""
+        matches = []
+        last_end = 0
+        for node in self.nodes:
+            if node.start < last_end:
+                continue  # Swallowed by the previous header's title match
+            match = _WEEK_TITLE_RE.match(self.text, node.body)
+            if match:
+                matches.append((node.start, match))
+                last_end = match.end()
+
+        sections = []
+        for i, (_, match) in enumerate(matches):
+            week = int(match.group(1))
+            end = matches[i + 1][0] if i + 1 < len(matches) else len(self.text)
+            sections.append(Section(
+                week=week,
+                title=match.group(2).strip() or f"Week {week}",
+                start=match.end(),
+                end=end,
+            ))
+        return sections
+
+    def appendix_sections(self) -> list[Section]:
+        """Lettered appendices: each title line to the next appendix header."""
+        candidates = [
+            (node.start, match) for node in self.nodes
+            if (match := _APPENDIX_TITLE_RE.match(self.text, node.body))
+        ]
+        sections = []
+        last_end = 0
+        for start_of_header, match in candidates:
+            if start_of_header < last_end:
+                continue  # Swallowed by the previous header's title match
+            last_end = start = match.end()
+            end = next(
+                (s for s, _ in candidates if s >= start),
+                len(self.text),
+            )
+            sections.append(Section(
+                week=0,
+                title=f"Appendix {match.group(1)}: {match.group(2).strip()}",
+                start=start,
+                end=end,
+            ))
+        return sections
+
+
+_outline_memo: dict[str, CurriculumOutline] = {}
+
+
+def get_outline(text: str) -> CurriculumOutline:
+    """Return the outline of ``text``, reusing one built for identical content."""
+    for outline in _outline_memo.values():
+        if outline.text is text:
+            return outline
+    key = hashlib.sha256(text.encode()).hexdigest()
+    outline = _outline_memo.get(key)
+    if outline is None:
+        while len(_outline_memo) >= MAX_CACHED_OUTLINES:
+            _outline_memo.pop(next(iter(_outline_memo)))
+        outline = _outline_memo[key] = CurriculumOutline(text)
+    return outline
@@ -0,0 +1,96 @@
+"""Worker pool for parsing fetched bodies off the event loop.
+
+BeautifulSoup and ElementTree parsing is CPU-bound.  Run inline, the blog,
+changelog, YouTube and docs pages — which tend to land together — are
+parsed one after another on the event loop, stalling every request still
+in flight and the MCP server itself.  Fetchers instead hand the raw body to
+``run_parse``, which runs the parse function on a shared executor:
+
+- ``"thread"`` (default): a thread pool.  Parsing still holds the GIL, but
+  the loop keeps servicing sockets between bytecode slices, and lxml /
+  expat release the GIL for their C parts.
+- ``"process"``: a process pool (``spawn`` start method, so it is safe to
+  create from a threaded, running event loop).  Parses run truly in
+  parallel on multiple cores; parse functions and their arguments and
+  results must be picklable, so only module-level functions returning
+  plain data (dicts, lists, ``Update`` objects) are submitted.
+
+The worker count defaults to ``min(4, cpu_count)`` and, like the kind, is
+set with ``configure_parse_pool`` (the entry points read
+``parse_executor`` / ``parse_workers`` from the scheduler config).
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KINDS = ("thread", "process")
+DEFAULT_EXECUTOR_KIND = "thread"
+DEFAULT_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+_kind = DEFAULT_EXECUTOR_KIND
+_workers = DEFAULT_PARSE_WORKERS
+_executor: Optional[Executor] = None
+
+
+def configure_parse_pool(kind: str = DEFAULT_EXECUTOR_KIND, workers: Optional[int] = None) -> None:
+    """Select the executor kind and worker count used by ``run_parse``.
+
+    Replaces (and shuts down) any executor already created; ``workers`` of
+    None or 0 means the default.
+    """
+    global _kind, _workers
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(f"Unknown parse executor '{kind}' (expected one of {', '.join(EXECUTOR_KINDS)})")
+    if workers is not None and workers < 0:
+        raise ValueError(f"parse_workers must be >= 0, got {workers}")
+    shutdown_parse_pool()
+    _kind = kind
+    _workers = workers or DEFAULT_PARSE_WORKERS
+
+
+def parse_pool_settings() -> tuple[str, int]:
+    """The configured ``(kind, workers)``."""
+    return _kind, _workers
+
+
+def get_parse_executor() -> Executor:
+    """Return the shared parse executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        if _kind == "process":
+            _executor = ProcessPoolExecutor(
+                max_workers=_workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix="parse")
+        logger.debug("Started %s parse pool with %d workers", _kind, _workers)
+    return _executor
+
+
+def shutdown_parse_pool(wait: bool = True) -> None:
+    """Shut the executor down; the next ``run_parse`` starts a fresh one."""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_parse(parse: Callable[..., Any], *args: Any) -> Any:
+    """Run ``parse(*args)`` on the parse executor and return its result."""
+    executor = get_parse_executor()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, functools.partial(parse, *args))
+    except BrokenProcessPool:
+        # A worker died (OOM, signal): drop the pool so the next parse gets a new one
+        if _executor is executor:
+            shutdown_parse_pool(wait=False)
+        raise
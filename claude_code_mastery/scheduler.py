@@ -31,19 +31,27 @@ from typing import Optional
 import httpx
 
 from .cache import (
+    clear_watermarks,
     get_cache_dir,
     load_curriculum_state,
     mark_update_applied,
     create_curriculum_backup,
     get_update_key,
 )
-from .sources import fetch_all_updates
+from .sources import (
+    FETCH_CACHE_TTL,
+    commit_watermarks,
+    fetch_all_updates,
+    fetch_all_updates_cached,
+)
+from .http_client import http_session
+from .parse_pool import DEFAULT_EXECUTOR_KIND, configure_parse_pool
 from .analyzer import (
     analyze_gaps,
     load_curriculum_file,
     save_curriculum_file,
     convert_gaps_to_updates,
-    apply_single_update,
+    apply_updates,
     CurriculumGap,
     CURRICULUM_TOPIC_MAP,
 )
@@ -88,6 +96,10 @@ def load_scheduler_config() -> dict:
         "auto_apply": False,  # Auto-apply high-priority updates to curriculum file
         "auto_apply_priority": "high",  # Only auto-apply gaps at this priority
         "auto_apply_max_per_run": 5,  # Safety cap per run
+        "fetch_cache_ttl_seconds": FETCH_CACHE_TTL,  # Reuse fetch results this long
+        "incremental_fetch": False,  # Only fetch entries newer than the last run's
+        "parse_executor": DEFAULT_EXECUTOR_KIND,  # "thread" or "process"
+        "parse_workers": 0,  # 0 = min(4, CPU count)
         "last_scheduled_check": None,
         "enabled": True,
     }
@@ -95,6 +107,25 @@ def load_scheduler_config() -> dict:
     return default
 
 
+def fetch_cache_ttl(config: Optional[dict] = None) -> float:
+    """Seconds a fetch result is reused (``fetch_cache_ttl_seconds``)."""
+    config = config if config is not None else load_scheduler_config()
+    return float(config.get("fetch_cache_ttl_seconds", FETCH_CACHE_TTL))
+
+
+def configure_parse_pool_from_config(config: Optional[dict] = None) -> None:
+    """Set up the parse pool from ``parse_executor`` / ``parse_workers``."""
+    config = config if config is not None else load_scheduler_config()
+    try:
+        configure_parse_pool(
+            config.get("parse_executor", DEFAULT_EXECUTOR_KIND),
+            int(config.get("parse_workers") or 0),
+        )
+    except (TypeError, ValueError) as e:
+        logger.warning("Invalid parse pool config, using defaults: %s", e)
+        configure_parse_pool()
+
+
 def save_scheduler_config(config: dict) -> None:
     """Persist scheduler config."""
     _config_path().write_text(json.dumps(config, indent=2), encoding="utf-8")
@@ -253,9 +284,10 @@ def _send_via_mail_app(to_email: str, subject: str, body: str) -> bool:
 
 # --- Check & notify ---
 
-async def run_scheduled_check() -> dict:
+async def run_scheduled_check(client: Optional[httpx.AsyncClient] = None) -> dict:
     """Run a single check cycle: fetch updates, analyse gaps, auto-apply, notify.
 
+    ``client`` is an optional pooled HTTP client shared across checks.
     Returns a summary dict with results.
     """
     config = load_scheduler_config()
@@ -271,9 +303,16 @@ async def run_scheduled_check() -> dict:
         "errors": [],
     }
 
-    # Fetch updates
+    # Fetch updates (incremental runs bypass the in-process cache: their
+    # result depends on the stored watermarks, not just the window)
+    incremental = config.get("incremental_fetch", False)
     try:
-        fetch_result = await fetch_all_updates(config.get("days_back", 7))
+        if incremental:
+            fetch_result = await fetch_all_updates(config.get("days_back", 7), client, incremental=True)
+        else:
+            fetch_result = await fetch_all_updates_cached(
+                config.get("days_back", 7), client, ttl=fetch_cache_ttl(config),
+            )
         if fetch_result.errors:
             result["errors"].extend(fetch_result.errors)
     except Exception as e:
@@ -303,6 +342,7 @@ async def run_scheduled_check() -> dict:
 
     if not filtered:
         logger.info("No gaps above %s priority — skipping notification", min_priority)
+        commit_watermarks(fetch_result)
         config["last_scheduled_check"] = result["timestamp"]
         save_scheduler_config(config)
         return result
@@ -401,6 +441,8 @@ async def run_scheduled_check() -> dict:
         if await send_email_notification(config, title, gaps_detail):
             result["notifications_sent"].append("email")
 
+    # Only now are this run's updates dealt with; the next one starts after them
+    commit_watermarks(fetch_result)
     config["last_scheduled_check"] = result["timestamp"]
     save_scheduler_config(config)
 
@@ -455,27 +497,26 @@ def _auto_apply_gaps(
         return apply_result
     apply_result["backup_path"] = backup_path
 
-    # Apply each update sequentially
-    current_content = curriculum_content
-    for cu in updates:
-        try:
-            current_content = apply_single_update(current_content, cu)
-            apply_result["applied"].append({
-                "week": cu.week,
-                "section": cu.section,
-                "action": cu.action,
-                "reason": cu.reason,
-            })
-            # Track in cache
-            update_key = f"auto::{cu.section[:50]}"
-            mark_update_applied(
-                update_key,
-                f"Week {cu.week}: {cu.section} ({cu.action})"
-            )
-            logger.info("Auto-applied: Week %d — %s", cu.week, cu.section)
-        except Exception as e:
-            logger.warning("Failed to auto-apply '%s': %s", cu.section, e)
-            apply_result["errors"].append(f"Failed: {cu.section} — {e}")
+    # Apply all updates in one pass
+    current_content, errors = apply_updates(curriculum_content, updates)
+    for cu, error in zip(updates, errors):
+        if error is not None:
+            logger.warning("Failed to auto-apply '%s': %s", cu.section, error)
+            apply_result["errors"].append(f"Failed: {cu.section} — {error}")
+            continue
+        apply_result["applied"].append({
+            "week": cu.week,
+            "section": cu.section,
+            "action": cu.action,
+            "reason": cu.reason,
+        })
+        # Track in cache
+        update_key = f"auto::{cu.section[:50]}"
+        mark_update_applied(
+            update_key,
+            f"Week {cu.week}: {cu.section} ({cu.action})"
+        )
+        logger.info("Auto-applied: Week %d — %s", cu.week, cu.section)
 
     # Save the modified curriculum
     if apply_result["applied"]:
@@ -581,19 +622,21 @@ async def run_daemon(interval_hours: Optional[float] = None):
 
     logger.info("Starting curriculum updater daemon (interval: %sh)", interval)
 
-    while True:
-        try:
-            result = await run_scheduled_check()
-            logger.info(
-                "Check complete: %d gaps, %d high priority, notifications: %s",
-                result["gaps_found"],
-                result["high_priority"],
-                result["notifications_sent"] or "none",
-            )
-        except Exception as e:
-            logger.exception("Scheduled check failed: %s", e)
+    # One pooled client for the daemon's lifetime
+    async with http_session() as client:
+        while True:
+            try:
+                result = await run_scheduled_check(client)
+                logger.info(
+                    "Check complete: %d gaps, %d high priority, notifications: %s",
+                    result["gaps_found"],
+                    result["high_priority"],
+                    result["notifications_sent"] or "none",
+                )
+            except Exception as e:
+                logger.exception("Scheduled check failed: %s", e)
 
-        await asyncio.sleep(interval * 3600)
+            await asyncio.sleep(interval * 3600)
 
 
 # --- macOS launchd integration ---
@@ -723,7 +766,20 @@ def main():
     parser.add_argument("--interval", type=int, default=24, help="Check interval in hours (default: 24)")
     parser.add_argument("--weekly", action="store_true", help="Use weekly schedule (Mondays at 9 AM)")
     parser.add_argument("--auto-apply", action="store_true", help="Enable auto-applying high-priority updates")
+    parser.add_argument("--incremental", action="store_true", help="Enable incremental fetching (per-source watermarks)")
+    parser.add_argument("--reset-watermarks", action="store_true", help="Make the next incremental run read full windows")
     args = parser.parse_args()
+    configure_parse_pool_from_config()
+
+    if args.incremental:
+        config = load_scheduler_config()
+        config["incremental_fetch"] = True
+        save_scheduler_config(config)
+        print("✅ Incremental fetching enabled")
+
+    if args.reset_watermarks:
+        clear_watermarks()
+        print("✅ Source watermarks cleared")
 
     if args.auto_apply:
         config = load_scheduler_config()
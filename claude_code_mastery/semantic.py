@@ -14,12 +14,28 @@ Key entry points
 - ``is_semantically_covered(update_text, curriculum_text)`` — main check
 - ``find_best_week(update_text, curriculum_sections)`` — find best-matching week
 - ``SemanticIndex.build(curriculum_text)`` — build reusable index
+- ``get_index(curriculum_text, topic_map)`` — cached index (memory, then disk)
+
+Fitted indexes are persisted under ``~/.claude-code-mastery/semantic_index/``
+keyed by a hash of the curriculum text and topic map, and loaded with
+memory-mapped arrays, so the vectoriser is only refit when the curriculum
+actually changes.
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
+from .cache import get_cache_dir
+from .keywords import KeywordMatcher
+from .outline import get_outline
+
 logger = logging.getLogger(__name__)
 
 # Lazy-loaded sklearn components
@@ -49,6 +65,18 @@ def _ensure_sklearn():
     return _sklearn_available
 
 
+INDEX_DIR_NAME = "semantic_index"
+INDEX_FORMAT_VERSION = 1  # Bump when parsing, normalisation or vectoriser settings change
+MAX_PERSISTED_INDEXES = 3
+
+_VECTORIZER_PARAMS = {
+    "max_features": 5000,
+    "ngram_range": (1, 3),
+    "stop_words": "english",
+    "sublinear_tf": True,
+}
+
+
 # --- Normalisation helpers ---
 
 def _normalise(text: str) -> str:
@@ -78,20 +106,32 @@ _SYNONYMS = [
     ({"token"}, {"context window", "token usage", "token limit", "compact"}),
 ]
 
+_SYNONYM_MATCHER = KeywordMatcher(
+    term for group_a, group_b in _SYNONYMS for term in group_a | group_b
+)
+
+
 def _expand_with_synonyms(text: str) -> str:
     """Expand text with domain synonyms so TF-IDF can match them."""
-    text_lower = text.lower()
+    hits = _SYNONYM_MATCHER.find(text.lower())
     extras = []
     for group_a, group_b in _SYNONYMS:
         all_terms = group_a | group_b
-        found = any(term in text_lower for term in all_terms)
-        if found:
+        if not hits.isdisjoint(all_terms):
             extras.extend(all_terms)
     if extras:
         return text + " " + " ".join(extras)
     return text
 
 
+@dataclass
+class SemanticMatch:
+    """Batch query result for one text: best week and coverage."""
+    best_week: Optional[int]  # Same as SemanticIndex.best_week()
+    score: float              # Highest similarity to any section
+    covered: bool             # Same as SemanticIndex.is_covered(coverage_threshold)
+
+
 class SemanticIndex:
     """Reusable TF-IDF index over curriculum sections.
 
@@ -122,12 +162,7 @@ class SemanticIndex:
             for s in self._sections
         ]
 
-        self._vectorizer = _TfidfVectorizer(
-            max_features=5000,
-            ngram_range=(1, 3),
-            stop_words="english",
-            sublinear_tf=True,
-        )
+        self._vectorizer = _TfidfVectorizer(**_VECTORIZER_PARAMS)
         self._matrix = self._vectorizer.fit_transform(documents)
         self._built = True
         logger.info(
@@ -137,6 +172,71 @@ class SemanticIndex:
         )
         return True
 
+    def save(self, directory: Path) -> None:
+        """Persist the fitted index: vocabulary, IDF weights and CSR arrays.
+
+        Written to a temp dir and renamed into place so readers never see
+        a partial index.
+        """
+        import numpy as np
+
+        if not self._built:
+            raise ValueError("Cannot save an index that has not been built")
+
+        tmp = directory.with_name(directory.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        matrix = self._matrix.tocsr()
+        np.save(tmp / "idf.npy", self._vectorizer.idf_)
+        np.save(tmp / "data.npy", matrix.data)
+        np.save(tmp / "indices.npy", matrix.indices)
+        np.save(tmp / "indptr.npy", matrix.indptr)
+        vocabulary = {term: int(i) for term, i in self._vectorizer.vocabulary_.items()}
+        (tmp / "vocab.json").write_text(json.dumps(vocabulary), encoding="utf-8")
+        (tmp / "sections.json").write_text(json.dumps({
+            "shape": list(matrix.shape),
+            "sections": [{"week": s["week"], "title": s["title"]} for s in self._sections],
+        }), encoding="utf-8")
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp, directory)
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["SemanticIndex"]:
+        """Load an index written by ``save()``; arrays are memory-mapped.
+
+        Returns None if sklearn is unavailable or the files are unreadable.
+        """
+        if not _ensure_sklearn() or not directory.is_dir():
+            return None
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        try:
+            meta = json.loads((directory / "sections.json").read_text(encoding="utf-8"))
+            vectorizer = _TfidfVectorizer(**_VECTORIZER_PARAMS)
+            vectorizer.vocabulary_ = json.loads((directory / "vocab.json").read_text(encoding="utf-8"))
+            vectorizer.idf_ = np.load(directory / "idf.npy")
+            matrix = csr_matrix(
+                (
+                    np.load(directory / "data.npy", mmap_mode="r"),
+                    np.load(directory / "indices.npy", mmap_mode="r"),
+                    np.load(directory / "indptr.npy", mmap_mode="r"),
+                ),
+                shape=tuple(meta["shape"]),
+            )
+        except Exception as e:
+            logger.warning("Ignoring unreadable semantic index %s: %s", directory, e)
+            return None
+
+        index = cls()
+        index._vectorizer = vectorizer
+        index._matrix = matrix
+        index._sections = meta["sections"]
+        index._built = True
+        return index
+
     def query(self, text: str, threshold: float = 0.15) -> list[dict]:
         """Find curriculum sections similar to the query text.
 
@@ -163,6 +263,36 @@ class SemanticIndex:
         results.sort(key=lambda r: r["score"], reverse=True)
         return results
 
+    def match_batch(
+        self,
+        texts: list[str],
+        coverage_threshold: float = 0.20,
+        week_threshold: float = 0.10,
+    ) -> list[SemanticMatch]:
+        """Answer ``best_week`` and ``is_covered`` for many texts at once.
+
+        One ``transform`` and one sparse texts × sections product instead of
+        a transform, similarity pass and result list per call.
+        """
+        if not self._built or not texts:
+            return [SemanticMatch(None, 0.0, False) for _ in texts]
+
+        query_matrix = self._vectorizer.transform(
+            [_expand_with_synonyms(_normalise(t)) for t in texts]
+        )
+        similarities = _cosine_similarity(query_matrix, self._matrix)
+        best = similarities.argmax(axis=1)
+
+        matches = []
+        for row, col in enumerate(best):
+            score = float(similarities[row, col])
+            matches.append(SemanticMatch(
+                best_week=self._sections[col]["week"] if score >= week_threshold else None,
+                score=score,
+                covered=score >= coverage_threshold,
+            ))
+        return matches
+
     def is_covered(self, text: str, threshold: float = 0.20) -> bool:
         """Check if the topic described by text is covered in the curriculum.
 
@@ -183,46 +313,15 @@ class SemanticIndex:
     ) -> list[dict]:
         """Parse curriculum markdown into indexable sections."""
         sections = []
+        outline = get_outline(text)
 
-        # Split by week headers
-        week_pattern = re.compile(
-            r"^#{1,3}\s+(?:WEEK|Week|week)\s+(\d+)\s*[:\-—]?\s*(.*)",
-            re.MULTILINE,
-        )
-        matches = list(week_pattern.finditer(text))
-
-        for i, match in enumerate(matches):
-            week_num = int(match.group(1))
-            week_title = match.group(2).strip()
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-
-            section_text = text[start:end].strip()
-            if section_text:
-                sections.append({
-                    "week": week_num,
-                    "title": week_title or f"Week {week_num}",
-                    "text": section_text,
-                })
-
-        # Also index appendices
-        appendix_pattern = re.compile(
-            r"^#{1,3}\s+(?:Appendix|APPENDIX)\s+([A-Z])\s*[:\-—]?\s*(.*)",
-            re.MULTILINE,
-        )
-        for match in appendix_pattern.finditer(text):
-            letter = match.group(1)
-            title = match.group(2).strip()
-            start = match.end()
-            # Find next appendix or end
-            next_match = appendix_pattern.search(text, start)
-            end = next_match.start() if next_match else len(text)
-
-            section_text = text[start:end].strip()
+        # Week sections, then appendices
+        for section in outline.week_sections() + outline.appendix_sections():
+            section_text = text[section.start:section.end].strip()
             if section_text:
                 sections.append({
-                    "week": 0,
-                    "title": f"Appendix {letter}: {title}",
+                    "week": section.week,
+                    "title": section.title,
                     "text": section_text,
                 })
 
@@ -239,6 +338,70 @@ class SemanticIndex:
         return sections
 
 
+# --- Persisted index cache ---
+
+_index_memo: dict[str, SemanticIndex] = {}
+
+
+def index_key(curriculum_text: str, topic_map: Optional[dict] = None) -> str:
+    """Cache key for the index built from this curriculum and topic map."""
+    digest = hashlib.sha256()
+    digest.update(f"v{INDEX_FORMAT_VERSION}\0{sorted(_VECTORIZER_PARAMS.items())}\0".encode())
+    digest.update(curriculum_text.encode())
+    digest.update(json.dumps(topic_map or {}, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:24]
+
+
+def _index_root() -> Path:
+    d = get_cache_dir() / INDEX_DIR_NAME
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def _prune_indexes(keep: str) -> None:
+    """Keep the newest MAX_PERSISTED_INDEXES index dirs (always ``keep``)."""
+    dirs = sorted(
+        (d for d in _index_root().iterdir() if d.is_dir() and d.name != keep),
+        key=lambda d: d.stat().st_mtime,
+        reverse=True,
+    )
+    for old in dirs[MAX_PERSISTED_INDEXES - 1:]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def get_index(curriculum_text: str, topic_map: Optional[dict] = None) -> Optional[SemanticIndex]:
+    """Return a built index for this curriculum, refitting only on change.
+
+    Looks in the in-process memo, then on disk, and only then fits a new
+    vectoriser (and persists it).  Returns None when sklearn is missing or
+    the curriculum has no indexable sections.
+    """
+    if not _ensure_sklearn():
+        return None
+
+    key = index_key(curriculum_text, topic_map)
+    if key in _index_memo:
+        return _index_memo[key]
+
+    directory = _index_root() / key
+    index = SemanticIndex.load(directory)
+    if index is not None:
+        logger.info("Semantic index loaded from cache (%s)", key)
+    else:
+        index = SemanticIndex()
+        if not index.build(curriculum_text, topic_map):
+            return None
+        try:
+            index.save(directory)
+            _prune_indexes(keep=key)
+        except Exception as e:
+            logger.warning("Failed to persist semantic index: %s", e)
+
+    _index_memo.clear()  # Only the current curriculum is worth keeping in memory
+    _index_memo[key] = index
+    return index
+
+
 # --- Convenience functions ---
 
 _global_index: Optional[SemanticIndex] = None
@@ -13,7 +13,7 @@ import re
 from datetime import datetime, timezone
 from typing import Optional
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field, ConfigDict
 
 from .sources import (
@@ -28,22 +28,30 @@ from .sources import (
     fetch_reddit_atom,
     fetch_pypi_releases,
     fetch_npm_releases,
-    fetch_all_updates,
+    assemble_fetch_result,
+    fetch_all_updates_cached,
+    get_cached_fetch,
+    iter_source_results_cached,
     FetchResult,
+    SourceResult,
     Update,
 )
 from .analyzer import (
     analyze_gaps,
+    iter_gaps,
+    GapStream,
     generate_update_report,
     load_curriculum_file,
     save_curriculum_file,
     apply_single_update,
+    get_outline,
     CurriculumUpdate,
     CURRICULUM_TOPIC_MAP,
 )
 from .cache import (
-    load_cache,
-    save_cache,
+    count_applied_updates,
+    count_seen_updates,
+    get_applied_updates,
     mark_update_seen,
     mark_updates_seen,
     mark_update_applied,
@@ -53,9 +61,11 @@ from .cache import (
     load_curriculum_state,
     save_curriculum_state,
 )
-from .docs_differ import run_docs_diff
+from .docs_differ import compare_snapshots, run_docs_diff
 from .scheduler import (
     run_scheduled_check,
+    configure_parse_pool_from_config,
+    fetch_cache_ttl,
     load_scheduler_config,
     save_scheduler_config,
     install_launchd,
@@ -184,7 +194,7 @@ async def curriculum_fetch_updates(params: FetchUpdatesInput) -> str:
                 return f"Unknown source '{params.source}'. Valid sources: {', '.join(single_fetchers.keys())}"
             updates = await fetcher()
         else:
-            result = await fetch_all_updates(params.days_back)
+            result = await fetch_all_updates_cached(params.days_back, ttl=fetch_cache_ttl())
             updates = result.updates
             errors = result.errors
 
@@ -261,6 +271,42 @@ async def curriculum_fetch_updates(params: FetchUpdatesInput) -> str:
         return f"Error fetching updates: {type(e).__name__}: {str(e)}\n\nThis may be due to network issues or rate limiting. Try again in a few minutes."
 
 
+async def _fetch_and_analyze(
+    days_back: int,
+    curriculum_content: Optional[str],
+    ctx: Optional[Context] = None,
+) -> tuple[FetchResult, list]:
+    """Fetch updates and analyse gaps, overlapping the two.
+
+    A fresh cached fetch is analysed in one go.  Otherwise each source's
+    updates are analysed as soon as that source completes, with progress
+    and first-seen gaps reported through ``ctx``.  The fetch is shared
+    with any concurrent tool call (and cached for the next one) by
+    ``iter_source_results_cached``.
+    """
+    cached = get_cached_fetch(days_back, fetch_cache_ttl())
+    if cached is not None:
+        return cached, analyze_gaps(cached.updates, curriculum_content)
+
+    results: list[SourceResult] = []
+
+    async def batches():
+        async for source_result in iter_source_results_cached(days_back, ttl=fetch_cache_ttl()):
+            results.append(source_result)
+            if ctx:
+                status = source_result.error or f"{len(source_result.updates)} update(s)"
+                await ctx.info(f"{source_result.name}: {status}")
+                await ctx.report_progress(len(results))
+            yield source_result.updates
+
+    stream = GapStream(curriculum_content)
+    async for gap in iter_gaps(batches(), stream=stream):
+        if ctx:
+            await ctx.info(f"Gap ({gap.priority}): {gap.update.title}")
+
+    return assemble_fetch_result(results), stream.gaps()
+
+
 @mcp.tool(
     name="curriculum_analyze_gaps",
     annotations={
@@ -271,7 +317,7 @@ async def curriculum_fetch_updates(params: FetchUpdatesInput) -> str:
         "openWorldHint": True,
     }
 )
-async def curriculum_analyze_gaps(params: AnalyzeGapsInput) -> str:
+async def curriculum_analyze_gaps(params: AnalyzeGapsInput, ctx: Optional[Context] = None) -> str:
     """Fetch latest updates and analyze gaps against your Claude Code curriculum.
 
     Compares recent updates from all sources against the curriculum's topic map
@@ -288,9 +334,6 @@ async def curriculum_analyze_gaps(params: AnalyzeGapsInput) -> str:
         str: Markdown report of gaps found with prioritized suggestions
     """
     try:
-        # Fetch all updates
-        result = await fetch_all_updates(params.days_back)
-
         # Load curriculum content — use explicit path, fall back to configured path
         curriculum_content = None
         curriculum_path = params.curriculum_path
@@ -302,8 +345,8 @@ async def curriculum_analyze_gaps(params: AnalyzeGapsInput) -> str:
             if curriculum_content is None:
                 return f"Error: Could not read curriculum file at '{curriculum_path}'. Please check the path exists."
 
-        # Analyze gaps
-        gaps = analyze_gaps(result.updates, curriculum_content)
+        # Fetch and analyse, streaming progress as sources complete
+        result, gaps = await _fetch_and_analyze(params.days_back, curriculum_content, ctx)
 
         # Filter by priority if requested
         if params.priority_filter:
@@ -454,10 +497,12 @@ async def curriculum_set_path(params: SetCurriculumPathInput) -> str:
     save_curriculum_state(state)
 
     file_size = len(content)
+    outline = get_outline(content)
     return (
         f"✅ **Curriculum configured!**\n\n"
         f"- **File:** {params.path}\n"
         f"- **Size:** {file_size:,} characters\n"
+        f"- **Structure:** {len(outline.weeks)} week(s), {len(outline.appendices)} appendix section(s)\n"
         f"- **Current Week:** {params.current_week}\n"
         f"- **Phase:** {CURRICULUM_TOPIC_MAP.get(params.current_week, {}).get('phase', 'Unknown')}\n\n"
         f"You can now use `curriculum_analyze_gaps` and `curriculum_apply_update` tools."
@@ -486,7 +531,6 @@ async def curriculum_status(params: GetStatusInput) -> str:
         str: Formatted status report
     """
     state = load_curriculum_state()
-    cache = load_cache()
 
     current_week = state.get("current_week", 1)
     week_info = CURRICULUM_TOPIC_MAP.get(current_week, {})
@@ -495,15 +539,15 @@ async def curriculum_status(params: GetStatusInput) -> str:
     result += f"**Current Week:** {current_week} — {week_info.get('title', 'Unknown')}\n"
     result += f"**Phase:** {week_info.get('phase', 'Unknown')}\n"
     result += f"**Curriculum File:** {state.get('curriculum_path', 'Not set')}\n"
-    result += f"**Last Check:** {cache.get('last_check', 'Never')}\n"
-    result += f"**Updates Tracked:** {len(cache.get('seen_updates', []))}\n"
-    result += f"**Updates Applied:** {len(cache.get('applied_updates', []))}\n"
+    result += f"**Last Check:** {get_last_check_time() or 'Never'}\n"
+    result += f"**Updates Tracked:** {count_seen_updates()}\n"
+    result += f"**Updates Applied:** {count_applied_updates()}\n"
 
     if params.verbose:
         result += "\n## Recent Applied Updates\n\n"
-        applied = cache.get("applied_updates", [])
+        applied = get_applied_updates(limit=10)
         if applied:
-            for a in applied[-10:]:  # Last 10
+            for a in applied:
                 result += f"- `{a.get('applied_at', '')}` — {a.get('details', '')}\n"
         else:
             result += "No updates applied yet.\n"
@@ -520,7 +564,16 @@ async def curriculum_status(params: GetStatusInput) -> str:
 
 class DocsDiffInput(BaseModel):
     """Input for docs diffing."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    since: Optional[str] = Field(
+        default=None,
+        description="Compare stored snapshots instead of crawling: snapshot id, date prefix (e.g. '20260101'), or 'previous'",
+    )
+    until: str = Field(
+        default="latest",
+        description="End point for 'since' comparisons: snapshot id, date prefix, or 'latest'",
+    )
 
 
 @mcp.tool(
@@ -539,12 +592,16 @@ async def curriculum_docs_diff(params: DocsDiffInput) -> str:
     On first run, takes a baseline snapshot. On subsequent runs, compares
     against the previous snapshot to detect added, modified, and removed
     sections — catching every docs change, not just what gets announced.
+    With ``since`` set, diffs two stored snapshots without crawling.
 
     Returns:
         str: Summary of documentation changes detected
     """
     try:
-        updates, summary = await run_docs_diff()
+        if params.since:
+            updates, summary = compare_snapshots(params.since, params.until)
+        else:
+            updates, summary = await run_docs_diff()
 
         result = f"# Documentation Diff Report\n\n{summary}\n\n"
 
@@ -714,6 +771,7 @@ def main():
         level=logging.INFO,
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     )
+    configure_parse_pool_from_config()
     mcp.run()
 
 
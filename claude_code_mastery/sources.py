@@ -15,24 +15,55 @@ Sources are divided into two tiers:
 - Boris Cherny's X (meta tag extraction only)
 - Anthropic YouTube (script tag extraction)
 
-Tier 1 sources are tried first; Tier 2 are used for sources that
-lack structured feeds.
+Both tiers run concurrently.  Tier 2 covers sources that lack structured
+feeds, and stands in for a Tier 1 feed as soon as that feed fails.
+
+Every fetcher takes an optional pooled ``httpx.AsyncClient`` (see
+``http_client``); ``fetch_all_updates`` shares one across all sources.
 """
 
 import asyncio
 import hashlib
+import heapq
+import importlib.util
+import json
 import logging
 import re
-import xml.etree.ElementTree as ET
+import time
+from itertools import takewhile
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+from dataclasses import dataclass, field, asdict, replace
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from typing import AsyncIterator, Optional
 
 import httpx
 from bs4 import BeautifulSoup
 
+from .feeds import (
+    ATOM_ENTRY,
+    RSS_ITEM,
+    FeedSpec,
+    atom_bodies,
+    atom_entry_date,
+    extract_atom_entry,
+    extract_rss_item,
+    read_feed,
+    rss_item_date,
+)
+from .deadlines import FETCH_BUDGET, SOURCE_DEADLINE, FetchBudget, run_source
+from .cache import load_watermarks, store_watermarks
+from .http_cache import cached_stream
+from .http_client import borrow_client
+from .parse_pool import run_parse
+from .keywords import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
+_ijson = None
+if importlib.util.find_spec("ijson") is not None:
+    import ijson as _ijson
+
 
 # --- Data Models ---
 
@@ -50,6 +81,30 @@ class Update:
         return asdict(self)
 
 
+@dataclass
+class Watermark:
+    """How far an incremental source has been read.
+
+    ``date`` (ISO 8601) and ``last_id`` describe the newest entry seen.  A
+    fetcher given a watermark reports only entries newer than it, stops
+    reading at the first older one where the feed is sorted, and advances
+    it over everything it reads.  ``read`` (not persisted) records that the
+    source answered this run, so an empty result means "nothing new".
+    """
+    date: str = ""
+    last_id: str = ""
+    read: bool = field(default=False, compare=False)
+
+    def since(self) -> Optional[datetime]:
+        return datetime.fromisoformat(self.date) if self.date else None
+
+    def advance(self, when: datetime, entry_id: str = "") -> None:
+        since = self.since()
+        if since is None or when > since:
+            self.date = when.isoformat()
+            self.last_id = entry_id
+
+
 # --- Constants ---
 
 BORIS_X_URL = "https://x.com/anthropaboris"
@@ -71,9 +126,6 @@ REDDIT_CLAUDE_RSS = "https://www.reddit.com/r/ClaudeAI/.rss"
 PYPI_RSS_URL = "https://pypi.org/rss/project/anthropic/releases.xml"
 NPM_REGISTRY_URL = "https://registry.npmjs.org/@anthropic-ai/claude-code"
 
-# Atom namespace
-ATOM_NS = "http://www.w3.org/2005/Atom"
-
 # Keywords that signal Claude Code relevance
 CLAUDE_CODE_KEYWORDS = [
     "claude code", "claude-code", "@anthropic-ai/claude-code",
@@ -91,6 +143,30 @@ CLAUDE_CODE_KEYWORDS = [
     "agent teams", "multi-agent",
 ]
 
+# Keyword → tag, checked in this order by _extract_tags
+TAG_MAP = {
+    "claude code": "claude-code",
+    "mcp": "mcp",
+    "model context protocol": "mcp",
+    "hooks": "hooks",
+    "skills": "skills",
+    "agent teams": "agent-teams",
+    "parallel sessions": "parallel-sessions",
+    "opus": "model-update",
+    "sonnet": "model-update",
+    "haiku": "model-update",
+    "api": "api",
+    "sdk": "sdk",
+    "claude.md": "claude-md",
+    "plan mode": "plan-mode",
+    "context window": "context-window",
+    "git": "git",
+    "tool use": "tool-use",
+}
+
+# Relevance and tagging usually run on the same text: scan once for both
+_SOURCE_KEYWORD_MATCHER = KeywordMatcher(list(CLAUDE_CODE_KEYWORDS) + list(TAG_MAP))
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -99,28 +175,15 @@ HEADERS = {
 
 
 # --- Fetchers ---
+#
+# Scraped pages are parsed by module-level ``_parse_*`` functions that take
+# the raw body and return ``Update`` objects.  They run on the parse pool
+# (``run_parse``), so they must stay picklable and free of I/O.
 
-async def fetch_boris_x_posts(days_back: int = 30) -> list[Update]:
-    """
-    Fetch recent posts from Boris Cherny's X account.
-    Best-effort only — X blocks most scraping. Returns what we can get
-    from the public profile meta tags.
-    """
-    username = "anthropaboris"
-    url = f"https://x.com/{username}"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            response = await client.get(url, headers=HEADERS)
-            if response.status_code != 200:
-                logger.info("X returned %d for %s", response.status_code, url)
-                return []
-    except httpx.HTTPError as e:
-        logger.info("X fetch failed for %s: %s", url, e)
-        return []
-
+def _parse_x_profile(html: str, url: str) -> list[Update]:
+    """Claude-relevant profile description meta tags as updates."""
     updates = []
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, "html.parser")
 
     for meta in [
         soup.find("meta", {"name": "description"}),
@@ -138,21 +201,40 @@ async def fetch_boris_x_posts(days_back: int = 30) -> list[Update]:
                 date=datetime.now(timezone.utc).isoformat(),
                 tags=_extract_tags(content),
             ))
+    return updates
+
+
+async def fetch_boris_x_posts(
+    days_back: int = 30, client: Optional[httpx.AsyncClient] = None,
+) -> list[Update]:
+    """
+    Fetch recent posts from Boris Cherny's X account.
+    Best-effort only — X blocks most scraping. Returns what we can get
+    from the public profile meta tags.
+    """
+    username = "anthropaboris"
+    url = f"https://x.com/{username}"
+
+    try:
+        async with borrow_client(client) as client:
+            response = await client.get(url, headers=HEADERS, timeout=10.0)
+            if response.status_code != 200:
+                logger.info("X returned %d for %s", response.status_code, url)
+                return []
+    except httpx.HTTPError as e:
+        logger.info("X fetch failed for %s: %s", url, e)
+        return []
+
+    updates = await run_parse(_parse_x_profile, response.text, url)
 
     logger.info("X/Boris: found %d updates", len(updates))
     return updates
 
 
-async def fetch_anthropic_blog(days_back: int = 30) -> list[Update]:
-    """Fetch recent Claude-related posts from Anthropic's blog."""
+def _parse_blog_page(html: str, cutoff: datetime) -> list[Update]:
+    """Claude-related articles on the blog index published after ``cutoff``."""
     updates = []
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
-
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(ANTHROPIC_BLOG_URL, headers=HEADERS)
-        response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, "html.parser")
     articles = soup.select("a[href*='/news/'], a[href*='/research/'], article a")
 
     seen_urls = set()
@@ -197,20 +279,29 @@ async def fetch_anthropic_blog(days_back: int = 30) -> list[Update]:
         except Exception as e:
             logger.debug("Skipping blog article: %s", e)
             continue
-
-    logger.info("Anthropic Blog: found %d updates", len(updates))
     return updates
 
 
-async def fetch_anthropic_changelog(days_back: int = 30) -> list[Update]:
-    """Fetch recent entries from Anthropic's changelog."""
-    updates = []
+async def fetch_anthropic_blog(
+    days_back: int = 30, client: Optional[httpx.AsyncClient] = None,
+) -> list[Update]:
+    """Fetch recent Claude-related posts from Anthropic's blog."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(ANTHROPIC_CHANGELOG_URL, headers=HEADERS)
+    async with borrow_client(client) as client:
+        response = await client.get(ANTHROPIC_BLOG_URL, headers=HEADERS)
         response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    updates = await run_parse(_parse_blog_page, response.text, cutoff)
+
+    logger.info("Anthropic Blog: found %d updates", len(updates))
+    return updates
+
+
+def _parse_changelog_page(html: str) -> list[Update]:
+    """Claude-relevant entries on the changelog page."""
+    updates = []
+    soup = BeautifulSoup(html, "html.parser")
 
     entries = soup.select("article, .changelog-entry, section, [class*='changelog']")
     if not entries:
@@ -249,20 +340,27 @@ async def fetch_anthropic_changelog(days_back: int = 30) -> list[Update]:
         except Exception as e:
             logger.debug("Skipping changelog entry: %s", e)
             continue
+    return updates
+
+
+async def fetch_anthropic_changelog(
+    days_back: int = 30, client: Optional[httpx.AsyncClient] = None,
+) -> list[Update]:
+    """Fetch recent entries from Anthropic's changelog."""
+    async with borrow_client(client) as client:
+        response = await client.get(ANTHROPIC_CHANGELOG_URL, headers=HEADERS)
+        response.raise_for_status()
+
+    updates = await run_parse(_parse_changelog_page, response.text)
 
     logger.info("Anthropic Changelog: found %d updates", len(updates))
     return updates
 
 
-async def fetch_claude_code_docs() -> list[Update]:
-    """Fetch current Claude Code documentation structure for gap analysis."""
+def _parse_docs_index(html: str) -> list[Update]:
+    """One update per distinct documentation section link."""
     updates = []
-
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-        response = await client.get(CLAUDE_CODE_DOCS_URL, headers=HEADERS)
-        response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(html, "html.parser")
 
     # Extract documentation sections/features
     sections = soup.select("a[href*='/docs/claude-code'], nav a, .sidebar a")
@@ -289,18 +387,74 @@ async def fetch_claude_code_docs() -> list[Update]:
         except Exception as e:
             logger.debug("Skipping doc section: %s", e)
             continue
+    return updates
+
+
+async def fetch_claude_code_docs(client: Optional[httpx.AsyncClient] = None) -> list[Update]:
+    """Fetch current Claude Code documentation structure for gap analysis."""
+    async with borrow_client(client) as client:
+        response = await client.get(CLAUDE_CODE_DOCS_URL, headers=HEADERS)
+        response.raise_for_status()
+
+    updates = await run_parse(_parse_docs_index, response.text)
 
     logger.info("Claude Code Docs: found %d sections", len(updates))
     return updates
 
 
-async def fetch_github_releases(days_back: int = 30) -> list[Update]:
-    """Fetch recent releases from the Claude Code GitHub repository."""
+def _parse_github_releases_page(html: str, cutoff: datetime) -> list[Update]:
+    """Releases on the GitHub releases HTML page published after ``cutoff``."""
+    updates = []
+    soup = BeautifulSoup(html, "html.parser")
+    release_entries = soup.select("[data-test-selector='release-entry'], .release, section")
+
+    for entry in release_entries[:20]:
+        title_el = entry.select_one("h2 a, .release-title a, a[href*='/releases/tag/']")
+        if not title_el:
+            continue
+
+        title = title_el.get_text(strip=True)
+        href = title_el.get("href", "")
+        url = f"https://github.com{href}" if href.startswith("/") else href
+
+        body_el = entry.select_one(".markdown-body, .release-body")
+        body = body_el.get_text(strip=True)[:500] if body_el else ""
+
+        date_el = entry.select_one("relative-time, time")
+        date = date_el.get("datetime", "") if date_el else ""
+
+        if date and not _is_within_window(date, cutoff):
+            continue
+
+        updates.append(Update(
+            source="github_releases",
+            title=f"Claude Code {title}",
+            content=body or title,
+            url=url,
+            date=date or datetime.now(timezone.utc).isoformat(),
+            tags=["claude-code", "release"] + _extract_tags(f"{title} {body}".lower()),
+        ))
+    return updates
+
+
+async def fetch_github_releases(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    watermark: Optional[Watermark] = None,
+) -> list[Update]:
+    """Fetch recent releases from the Claude Code GitHub repository.
+
+    With a ``watermark`` only releases published after the newest one
+    already seen are reported.  The releases API has no ``since``
+    parameter, but lists newest first, so reading stops at the first
+    release already seen.
+    """
     updates = []
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+    since = watermark.since() if watermark else None
 
     # Try the GitHub API first (structured JSON, no auth needed for public repos)
-    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+    async with borrow_client(client) as client:
         try:
             response = await client.get(
                 GITHUB_RELEASES_API,
@@ -319,7 +473,12 @@ async def fetch_github_releases(days_back: int = 30) -> list[Update]:
                 tag = release.get("tag_name", "")
                 url = release.get("html_url", GITHUB_RELEASES_URL)
                 date = release.get("published_at", "")
+                published = _parse_iso(date) if date else None
 
+                if not _is_newer(published, since):
+                    break  # Newest first — the rest were seen on an earlier run
+                if watermark and published:
+                    watermark.advance(published, url)
                 if not title:
                     continue
 
@@ -337,58 +496,96 @@ async def fetch_github_releases(days_back: int = 30) -> list[Update]:
                     tags=["claude-code", "release"] + _extract_tags(f"{title} {body}".lower()),
                 ))
 
+            if watermark:
+                watermark.read = True
             logger.info("GitHub Releases (API): found %d updates", len(updates))
             return updates
 
         except Exception as e:
             logger.warning("GitHub API failed, trying HTML fallback: %s", e)
 
-    # Fallback: scrape the releases HTML page
-    try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+        # Fallback: scrape the releases HTML page
+        try:
             response = await client.get(GITHUB_RELEASES_URL, headers=HEADERS)
             response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        release_entries = soup.select("[data-test-selector='release-entry'], .release, section")
+            updates.extend(
+                u for u in await run_parse(_parse_github_releases_page, response.text, cutoff)
+                if _is_newer(_parse_iso(u.date), since)
+            )
 
-        for entry in release_entries[:20]:
-            title_el = entry.select_one("h2 a, .release-title a, a[href*='/releases/tag/']")
-            if not title_el:
-                continue
+            logger.info("GitHub Releases (HTML): found %d updates", len(updates))
+        except Exception as e:
+            logger.warning("GitHub HTML fallback also failed: %s", e)
 
-            title = title_el.get_text(strip=True)
-            href = title_el.get("href", "")
-            url = f"https://github.com{href}" if href.startswith("/") else href
+    return updates
 
-            body_el = entry.select_one(".markdown-body, .release-body")
-            body = body_el.get_text(strip=True)[:500] if body_el else ""
 
-            date_el = entry.select_one("relative-time, time")
-            date = date_el.get("datetime", "") if date_el else ""
+def _parse_youtube_page(html: str, url: str) -> list[Update]:
+    """Claude-relevant videos on a channel's videos page."""
+    updates = []
+    soup = BeautifulSoup(html, "html.parser")
+
+    # YouTube embeds video data in script tags as JSON
+    scripts = soup.find_all("script")
+    for script in scripts:
+        text = script.get_text()
+        if "videoRenderer" not in text and "gridVideoRenderer" not in text:
+            continue
 
-            if date and not _is_within_window(date, cutoff):
+        # Extract video titles using regex
+        title_matches = re.findall(r'"title":\{"runs":\[\{"text":"([^"]+)"\}', text)
+        video_id_matches = re.findall(r'"videoId":"([^"]+)"', text)
+        desc_matches = re.findall(r'"descriptionSnippet":\{"runs":\[\{"text":"([^"]+)"', text)
+
+        for i, title in enumerate(title_matches[:15]):
+            if not _is_claude_relevant(title.lower()):
                 continue
 
+            video_id = video_id_matches[i] if i < len(video_id_matches) else ""
+            desc = desc_matches[i] if i < len(desc_matches) else ""
+            video_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else url
+
             updates.append(Update(
-                source="github_releases",
-                title=f"Claude Code {title}",
-                content=body or title,
-                url=url,
-                date=date or datetime.now(timezone.utc).isoformat(),
-                tags=["claude-code", "release"] + _extract_tags(f"{title} {body}".lower()),
+                source="youtube_anthropic",
+                title=title,
+                content=desc or title,
+                url=video_url,
+                date=datetime.now(timezone.utc).isoformat(),
+                tags=["video"] + _extract_tags(f"{title} {desc}".lower()),
             ))
 
-        logger.info("GitHub Releases (HTML): found %d updates", len(updates))
-    except Exception as e:
-        logger.warning("GitHub HTML fallback also failed: %s", e)
+        if updates:
+            break  # Got data from script tags
 
+    # Fallback: try meta tags
+    if not updates:
+        meta_tags = soup.find_all("meta", {"property": "og:title"})
+        for meta in meta_tags:
+            title = meta.get("content", "")
+            if _is_claude_relevant(title.lower()):
+                updates.append(Update(
+                    source="youtube_anthropic",
+                    title=title,
+                    content=title,
+                    url=url,
+                    date=datetime.now(timezone.utc).isoformat(),
+                    tags=["video"] + _extract_tags(title.lower()),
+                ))
     return updates
 
 
-async def fetch_anthropic_youtube(days_back: int = 30) -> list[Update]:
-    """Fetch recent videos from Anthropic's YouTube channel."""
+async def fetch_anthropic_youtube(
+    days_back: int = 30, client: Optional[httpx.AsyncClient] = None, strict: bool = False,
+) -> list[Update]:
+    """Fetch recent videos from Anthropic's YouTube channel.
+
+    With ``strict``, raises the last error when no channel URL answered
+    instead of returning ``[]``.
+    """
     updates = []
+    answered = False
+    failure: Optional[Exception] = None
 
     # YouTube channel page — scrape video titles and descriptions
     urls_to_try = [
@@ -396,220 +593,361 @@ async def fetch_anthropic_youtube(days_back: int = 30) -> list[Update]:
         "https://www.youtube.com/@AnthropicAI/videos",
     ]
 
-    for url in urls_to_try:
-        try:
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+    # One client for every candidate URL — the second try reuses the connection
+    async with borrow_client(client) as client:
+        for url in urls_to_try:
+            try:
                 response = await client.get(url, headers=HEADERS)
                 if response.status_code != 200:
+                    failure = RuntimeError(f"HTTP {response.status_code} from {url}")
                     continue
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # YouTube embeds video data in script tags as JSON
-            scripts = soup.find_all("script")
-            for script in scripts:
-                text = script.get_text()
-                if "videoRenderer" not in text and "gridVideoRenderer" not in text:
-                    continue
+                updates = await run_parse(_parse_youtube_page, response.text, url)
+                answered = True
+                if updates:
+                    break  # Found results from this URL
 
-                # Extract video titles using regex
-                title_matches = re.findall(r'"title":\{"runs":\[\{"text":"([^"]+)"\}', text)
-                video_id_matches = re.findall(r'"videoId":"([^"]+)"', text)
-                desc_matches = re.findall(r'"descriptionSnippet":\{"runs":\[\{"text":"([^"]+)"', text)
+            except Exception as e:
+                logger.debug("YouTube fetch failed for %s: %s", url, e)
+                failure = e
+                continue
 
-                for i, title in enumerate(title_matches[:15]):
-                    if not _is_claude_relevant(title.lower()):
-                        continue
+    if strict and not answered and failure is not None:
+        raise failure
+    logger.info("Anthropic YouTube: found %d updates", len(updates))
+    return updates
 
-                    video_id = video_id_matches[i] if i < len(video_id_matches) else ""
-                    desc = desc_matches[i] if i < len(desc_matches) else ""
-                    video_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else url
 
-                    updates.append(Update(
-                        source="youtube_anthropic",
-                        title=title,
-                        content=desc or title,
-                        url=video_url,
-                        date=datetime.now(timezone.utc).isoformat(),
-                        tags=["video"] + _extract_tags(f"{title} {desc}".lower()),
-                    ))
+def _parse_reddit_page(html: str) -> list[Update]:
+    """Claude-relevant post links on the subreddit HTML page."""
+    updates = []
+    soup = BeautifulSoup(html, "html.parser")
+    post_links = soup.select("a[href*='/r/ClaudeAI/comments/']")
 
-                if updates:
-                    break  # Got data from script tags
-
-            # Fallback: try meta tags
-            if not updates:
-                meta_tags = soup.find_all("meta", {"property": "og:title"})
-                for meta in meta_tags:
-                    title = meta.get("content", "")
-                    if _is_claude_relevant(title.lower()):
-                        updates.append(Update(
-                            source="youtube_anthropic",
-                            title=title,
-                            content=title,
-                            url=url,
-                            date=datetime.now(timezone.utc).isoformat(),
-                            tags=["video"] + _extract_tags(title.lower()),
-                        ))
-
-            if updates:
-                break  # Found results from this URL
+    seen_urls = set()
+    for link in post_links[:30]:
+        title = link.get_text(strip=True)
+        href = link.get("href", "")
+        if not title or len(title) < 10 or href in seen_urls:
+            continue
+        seen_urls.add(href)
 
-        except Exception as e:
-            logger.debug("YouTube fetch failed for %s: %s", url, e)
+        if not _is_claude_relevant(title.lower()):
             continue
 
-    logger.info("Anthropic YouTube: found %d updates", len(updates))
+        full_url = href if href.startswith("http") else f"https://www.reddit.com{href}"
+
+        updates.append(Update(
+            source="reddit_claude",
+            title=title,
+            content=title,
+            url=full_url,
+            date=datetime.now(timezone.utc).isoformat(),
+            tags=["community"] + _extract_tags(title.lower()),
+        ))
     return updates
 
 
-async def fetch_reddit_claude(days_back: int = 30) -> list[Update]:
-    """Fetch recent posts from r/ClaudeAI subreddit."""
+REDDIT_SCORE_SETTLE = timedelta(days=1)  # Posts younger than this may still gain score
+REDDIT_PAGE_SIZE = 50
+REDDIT_MAX_PAGES = 6  # Incremental runs page back to the anchor, at most this far
+
+
+async def fetch_reddit_claude(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    watermark: Optional[Watermark] = None,
+    strict: bool = False,
+) -> list[Update]:
+    """Fetch recent posts from r/ClaudeAI subreddit.
+
+    With a ``watermark`` the newest-first listing is paged (``after``)
+    until its anchor post — or, if that was deleted, the first post at or
+    before its date — is reached.  The watermark advances only past posts
+    older than ``REDDIT_SCORE_SETTLE``, so a young post filtered out for
+    its low score is looked at again on the next run.
+
+    With ``strict``, raises when both the JSON listing and the HTML
+    fallback fail instead of returning ``[]``.
+    """
     updates = []
-    cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp()
+    failure: Optional[Exception] = None
+    now = datetime.now(timezone.utc)
+    cutoff_ts = (now - timedelta(days=days_back)).timestamp()
+    since = watermark.since() if watermark else None
 
-    # Reddit provides JSON feeds without authentication
-    try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+    async with borrow_client(client) as client:
+        async def list_posts(params: dict) -> dict:
             response = await client.get(
                 REDDIT_CLAUDE_JSON,
                 headers={
                     "User-Agent": "CurriculumUpdater/1.0 (Claude Code Learning Tool)",
                     "Accept": "application/json",
                 },
-                params={"limit": 50},
+                params=params,
             )
             response.raise_for_status()
-            data = response.json()
+            return response.json().get("data", {})
 
-        posts = data.get("data", {}).get("children", [])
-
-        for post in posts:
-            post_data = post.get("data", {})
-            title = post_data.get("title", "")
-            selftext = post_data.get("selftext", "")
-            url = post_data.get("url", "")
-            permalink = post_data.get("permalink", "")
+        def seen(post_data: dict) -> bool:
+            """True once the listing reaches the watermark's anchor or leaves the window."""
+            if since is None:
+                return False
             created = post_data.get("created_utc", 0)
-            score = post_data.get("score", 0)
-            flair = post_data.get("link_flair_text", "") or ""
+            created_at = datetime.fromtimestamp(created, tz=timezone.utc) if created else None
+            return (
+                post_data.get("name") == watermark.last_id
+                or not _is_newer(created_at, since)
+                or bool(created and created < cutoff_ts)
+            )
 
-            if not title:
-                continue
+        # Reddit provides JSON feeds without authentication
+        try:
+            posts: list[dict] = []
+            params = {"limit": REDDIT_PAGE_SIZE}
+            for _ in range(REDDIT_MAX_PAGES if since else 1):
+                listing = await list_posts(params)
+                page = listing.get("children", [])
+                fresh = list(takewhile(lambda post: not seen(post.get("data", {})), page))
+                posts.extend(fresh)
+                if len(fresh) < len(page) or not listing.get("after"):
+                    break
+                params = {"limit": REDDIT_PAGE_SIZE, "after": listing["after"]}
+            else:
+                if since:
+                    logger.info("Reddit (JSON): anchor not reached within %d posts", len(posts))
+
+            for post in posts:
+                post_data = post.get("data", {})
+                title = post_data.get("title", "")
+                selftext = post_data.get("selftext", "")
+                url = post_data.get("url", "")
+                permalink = post_data.get("permalink", "")
+                created = post_data.get("created_utc", 0)
+                score = post_data.get("score", 0)
+                flair = post_data.get("link_flair_text", "") or ""
+                created_at = datetime.fromtimestamp(created, tz=timezone.utc) if created else None
+
+                if watermark and created_at and created_at <= now - REDDIT_SCORE_SETTLE:
+                    watermark.advance(created_at, post_data.get("name", ""))
+                if not title:
+                    continue
 
-            # Filter by date window
-            if created and created < cutoff_ts:
-                continue
+                # Filter by date window
+                if created and created < cutoff_ts:
+                    continue
 
-            combined = f"{title} {selftext} {flair}".lower()
+                combined = f"{title} {selftext} {flair}".lower()
 
-            if not _is_claude_relevant(combined):
-                continue
+                if not _is_claude_relevant(combined):
+                    continue
 
-            if score < 5:
-                continue
+                if score < 5:
+                    continue
 
-            post_url = f"https://www.reddit.com{permalink}" if permalink else url
-            date_str = datetime.fromtimestamp(created, tz=timezone.utc).isoformat() if created else ""
+                post_url = f"https://www.reddit.com{permalink}" if permalink else url
+                date_str = datetime.fromtimestamp(created, tz=timezone.utc).isoformat() if created else ""
 
-            updates.append(Update(
-                source="reddit_claude",
-                title=title,
-                content=selftext[:500] if selftext else title,
-                url=post_url,
-                date=date_str,
-                tags=["community"] + _extract_tags(combined),
-            ))
+                updates.append(Update(
+                    source="reddit_claude",
+                    title=title,
+                    content=selftext[:500] if selftext else title,
+                    url=post_url,
+                    date=date_str,
+                    tags=["community"] + _extract_tags(combined),
+                ))
 
-        logger.info("Reddit (JSON): found %d updates", len(updates))
+            if watermark:
+                watermark.read = True
+            logger.info("Reddit (JSON): found %d updates", len(updates))
 
-    except Exception as e:
-        logger.warning("Reddit JSON feed failed, trying HTML: %s", e)
+        except Exception as e:
+            logger.warning("Reddit JSON feed failed, trying HTML: %s", e)
+            failure = e
 
-    # Fallback: scrape HTML if JSON fails
-    if not updates:
-        try:
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+        # Fallback: scrape HTML if JSON fails (or, without a watermark, is empty)
+        if not updates and not (watermark and watermark.read):
+            try:
                 response = await client.get(REDDIT_CLAUDE_URL, headers=HEADERS)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    post_links = soup.select("a[href*='/r/ClaudeAI/comments/']")
-
-                    seen_urls = set()
-                    for link in post_links[:30]:
-                        title = link.get_text(strip=True)
-                        href = link.get("href", "")
-                        if not title or len(title) < 10 or href in seen_urls:
-                            continue
-                        seen_urls.add(href)
-
-                        if not _is_claude_relevant(title.lower()):
-                            continue
-
-                        full_url = href if href.startswith("http") else f"https://www.reddit.com{href}"
-
-                        updates.append(Update(
-                            source="reddit_claude",
-                            title=title,
-                            content=title,
-                            url=full_url,
-                            date=datetime.now(timezone.utc).isoformat(),
-                            tags=["community"] + _extract_tags(title.lower()),
-                        ))
+                    updates = await run_parse(_parse_reddit_page, response.text)
+                    failure = None
 
                     logger.info("Reddit (HTML fallback): found %d updates", len(updates))
-        except Exception as e:
-            logger.warning("Reddit HTML fallback also failed: %s", e)
+            except Exception as e:
+                logger.warning("Reddit HTML fallback also failed: %s", e)
 
+    if strict and failure is not None:
+        raise failure
     return updates
 
 
 # --- Tier 1: Structured Feed Fetchers ---
+#
+# Atom/RSS feeds are streamed (``feeds.read_feed``): reading stops at the
+# entry cap, or for feeds sorted newest-first at the window's cutoff, and
+# the entries go through the conditional-GET cache.  The npm packument is
+# streamed too (``cached_stream``), keeping only a plain dict that does not
+# depend on ``days_back``.  Either way, on a 304 the stored entries are
+# reused and only the cheap window/relevance filtering runs.
+
+GITHUB_ATOM_FEED = FeedSpec(
+    entry_tag=ATOM_ENTRY,
+    extract=extract_atom_entry,
+    limit=30,
+    parse_key="github-atom-v2",
+    finish=partial(atom_bodies, separator="\n"),
+    entry_date=atom_entry_date,
+)
+
+# r/ClaudeAI's feed is ordered by rank, not date: only the cap applies
+REDDIT_ATOM_FEED = FeedSpec(
+    entry_tag=ATOM_ENTRY,
+    extract=extract_atom_entry,
+    limit=50,
+    parse_key="reddit-atom-v2",
+    finish=partial(atom_bodies, separator=" "),
+)
+
+def _extract_pypi_item(element) -> dict:
+    item = extract_rss_item(element)
+    item["version"] = item.pop("title")
+    return item
+
+
+PYPI_RSS_FEED = FeedSpec(
+    entry_tag=RSS_ITEM,
+    extract=_extract_pypi_item,
+    limit=20,
+    parse_key="pypi-rss-v2",
+    entry_date=rss_item_date,
+)
+
+
+def _parse_npm_packument(json_text: str) -> dict:
+    """Keep only the parts of the npm packument we use."""
+    data = json.loads(json_text)
+    return {
+        "latest": data.get("dist-tags", {}).get("latest", ""),
+        "time": data.get("time", {}),
+    }
+
+
+async def _read_npm_packument(response: httpx.Response) -> dict:
+    """``_parse_npm_packument`` of a streamed packument.
+
+    With ``ijson`` installed (``pip install ijson``) only the ``dist-tags``
+    and ``time`` keys are picked out of the event stream — the per-version
+    manifests, which are most of the document, are never materialised —
+    and reading stops once both have been seen (``time`` precedes the
+    large ``readme``).  Without it the body is read and parsed in full on
+    the parse pool.
+    """
+    if _ijson is None:
+        await response.aread()
+        return await run_parse(_parse_npm_packument, response.text)
+
+    result: dict = {"latest": "", "time": {}}
+    done: set[str] = set()
+    events = _ijson.sendable_list()
+    parser = _ijson.parse_coro(events)
+
+    def collect() -> None:
+        for prefix, event, value in events:
+            if event == "end_map" and prefix in ("dist-tags", "time"):
+                done.add(prefix)
+            elif event != "string":
+                continue
+            elif prefix == "dist-tags.latest":
+                result["latest"] = value
+            elif prefix.startswith("time."):
+                result["time"][prefix[len("time."):]] = value
+        del events[:]
 
-async def fetch_github_releases_atom(days_back: int = 30) -> list[Update]:
-    """Fetch releases via GitHub's Atom feed (more reliable than API for unauthenticated use)."""
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        collect()
+        if len(done) == 2:
+            return result  # Rest of the document is unused (and incomplete)
+    parser.close()  # End of input: flush the final events
+    collect()
+    return result
+
+
+NPM_MAX_RELEASES = 30  # Most versions reported per run
+
+
+def _recent_npm_versions(
+    time_map: dict[str, str], cutoff: datetime, limit: int = NPM_MAX_RELEASES,
+) -> list[tuple[datetime, str]]:
+    """The newest ``limit`` versions published since ``cutoff``, newest first.
+
+    Keeps a ``limit``-sized min-heap instead of sorting the whole
+    (ever-growing) time map.
+    """
+    heap: list[tuple[datetime, str]] = []
+    for version, published_at in time_map.items():
+        if version in ("created", "modified"):
+            continue
+        try:
+            dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+        except (AttributeError, ValueError):
+            continue
+        if dt < cutoff:
+            continue
+        if len(heap) < limit:
+            heapq.heappush(heap, (dt, version))
+        elif (dt, version) > heap[0]:
+            heapq.heapreplace(heap, (dt, version))
+    return sorted(heap, reverse=True)
+
+
+async def fetch_github_releases_atom(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    watermark: Optional[Watermark] = None,
+) -> list[Update]:
+    """Fetch releases via GitHub's Atom feed (more reliable than API for unauthenticated use).
+
+    With a ``watermark`` the feed is read only down to the newest release
+    already seen.
+    """
     updates = []
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+    since = watermark.since() if watermark else None
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(GITHUB_RELEASES_ATOM, headers=HEADERS)
-            response.raise_for_status()
-
-        root = ET.fromstring(response.text)
-        entries = root.findall(f"{{{ATOM_NS}}}entry")
-
-        for entry in entries[:30]:
-            title_el = entry.find(f"{{{ATOM_NS}}}title")
-            updated_el = entry.find(f"{{{ATOM_NS}}}updated")
-            link_el = entry.find(f"{{{ATOM_NS}}}link[@rel='alternate']")
-            content_el = entry.find(f"{{{ATOM_NS}}}content")
+        async with borrow_client(client) as client:
+            entries = await read_feed(
+                client, GITHUB_RELEASES_ATOM, GITHUB_ATOM_FEED,
+                cutoff=max(cutoff, since) if since else cutoff, headers=HEADERS,
+            )
 
-            title = title_el.text.strip() if title_el is not None and title_el.text else ""
-            date_str = updated_el.text.strip() if updated_el is not None and updated_el.text else ""
-            url = link_el.get("href", GITHUB_RELEASES_URL) if link_el is not None else GITHUB_RELEASES_URL
+        for entry in entries:
+            title = entry["title"]
+            date_str = entry["date"]
+            body = entry["body"]
+            published = atom_entry_date(entry)
 
-            if not title:
+            if watermark and published:
+                watermark.advance(published, entry["url"])
+            if not title or not _is_newer(published, since):
                 continue
 
             if date_str and not _is_within_window(date_str, cutoff):
                 continue
 
-            # Extract text from HTML content
-            body = ""
-            if content_el is not None and content_el.text:
-                soup = BeautifulSoup(content_el.text, "html.parser")
-                body = soup.get_text(separator="\n", strip=True)[:500]
-
             updates.append(Update(
                 source="github_releases",
                 title=f"Claude Code {title}",
                 content=f"Release {title}: {body}" if body else f"Release {title}",
-                url=url,
+                url=entry["url"] or GITHUB_RELEASES_URL,
                 date=date_str or datetime.now(timezone.utc).isoformat(),
                 tags=["claude-code", "release"] + _extract_tags(f"{title} {body}".lower()),
             ))
 
+        if watermark:
+            watermark.read = True
         logger.info("GitHub Releases (Atom feed): found %d updates", len(updates))
     except Exception as e:
         logger.warning("GitHub Atom feed failed: %s", e)
@@ -617,36 +955,30 @@ async def fetch_github_releases_atom(days_back: int = 30) -> list[Update]:
     return updates
 
 
-async def fetch_reddit_atom(days_back: int = 30) -> list[Update]:
-    """Fetch posts from r/ClaudeAI via Atom feed (more reliable than JSON API)."""
+async def fetch_reddit_atom(
+    days_back: int = 30, client: Optional[httpx.AsyncClient] = None, strict: bool = False,
+) -> list[Update]:
+    """Fetch posts from r/ClaudeAI via Atom feed (more reliable than JSON API).
+
+    With ``strict``, a failed fetch raises instead of returning ``[]``.
+    """
     updates = []
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(
-                REDDIT_CLAUDE_RSS,
+        async with borrow_client(client) as client:
+            entries = await read_feed(
+                client, REDDIT_CLAUDE_RSS, REDDIT_ATOM_FEED,
                 headers={
                     "User-Agent": "CurriculumUpdater/1.0 (Claude Code Learning Tool)",
                     "Accept": "application/atom+xml, application/xml, text/xml",
                 },
             )
-            response.raise_for_status()
 
-        root = ET.fromstring(response.text)
-        entries = root.findall(f"{{{ATOM_NS}}}entry")
-
-        for entry in entries[:50]:
-            title_el = entry.find(f"{{{ATOM_NS}}}title")
-            updated_el = entry.find(f"{{{ATOM_NS}}}updated")
-            link_el = entry.find(f"{{{ATOM_NS}}}link[@rel='alternate']")
-            content_el = entry.find(f"{{{ATOM_NS}}}content")
-            category_el = entry.find(f"{{{ATOM_NS}}}category")
-
-            title = title_el.text.strip() if title_el is not None and title_el.text else ""
-            date_str = updated_el.text.strip() if updated_el is not None and updated_el.text else ""
-            url = link_el.get("href", REDDIT_CLAUDE_URL) if link_el is not None else REDDIT_CLAUDE_URL
-            flair = category_el.get("term", "") if category_el is not None else ""
+        for entry in entries:
+            title = entry["title"]
+            date_str = entry["date"]
+            body = entry["body"]
 
             if not title:
                 continue
@@ -654,13 +986,7 @@ async def fetch_reddit_atom(days_back: int = 30) -> list[Update]:
             if date_str and not _is_within_window(date_str, cutoff):
                 continue
 
-            # Extract text from HTML content
-            body = ""
-            if content_el is not None and content_el.text:
-                soup = BeautifulSoup(content_el.text, "html.parser")
-                body = soup.get_text(separator=" ", strip=True)[:500]
-
-            combined = f"{title} {body} {flair}".lower()
+            combined = f"{title} {body} {entry['category']}".lower()
             if not _is_claude_relevant(combined):
                 continue
 
@@ -668,7 +994,7 @@ async def fetch_reddit_atom(days_back: int = 30) -> list[Update]:
                 source="reddit_claude",
                 title=title,
                 content=body[:500] if body else title,
-                url=url,
+                url=entry["url"] or REDDIT_CLAUDE_URL,
                 date=date_str or datetime.now(timezone.utc).isoformat(),
                 tags=["community"] + _extract_tags(combined),
             ))
@@ -676,39 +1002,47 @@ async def fetch_reddit_atom(days_back: int = 30) -> list[Update]:
         logger.info("Reddit (Atom feed): found %d updates", len(updates))
     except Exception as e:
         logger.warning("Reddit Atom feed failed: %s", e)
+        if strict:
+            raise
 
     return updates
 
 
-async def fetch_pypi_releases(days_back: int = 30) -> list[Update]:
-    """Fetch Anthropic Python SDK releases from PyPI RSS feed."""
+async def fetch_pypi_releases(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    watermark: Optional[Watermark] = None,
+) -> list[Update]:
+    """Fetch Anthropic Python SDK releases from PyPI RSS feed.
+
+    With a ``watermark`` the feed is read only down to the newest release
+    already seen.
+    """
     updates = []
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+    since = watermark.since() if watermark else None
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(PYPI_RSS_URL, headers=HEADERS)
-            response.raise_for_status()
-
-        root = ET.fromstring(response.text)
-        items = root.findall(".//item")
-
-        for item in items[:20]:
-            title_el = item.find("title")
-            link_el = item.find("link")
-            pubdate_el = item.find("pubDate")
+        async with borrow_client(client) as client:
+            items = await read_feed(
+                client, PYPI_RSS_URL, PYPI_RSS_FEED,
+                cutoff=max(cutoff, since) if since else cutoff, headers=HEADERS,
+            )
 
-            version = title_el.text.strip() if title_el is not None and title_el.text else ""
-            url = link_el.text.strip() if link_el is not None and link_el.text else ""
-            date_str = pubdate_el.text.strip() if pubdate_el is not None and pubdate_el.text else ""
+        for item in items:
+            version = item["version"]
+            url = item["url"]
+            date_str = item["date"]
+            published = rss_item_date(item)
 
-            if not version:
+            if watermark and published:
+                watermark.advance(published, version)
+            if not version or not _is_newer(published, since):
                 continue
 
             # Parse RFC 2822 date format from RSS
             if date_str:
                 try:
-                    from email.utils import parsedate_to_datetime
                     dt = parsedate_to_datetime(date_str)
                     if dt < cutoff:
                         continue
@@ -725,6 +1059,8 @@ async def fetch_pypi_releases(days_back: int = 30) -> list[Update]:
                 tags=["sdk", "python", "release"],
             ))
 
+        if watermark:
+            watermark.read = True
         logger.info("PyPI Releases (RSS): found %d updates", len(updates))
     except Exception as e:
         logger.warning("PyPI RSS feed failed: %s", e)
@@ -732,37 +1068,38 @@ async def fetch_pypi_releases(days_back: int = 30) -> list[Update]:
     return updates
 
 
-async def fetch_npm_releases(days_back: int = 30) -> list[Update]:
-    """Fetch Claude Code npm package releases from the npm registry API."""
+async def fetch_npm_releases(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    watermark: Optional[Watermark] = None,
+) -> list[Update]:
+    """Fetch Claude Code npm package releases from the npm registry API.
+
+    With a ``watermark`` only versions published after the newest one
+    already seen are reported.
+    """
     updates = []
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+    since = watermark.since() if watermark else None
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(
-                NPM_REGISTRY_URL,
+        async with borrow_client(client) as client:
+            # The abbreviated ("corgi") document lacks the per-version
+            # ``time`` map, so the full packument is streamed instead
+            data = await cached_stream(
+                client, NPM_REGISTRY_URL, _read_npm_packument, "npm-packument-v2",
                 headers={"Accept": "application/json"},
             )
-            response.raise_for_status()
-            data = response.json()
 
-        time_map = data.get("time", {})
-        dist_tags = data.get("dist-tags", {})
-        latest_version = dist_tags.get("latest", "")
+        latest_version = data["latest"]
 
         # Get versions published within the time window
-        for version, published_at in sorted(time_map.items(), key=lambda x: x[1], reverse=True):
-            if version in ("created", "modified"):
+        for dt, version in _recent_npm_versions(data["time"], max(cutoff, since) if since else cutoff):
+            if watermark:
+                watermark.advance(dt, version)
+            if not _is_newer(dt, since):
                 continue
-
-            try:
-                dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-                if dt < cutoff:
-                    break  # Sorted desc — all remaining are older
-                date_str = dt.isoformat()
-            except Exception:
-                date_str = published_at
-
+            date_str = dt.isoformat()
             is_latest = version == latest_version
             title = f"Claude Code npm {version}"
             if is_latest:
@@ -777,6 +1114,8 @@ async def fetch_npm_releases(days_back: int = 30) -> list[Update]:
                 tags=["claude-code", "npm", "release"],
             ))
 
+        if watermark:
+            watermark.read = True
         logger.info("npm Registry: found %d updates", len(updates))
     except Exception as e:
         logger.warning("npm registry fetch failed: %s", e)
@@ -789,71 +1128,108 @@ class FetchResult:
     """Result of fetching from all sources, including any errors."""
     updates: list[Update]
     errors: list[str]
+    # Incremental runs: advanced watermarks, persisted by ``commit_watermarks``
+    watermarks: dict[str, Watermark] = field(default_factory=dict)
+
+
+# Sources that can fetch incrementally, and the watermark each one keeps.
+# The GitHub HTML/API fallback reads the same releases as the Atom feed;
+# r/ClaudeAI's Atom feed is rank-ordered, so it has no usable high-water
+# mark (its conditional GET still skips an unchanged feed).
+WATERMARK_KEYS = {
+    "GitHub Releases (Atom)": "github_releases",
+    "GitHub Releases (HTML)": "github_releases",
+    "PyPI Releases (RSS)": "pypi_releases",
+    "npm Registry (API)": "npm_releases",
+    "Reddit r/ClaudeAI (JSON)": "reddit_json",
+}
 
-
-async def fetch_all_updates(days_back: int = 30) -> FetchResult:
+# Sources known to stall intermittently; hedged once latency data exists.
+# Their fetchers run with ``strict=True`` so a failed attempt raises rather
+# than returning [] — otherwise a fast failure would beat a working hedge.
+HEDGED_SOURCES = frozenset({
+    "Reddit r/ClaudeAI (Atom)",
+    "Reddit r/ClaudeAI (JSON)",
+    "Anthropic YouTube",
+})
+
+
+async def fetch_all_updates(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    budget: float = FETCH_BUDGET,
+    source_deadline: float = SOURCE_DEADLINE,
+    hedge: bool = True,
+    incremental: bool = False,
+) -> FetchResult:
     """Fetch updates from all sources. Returns combined, deduplicated list plus errors.
 
     Uses Tier 1 feeds (structured APIs) as primary sources, with Tier 2
-    scrapers for sources that don't provide feeds. If a Tier 1 feed fails,
-    falls back to the equivalent Tier 2 scraper.
+    scrapers for sources that don't provide feeds. Both tiers start at
+    once; if a Tier 1 feed fails (or is empty), its equivalent Tier 2
+    scraper starts immediately, without waiting for the rest of the tier.
+
+    The run is bounded by ``budget`` seconds and each source (and each
+    fallback) by ``source_deadline``; sources that miss either are listed
+    in ``errors`` and the rest are returned.  With ``hedge``, sources in
+    ``HEDGED_SOURCES`` get a second request once they run past their
+    usual p90 latency (see ``deadlines``).
+
+    All fetchers share one pooled ``client`` (opened here if not given), so
+    each host pays for at most one TLS handshake per run.
+
+    With ``incremental``, sources in ``WATERMARK_KEYS`` start from their
+    stored watermarks and report only entries newer than them.  The
+    advanced watermarks come back in ``FetchResult.watermarks``; they are
+    not saved until the caller has processed the updates and calls
+    ``commit_watermarks``, so a run that fails part-way is simply redone.
     """
-    all_updates = []
-    errors = []
-
-    # Tier 1 feeds — reliable structured data
-    tier1_fetchers = {
-        "GitHub Releases (Atom)": fetch_github_releases_atom(days_back),
-        "Reddit r/ClaudeAI (Atom)": fetch_reddit_atom(days_back),
-        "PyPI Releases (RSS)": fetch_pypi_releases(days_back),
-        "npm Registry (API)": fetch_npm_releases(days_back),
+    watermarks = get_watermarks() if incremental else None
+    results = [
+        result async for result in _iter_source_results(
+            days_back, client, budget, source_deadline, hedge, watermarks,
+        )
+    ]
+    result = assemble_fetch_result(results)
+    if watermarks is not None:
+        result.watermarks = {key: mark for key, mark in watermarks.items() if mark.read}
+    return result
+
+
+def get_watermarks() -> dict[str, Watermark]:
+    """Stored watermarks for every incremental source (empty if never read)."""
+    stored = load_watermarks()
+    return {
+        key: Watermark(**stored[key]) if key in stored else Watermark()
+        for key in dict.fromkeys(WATERMARK_KEYS.values())
     }
 
-    # Tier 2 scrapers — best-effort HTML scraping
-    tier2_fetchers = {
-        "Boris Cherny X": fetch_boris_x_posts(days_back),
-        "Anthropic Blog": fetch_anthropic_blog(days_back),
-        "Anthropic Changelog": fetch_anthropic_changelog(days_back),
-        "Claude Code Docs": fetch_claude_code_docs(),
-        "Anthropic YouTube": fetch_anthropic_youtube(days_back),
-    }
 
-    # Run all Tier 1 feeds first
-    tier1_settled = await asyncio.gather(
-        *tier1_fetchers.values(), return_exceptions=True
-    )
+def commit_watermarks(result: FetchResult) -> None:
+    """Persist the watermarks of an incremental run once its updates are processed."""
+    if result.watermarks:
+        store_watermarks({
+            key: {"date": mark.date, "last_id": mark.last_id}
+            for key, mark in result.watermarks.items() if mark.date
+        })
+
+
+@dataclass
+class SourceResult:
+    """One source's outcome in a fetch run, delivered as soon as it completes."""
+    name: str
+    rank: int  # Position in the batch result's source order
+    updates: list[Update]
+    error: Optional[str] = None  # "<name>: <ExceptionType>: <message>"
 
-    github_from_feed = False
-    reddit_from_feed = False
-
-    for name, result in zip(tier1_fetchers, tier1_settled):
-        if isinstance(result, Exception):
-            logger.warning("Tier 1 source '%s' failed: %s", name, result)
-            errors.append(f"{name}: {type(result).__name__}: {result}")
-        elif result:
-            all_updates.extend(result)
-            if "GitHub" in name:
-                github_from_feed = True
-            if "Reddit" in name:
-                reddit_from_feed = True
-
-    # Add Tier 2 fallback scrapers for sources whose feeds failed
-    if not github_from_feed:
-        tier2_fetchers["GitHub Releases (HTML)"] = fetch_github_releases(days_back)
-    if not reddit_from_feed:
-        tier2_fetchers["Reddit r/ClaudeAI (JSON)"] = fetch_reddit_claude(days_back)
-
-    # Run Tier 2 scrapers
-    tier2_settled = await asyncio.gather(
-        *tier2_fetchers.values(), return_exceptions=True
-    )
 
-    for name, result in zip(tier2_fetchers, tier2_settled):
-        if isinstance(result, Exception):
-            logger.error("Tier 2 source '%s' failed: %s", name, result)
-            errors.append(f"{name}: {type(result).__name__}: {result}")
-        else:
-            all_updates.extend(result)
+def assemble_fetch_result(results: list[SourceResult]) -> FetchResult:
+    """Combine per-source results into the batch ``FetchResult``."""
+    # Reassemble in source order so dedup keeps the same items every run
+    results = sorted(results, key=lambda r: r.rank)
+
+    all_updates = [u for r in results for u in r.updates]
+    errors = [r.error for r in results if r.error]
 
     # Deduplicate by content hash (not just first N chars)
     seen_hashes = set()
@@ -864,20 +1240,353 @@ async def fetch_all_updates(days_back: int = 30) -> FetchResult:
             seen_hashes.add(h)
             unique_updates.append(u)
 
-    total_sources = len(tier1_fetchers) + len(tier2_fetchers)
     logger.info(
         "Total: %d unique updates from %d sources (%d errors)",
-        len(unique_updates), total_sources - len(errors), len(errors),
+        len(unique_updates), len(results) - len(errors), len(errors),
     )
     return FetchResult(updates=unique_updates, errors=errors)
 
 
+async def iter_source_results(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    budget: float = FETCH_BUDGET,
+    source_deadline: float = SOURCE_DEADLINE,
+    hedge: bool = True,
+) -> AsyncIterator[SourceResult]:
+    """Yield each source's result in completion order.
+
+    Same sources, fallbacks and limits as ``fetch_all_updates``; updates
+    already yielded earlier in the run (by content hash) are dropped.
+    Closing the iterator early cancels the sources still running.
+    """
+    seen_hashes: set[str] = set()
+    async for result in _iter_source_results(days_back, client, budget, source_deadline, hedge):
+        unique = []
+        for u in result.updates:
+            h = _content_hash(u)
+            if h not in seen_hashes:
+                seen_hashes.add(h)
+                unique.append(u)
+        result.updates = unique
+        yield result
+
+
+async def iter_updates(days_back: int = 30, client: Optional[httpx.AsyncClient] = None) -> AsyncIterator[Update]:
+    """Yield unique updates from all sources as each source completes."""
+    async for result in iter_source_results(days_back, client):
+        for update in result.updates:
+            yield update
+
+
+async def _iter_source_results(
+    days_back: int,
+    client: Optional[httpx.AsyncClient],
+    budget: float,
+    source_deadline: float,
+    hedge: bool,
+    watermarks: Optional[dict[str, Watermark]] = None,
+) -> AsyncIterator[SourceResult]:
+    def mark(name: str) -> Optional[Watermark]:
+        return watermarks.get(WATERMARK_KEYS.get(name, "")) if watermarks is not None else None
+
+    async with borrow_client(client) as client:
+        fetch_budget = FetchBudget(budget)
+
+        # Tier 1 feeds — reliable structured data
+        tier1_fetchers = {
+            "GitHub Releases (Atom)": lambda: fetch_github_releases_atom(
+                days_back, client, mark("GitHub Releases (Atom)"),
+            ),
+            "Reddit r/ClaudeAI (Atom)": lambda: fetch_reddit_atom(days_back, client, strict=True),
+            "PyPI Releases (RSS)": lambda: fetch_pypi_releases(days_back, client, mark("PyPI Releases (RSS)")),
+            "npm Registry (API)": lambda: fetch_npm_releases(days_back, client, mark("npm Registry (API)")),
+        }
+
+        # Tier 2 scrapers — best-effort HTML scraping
+        tier2_fetchers = {
+            "Boris Cherny X": lambda: fetch_boris_x_posts(days_back, client),
+            "Anthropic Blog": lambda: fetch_anthropic_blog(days_back, client),
+            "Anthropic Changelog": lambda: fetch_anthropic_changelog(days_back, client),
+            "Claude Code Docs": lambda: fetch_claude_code_docs(client),
+            "Anthropic YouTube": lambda: fetch_anthropic_youtube(days_back, client, strict=True),
+        }
+
+        # Tier 2 scrapers standing in for a Tier 1 feed that fails or comes back empty
+        fallbacks = {
+            "GitHub Releases (Atom)": ("GitHub Releases (HTML)", lambda: fetch_github_releases(
+                days_back, client, mark("GitHub Releases (HTML)"),
+            )),
+            "Reddit r/ClaudeAI (Atom)": ("Reddit r/ClaudeAI (JSON)", lambda: fetch_reddit_claude(
+                days_back, client, mark("Reddit r/ClaudeAI (JSON)"), strict=True,
+            )),
+        }
+        # Batch order: Tier 1, Tier 2, then fallbacks (as if appended to Tier 2)
+        ranks = {name: i for i, name in enumerate(
+            [*tier1_fetchers, *tier2_fetchers, *(name for name, _ in fallbacks.values())]
+        )}
+
+        queue: asyncio.Queue[SourceResult] = asyncio.Queue()
+
+        async def run(name, fetch, tier):
+            try:
+                updates = await run_source(
+                    name, fetch, fetch_budget,
+                    deadline=source_deadline,
+                    hedge=hedge and name in HEDGED_SOURCES,
+                )
+            except Exception as e:
+                if tier == 1:
+                    logger.warning("Tier 1 source '%s' failed: %s", name, e)
+                else:
+                    logger.error("Tier 2 source '%s' failed: %s", name, e)
+                result = SourceResult(name, ranks[name], [], f"{name}: {type(e).__name__}: {e}")
+            else:
+                result = SourceResult(name, ranks[name], list(updates or []))
+            queue.put_nowait(result)
+            return result
+
+        async def run_feed(name, fetch):
+            """Run a Tier 1 feed, then its fallback straight away if it failed."""
+            result = await run(name, fetch, tier=1)
+            # Empty is only a failure if the feed did not answer (an
+            # incremental feed with nothing new still marks its watermark read)
+            answered = (watermark := mark(name)) is not None and watermark.read
+            if name in fallbacks and (result.error or not (result.updates or answered)):
+                await run(*fallbacks[name], tier=2)
+
+        # Both tiers start at once: a slow feed only delays its own fallback
+        tasks = [asyncio.ensure_future(run_feed(name, fetch)) for name, fetch in tier1_fetchers.items()]
+        tasks += [asyncio.ensure_future(run(name, fetch, tier=2)) for name, fetch in tier2_fetchers.items()]
+        getter = None
+        try:
+            while not (all(t.done() for t in tasks) and queue.empty()):
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait([getter, *(t for t in tasks if not t.done())],
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()  # A source finished; its result is still queued
+        finally:
+            # Consumer stopped early (or we were cancelled): stop the sources
+            # before the client closes under them
+            pending = [t for t in (*tasks, getter) if t is not None and not t.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+# --- In-process result cache ---
+
+FETCH_CACHE_TTL = 300.0  # Seconds a fetch_all_updates result is reused
+FETCH_ERROR_CACHE_TTL = 30.0  # Cap for a result with failed sources, so a blip clears quickly
+
+
+@dataclass
+class _CachedFetch:
+    days_back: int
+    fetched_at: float  # time.monotonic()
+    result: FetchResult
+
+    def fresh(self, now: float, ttl: float) -> bool:
+        if self.result.errors:
+            ttl = min(ttl, FETCH_ERROR_CACHE_TTL)
+        return now - self.fetched_at < ttl
+
+
+class _SharedFetch:
+    """An in-flight fan-out that concurrent callers join instead of repeating.
+
+    ``task`` resolves to the assembled ``FetchResult``.  A streamed fetch
+    also collects each ``SourceResult`` as it arrives, so a caller joining
+    late replays those before following the rest.
+    """
+
+    def __init__(self, days_back: int, streamed: bool):
+        self.days_back = days_back
+        self.streamed = streamed
+        self.results: list[SourceResult] = []
+        self.task: "asyncio.Task[FetchResult]"
+        self._arrived = asyncio.Event()
+
+    def add(self, result: SourceResult) -> None:
+        self.results.append(result)
+        self._wake()
+
+    def _wake(self) -> None:
+        self._arrived.set()
+        self._arrived = asyncio.Event()
+
+    async def follow(self, days_back: int) -> AsyncIterator[SourceResult]:
+        """This fetch's source results, narrowed to ``days_back``."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        narrow = days_back < self.days_back
+        seen = 0
+        while True:
+            if seen < len(self.results):
+                result = self.results[seen]
+                seen += 1
+                if narrow:
+                    result = replace(result, updates=[
+                        u for u in result.updates if _is_within_window(u.date, cutoff)
+                    ])
+                yield result
+            elif self.task.done():
+                break
+            else:
+                await self._arrived.wait()
+
+        fetched = self.task.result()  # Re-raises if the fetch failed
+        if not self.streamed:
+            # Joined a batch fetch: hand over its result in SourceResult form
+            narrowed = _narrow_fetch_result(fetched, self.days_back, days_back)
+            yield SourceResult("cached fetch", 0, narrowed.updates)
+            for rank, error in enumerate(narrowed.errors, 1):
+                yield SourceResult(error.split(":", 1)[0], rank, [], error)
+
+
+_fetch_cache: dict[int, _CachedFetch] = {}
+_fetch_inflight: dict[int, _SharedFetch] = {}
+
+
+def _joinable_fetch(days_back: int) -> Optional[_SharedFetch]:
+    """The narrowest in-flight fetch covering ``days_back``, if any."""
+    inflight = [d for d in _fetch_inflight if d >= days_back]
+    return _fetch_inflight[min(inflight)] if inflight else None
+
+
+def _start_fetch(days_back: int, streamed: bool, client: Optional[httpx.AsyncClient]) -> _SharedFetch:
+    shared = _SharedFetch(days_back, streamed)
+    run = _stream_and_cache if streamed else _fetch_and_cache
+    shared.task = asyncio.ensure_future(run(shared, client))
+    _fetch_inflight[days_back] = shared
+    return shared
+
+
+async def fetch_all_updates_cached(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    ttl: float = FETCH_CACHE_TTL,
+) -> FetchResult:
+    """``fetch_all_updates`` with an in-process TTL cache and single-flight.
+
+    A result fetched less than ``ttl`` seconds ago for the same or a larger
+    ``days_back`` is reused (narrowed to this window by date), and
+    concurrent calls share one in-flight fan-out instead of each scraping
+    every source.  ``ttl=0`` always fetches.  A shared ``client`` must stay
+    open until the call returns.
+    """
+    cached = get_cached_fetch(days_back, ttl)
+    if cached is not None:
+        return cached
+
+    shared = _joinable_fetch(days_back) if ttl > 0 else None
+    if shared is None:
+        shared = _start_fetch(days_back, streamed=False, client=client)
+    # Shielded: a cancelled caller must not cancel the fetch others await
+    result = await asyncio.shield(shared.task)
+    return _narrow_fetch_result(result, shared.days_back, days_back)
+
+
+async def iter_source_results_cached(
+    days_back: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    ttl: float = FETCH_CACHE_TTL,
+) -> AsyncIterator[SourceResult]:
+    """Single-flight ``iter_source_results``.
+
+    Follows a fetch already in flight for the same or a larger window
+    (started here or by ``fetch_all_updates_cached``), or starts one that
+    later callers join.  Its assembled result is cached on completion.
+    Closing the iterator early leaves the shared fetch running.  Callers
+    check ``get_cached_fetch`` first; a cached result is not replayed.
+    """
+    shared = _joinable_fetch(days_back) if ttl > 0 else None
+    if shared is None:
+        shared = _start_fetch(days_back, streamed=True, client=client)
+    async for result in shared.follow(days_back):
+        yield result
+
+
+def get_cached_fetch(days_back: int, ttl: float = FETCH_CACHE_TTL) -> Optional[FetchResult]:
+    """A cached result covering ``days_back`` younger than ``ttl``, narrowed to it."""
+    now = time.monotonic()
+    fresh = [
+        entry for entry in _fetch_cache.values()
+        if entry.days_back >= days_back and entry.fresh(now, ttl)
+    ]
+    if not fresh:
+        return None
+    entry = min(fresh, key=lambda e: e.days_back)
+    logger.info("Reusing %d-day fetch result for a %d-day window", entry.days_back, days_back)
+    return _narrow_fetch_result(entry.result, entry.days_back, days_back)
+
+
+def store_fetch_result(days_back: int, result: FetchResult) -> None:
+    """Cache a complete ``days_back`` fetch (e.g. one assembled from a stream).
+
+    A result with failed sources is only reused for ``FETCH_ERROR_CACHE_TTL``.
+    """
+    _fetch_cache[days_back] = _CachedFetch(days_back, time.monotonic(), result)
+    if result.errors:
+        return  # Short-lived: keep any complete smaller window
+    # A larger window supersedes every smaller one
+    for smaller in [d for d in _fetch_cache if d < days_back]:
+        del _fetch_cache[smaller]
+
+
+async def _fetch_and_cache(shared: _SharedFetch, client: Optional[httpx.AsyncClient]) -> FetchResult:
+    try:
+        result = await fetch_all_updates(shared.days_back, client)
+        store_fetch_result(shared.days_back, result)
+        return result
+    finally:
+        _finish_fetch(shared)
+
+
+async def _stream_and_cache(shared: _SharedFetch, client: Optional[httpx.AsyncClient]) -> FetchResult:
+    try:
+        async for result in iter_source_results(shared.days_back, client):
+            shared.add(result)
+        result = assemble_fetch_result(shared.results)
+        store_fetch_result(shared.days_back, result)
+        return result
+    finally:
+        _finish_fetch(shared)
+
+
+def _finish_fetch(shared: _SharedFetch) -> None:
+    if _fetch_inflight.get(shared.days_back) is shared:
+        del _fetch_inflight[shared.days_back]
+    shared._wake()  # Followers see the task as done once this returns
+
+
+def _narrow_fetch_result(result: FetchResult, fetched_days: int, days_back: int) -> FetchResult:
+    """A copy of a ``fetched_days`` result holding only updates within ``days_back``."""
+    updates = result.updates
+    if days_back < fetched_days:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        updates = [u for u in updates if _is_within_window(u.date, cutoff)]
+    return FetchResult(updates=list(updates), errors=list(result.errors))
+
+
+def clear_fetch_cache() -> None:
+    """Forget cached fetch results (in-flight fetches are unaffected)."""
+    _fetch_cache.clear()
+
+
 # --- Helpers ---
 
 def _is_claude_relevant(text: str) -> bool:
     """Check if text is relevant to Claude Code / developer tools."""
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in CLAUDE_CODE_KEYWORDS)
+    return not _source_keyword_hits(text.lower()).isdisjoint(CLAUDE_CODE_KEYWORDS)
+
+
+@lru_cache(maxsize=1024)
+def _source_keyword_hits(text: str) -> frozenset[str]:
+    """Relevance and tag keywords occurring in ``text`` (already lowercased)."""
+    return frozenset(_SOURCE_KEYWORD_MATCHER.find(text))
 
 
 def _extract_title(text: str) -> str:
@@ -915,30 +1624,25 @@ def _is_within_window(date_str: str, cutoff: datetime) -> bool:
         return True  # Can't parse — include it
 
 
+def _is_newer(when: Optional[datetime], since: Optional[datetime]) -> bool:
+    """False only for an entry known to be at or before the watermark."""
+    return since is None or when is None or when > since
+
+
+def _parse_iso(date_str: str) -> Optional[datetime]:
+    """A timezone-aware datetime from an ISO 8601 string, or None."""
+    try:
+        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
 def _extract_tags(text: str) -> list[str]:
     """Extract relevant tags from text."""
-    text_lower = text.lower()
+    hits = _source_keyword_hits(text.lower())
     tags = []
-    tag_map = {
-        "claude code": "claude-code",
-        "mcp": "mcp",
-        "model context protocol": "mcp",
-        "hooks": "hooks",
-        "skills": "skills",
-        "agent teams": "agent-teams",
-        "parallel sessions": "parallel-sessions",
-        "opus": "model-update",
-        "sonnet": "model-update",
-        "haiku": "model-update",
-        "api": "api",
-        "sdk": "sdk",
-        "claude.md": "claude-md",
-        "plan mode": "plan-mode",
-        "context window": "context-window",
-        "git": "git",
-        "tool use": "tool-use",
-    }
-    for keyword, tag in tag_map.items():
-        if keyword in text_lower and tag not in tags:
+    for keyword, tag in TAG_MAP.items():
+        if keyword in hits and tag not in tags:
             tags.append(tag)
     return tags
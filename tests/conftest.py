@@ -0,0 +1,15 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from claude_code_mastery import cache, deadlines, http_cache, sources
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk cache at a temp dir so tests never touch ~/.claude-code-mastery."""
+    monkeypatch.setattr(cache, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(http_cache, "_default_cache", None)
+    monkeypatch.setattr(sources, "_fetch_cache", {})
+    monkeypatch.setattr(deadlines, "_latencies", deadlines.LatencyTracker())
+    return tmp_path / "cache"
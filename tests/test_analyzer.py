@@ -1,6 +1,9 @@
 """Tests for the curriculum analyzer module."""
 
+import os
+
 import pytest
+from claude_code_mastery import analyzer
 from claude_code_mastery.analyzer import (
     _is_bugfix_release,
     _find_affected_weeks,
@@ -11,10 +14,16 @@ from claude_code_mastery.analyzer import (
     _consolidate_releases,
     _deduplicate_cross_source,
     analyze_gaps,
+    iter_gaps,
+    get_curriculum_index,
+    GapStream,
+    load_curriculum_file,
+    save_curriculum_file,
     CurriculumGap,
+    CurriculumIndex,
     CURRICULUM_TOPIC_MAP,
 )
-from claude_code_mastery.sources import Update
+from claude_code_mastery.sources import Update, _parse_changelog_page
 
 
 # --- Fixtures ---
@@ -194,6 +203,40 @@ class TestTopicAlreadyCovered:
         assert _topic_already_covered(u, text, curriculum) is True
 
 
+# --- CurriculumIndex ---
+
+class TestCurriculumIndex:
+    def test_urls_and_versions(self, sample_curriculum):
+        index = CurriculumIndex(
+            sample_curriculum + "\nSee [docs](https://example.com/guide/). Shipped in v2.1.32."
+        )
+        assert index.has_url("https://example.com/guide")
+        assert index.has_url("https://example.com/guide/")
+        assert "v2.1.32" in index.versions
+
+    def test_phrase_hits(self, sample_curriculum):
+        index = CurriculumIndex(sample_curriculum)
+        assert "opus 4.6" in index.phrase_hits
+        assert "claudedesk" not in index.phrase_hits
+
+    def test_version_prefix_is_not_a_match(self, make_update):
+        index = CurriculumIndex("Claude Code v3.0.12 released")
+        u = make_update(title="Release notes", content="Changes in v3.0.1")
+        assert _topic_already_covered(u, f"{u.title} {u.content}".lower(), index) is False
+
+    def test_index_and_text_agree(self, make_update, sample_curriculum):
+        index = CurriculumIndex(sample_curriculum)
+        u = make_update(title="Hooks system update", content="Hook events improved")
+        text = f"{u.title} {u.content}".lower()
+        assert _topic_already_covered(u, text, index) == _topic_already_covered(u, text, sample_curriculum)
+        assert _classify_gap(u, text, index) == _classify_gap(u, text, sample_curriculum)
+
+    def test_reused_for_same_text(self, sample_curriculum):
+        first = get_curriculum_index(sample_curriculum)
+        assert get_curriculum_index(sample_curriculum) is first
+        assert get_curriculum_index(first) is first
+
+
 # --- _classify_gap ---
 
 class TestClassifyGap:
@@ -321,3 +364,173 @@ class TestAnalyzeGaps:
         ]
         gaps = analyze_gaps(updates, sample_curriculum)
         assert len(gaps) >= 1
+
+
+class TestGapMemo:
+    def _novel(self, make_update):
+        return make_update(
+            title="Introducing real-time collaboration",
+            content="Multiple users can now edit simultaneously with presence indicators",
+            source="anthropic_blog",
+        )
+
+    def test_second_run_reuses_stored_results(self, make_update, sample_curriculum, monkeypatch):
+        first = analyze_gaps([self._novel(make_update)], sample_curriculum)
+        assert first
+
+        def fail(*args, **kwargs):
+            raise AssertionError("memoised update was re-analysed")
+
+        monkeypatch.setattr(analyzer, "_classify_gap", fail)
+        second = analyze_gaps([self._novel(make_update)], sample_curriculum)
+        assert [(g.gap_type, g.priority, g.suggestion) for g in second] == \
+            [(g.gap_type, g.priority, g.suggestion) for g in first]
+
+    def test_only_new_updates_are_analysed(self, make_update, sample_curriculum, monkeypatch):
+        analyze_gaps([self._novel(make_update)], sample_curriculum)
+        seen = []
+        original = analyzer._classify_gap
+
+        def tracking(update, *args):
+            seen.append(update.title)
+            return original(update, *args)
+
+        monkeypatch.setattr(analyzer, "_classify_gap", tracking)
+        fresh = make_update(title="Voice input mode", content="Dictate prompts hands-free")
+        analyze_gaps([self._novel(make_update), fresh], sample_curriculum)
+        assert seen == ["Voice input mode"]
+
+    def test_curriculum_change_forces_recompute(self, make_update, sample_curriculum, monkeypatch):
+        analyze_gaps([self._novel(make_update)], sample_curriculum)
+        calls = []
+        original = analyzer._classify_gap
+        monkeypatch.setattr(
+            analyzer, "_classify_gap",
+            lambda *args: calls.append(1) or original(*args),
+        )
+        analyze_gaps([self._novel(make_update)], sample_curriculum + "\n- Real-time collaboration\n")
+        assert calls == [1]
+
+    def test_memoize_false_always_recomputes(self, make_update, sample_curriculum, monkeypatch):
+        analyze_gaps([self._novel(make_update)], sample_curriculum)
+        calls = []
+        original = analyzer._classify_gap
+        monkeypatch.setattr(
+            analyzer, "_classify_gap",
+            lambda *args: calls.append(1) or original(*args),
+        )
+        analyze_gaps([self._novel(make_update)], sample_curriculum, memoize=False)
+        assert calls == [1]
+
+    def test_rescrape_with_fetch_time_date_reuses_memo(self, sample_curriculum, monkeypatch):
+        html = (
+            "<html><body><h2>Claude Code real-time collaboration</h2>"
+            "<p>Multiple users can now edit simultaneously with presence indicators</p>"
+            "</body></html>"
+        )
+        first = analyze_gaps(_parse_changelog_page(html), sample_curriculum)
+        assert first
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged scraped update was re-analysed")
+
+        monkeypatch.setattr(analyzer, "_classify_gap", fail)
+        rescraped = _parse_changelog_page(html)
+        second = analyze_gaps(rescraped, sample_curriculum)
+        assert [g.suggestion for g in second] == [g.suggestion for g in first]
+        assert second[0].update.date == rescraped[0].date
+
+    def test_dedup_does_not_mutate_memo(self, make_update, sample_curriculum):
+        updates = [
+            make_update(title="Voice input mode", content="Dictate prompts hands-free", source="anthropic_blog"),
+            make_update(title="Voice input mode", content="Dictate prompts hands-free", source="reddit"),
+        ]
+        first = analyze_gaps(updates, sample_curriculum)
+        second = analyze_gaps(updates, sample_curriculum)
+        assert [g.suggestion for g in second] == [g.suggestion for g in first]
+
+
+# --- load_curriculum_file / save_curriculum_file ---
+
+class TestCurriculumFileCache:
+    def test_repeat_load_does_not_reread(self, tmp_path, monkeypatch):
+        path = tmp_path / "curriculum.md"
+        path.write_text("# Week 1", encoding="utf-8")
+        first = load_curriculum_file(str(path))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged file was re-read")
+
+        monkeypatch.setattr(type(path), "read_text", fail)
+        assert load_curriculum_file(str(path)) is first
+
+    def test_modified_file_is_reread(self, tmp_path):
+        path = tmp_path / "curriculum.md"
+        path.write_text("# Week 1", encoding="utf-8")
+        assert load_curriculum_file(str(path)) == "# Week 1"
+        path.write_text("# Week 2", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_curriculum_file(str(path)) == "# Week 2"
+
+    def test_save_writes_through(self, tmp_path, monkeypatch):
+        path = tmp_path / "curriculum.md"
+        assert save_curriculum_file(str(path), "# Saved")
+        monkeypatch.setattr(type(path), "read_text", lambda *a, **k: "# From disk")
+        assert load_curriculum_file(str(path)) == "# Saved"
+
+    def test_deleted_file_returns_none(self, tmp_path):
+        path = tmp_path / "curriculum.md"
+        path.write_text("# Week 1", encoding="utf-8")
+        load_curriculum_file(str(path))
+        path.unlink()
+        assert load_curriculum_file(str(path)) is None
+
+
+# --- GapStream / iter_gaps ---
+
+class TestGapStream:
+    def _updates(self, make_update):
+        return [
+            make_update(title="Voice input mode", content="Dictate prompts hands-free", source="anthropic_blog"),
+            make_update(title="Introducing task management",
+                        content="Task management for long jobs", source="anthropic_blog"),
+        ]
+
+    def test_matches_analyze_gaps(self, make_update, sample_curriculum):
+        updates = self._updates(make_update)
+        stream = GapStream(sample_curriculum)
+        stream.add(updates[:1])
+        stream.add(updates[1:])
+        expected = analyze_gaps(updates, sample_curriculum)
+        assert [(g.update.title, g.priority, g.suggestion) for g in stream.gaps()] == \
+            [(g.update.title, g.priority, g.suggestion) for g in expected]
+
+    def test_add_reports_each_topic_once(self, make_update, sample_curriculum):
+        update = self._updates(make_update)[0]
+        repost = make_update(title=update.title, content=update.content, source="reddit")
+        stream = GapStream(sample_curriculum)
+        assert len(stream.add([update])) == 1
+        assert stream.add([repost]) == []
+        merged = stream.gaps()
+        assert len(merged) == 1
+        assert merged[0].source_count == 2
+
+    def test_gaps_is_repeatable(self, make_update, sample_curriculum):
+        update = self._updates(make_update)[0]
+        stream = GapStream(sample_curriculum)
+        stream.add([update, make_update(title=update.title, content=update.content, source="reddit")])
+        assert [g.suggestion for g in stream.gaps()] == [g.suggestion for g in stream.gaps()]
+
+    @pytest.mark.asyncio
+    async def test_iter_gaps_yields_per_batch(self, make_update, sample_curriculum):
+        updates = self._updates(make_update)
+
+        async def batches():
+            for update in updates:
+                yield [update]
+
+        stream = GapStream(sample_curriculum)
+        titles = [g.update.title async for g in iter_gaps(batches(), stream=stream)]
+        assert titles == [u.title for u in updates]
+        assert len(stream.gaps()) == 2
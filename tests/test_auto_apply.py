@@ -1,11 +1,14 @@
 """Tests for auto-apply functionality: content generation, gap conversion, apply logic, and backups."""
 
+import random
+
 import pytest
 from pathlib import Path
 from claude_code_mastery.analyzer import (
     _generate_update_content,
     convert_gaps_to_updates,
     apply_single_update,
+    apply_updates,
     CurriculumGap,
     CurriculumUpdate,
 )
@@ -283,6 +286,94 @@ class TestApplySingleUpdate:
         assert "### Appendix: Second New" in result
 
 
+# --- apply_updates (batch) ---
+
+REPO_CURRICULUM = Path(__file__).resolve().parent.parent / "curriculum.md"
+
+
+def _sequential(content, updates):
+    errors = []
+    for cu in updates:
+        try:
+            content = apply_single_update(content, cu)
+            errors.append(None)
+        except ValueError as e:
+            errors.append(str(e))
+    return content, errors
+
+
+def _assert_equivalent(content, updates):
+    batched, errors = apply_updates(content, updates)
+    expected, expected_errors = _sequential(content, updates)
+    assert batched == expected
+    assert [str(e) if e else None for e in errors] == expected_errors
+
+
+def _cu(week, action="append", content="Some content.", section="Section"):
+    return CurriculumUpdate(week=week, section=section, action=action, content=content, reason="Test")
+
+
+class TestApplyUpdates:
+    def test_empty_batch_is_identity(self, sample_curriculum):
+        assert apply_updates(sample_curriculum, []) == (sample_curriculum, [])
+
+    def test_appends_to_several_weeks(self, sample_curriculum):
+        _assert_equivalent(sample_curriculum, [
+            _cu(9, content="Nine A."), _cu(1, content="One."),
+            _cu(9, content="Nine B."), _cu(10, content="Ten."), _cu(2, content="Two."),
+        ])
+
+    def test_appends_and_appendices_interleaved(self, sample_curriculum):
+        _assert_equivalent(sample_curriculum, [
+            _cu(0, "new", "Appendix one.", "First"), _cu(1, content="One."),
+            _cu(99, content="Missing week."), _cu(0, "append", "Week zero.", "Zero"),
+            _cu(2, content="Two."),
+        ])
+
+    def test_append_to_last_week_after_appendix(self):
+        content = "# C\n\n### WEEK 1: Only\n- a\n\n---\n\n### WEEK 2: Last\n- b\n"
+        _assert_equivalent(content, [
+            _cu(0, "new", "Appendix.", "Extra"), _cu(2, content="Last week item."),
+        ])
+
+    def test_replace_falls_back_to_sequential(self, sample_curriculum):
+        _assert_equivalent(sample_curriculum, [
+            _cu(1, content="One."), _cu(1, "replace", "Replaced.", "The Terminal"),
+            _cu(1, "replace", "Missing.", "Nonexistent XYZ"),
+        ])
+
+    def test_inserted_headers_and_separators(self, sample_curriculum):
+        _assert_equivalent(sample_curriculum, [
+            _cu(1, content="### WEEK 2: Shadow\n- x"), _cu(2, content="Two."),
+            _cu(9, content="a\n---\nb"), _cu(9, content="Nine."),
+        ])
+
+    def test_content_starting_with_separator(self):
+        content = "# C\n\n### WEEK 1: Only\n- a\n\n### WEEK 2: Last\n- b\n"
+        _assert_equivalent(content, [_cu(1, content="--- first"), _cu(1, content="second")])
+
+    def test_invalid_action_reported_and_skipped(self, sample_curriculum):
+        content, errors = apply_updates(sample_curriculum, [
+            _cu(1, "delete"), _cu(1, content="Kept."),
+        ])
+        assert isinstance(errors[0], ValueError)
+        assert "Invalid action" in str(errors[0])
+        assert errors[1] is None
+        assert content == apply_single_update(sample_curriculum, _cu(1, content="Kept."))
+
+    @pytest.mark.skipif(not REPO_CURRICULUM.exists(), reason="repo curriculum not present")
+    def test_random_batches_match_sequential_on_real_curriculum(self):
+        content = REPO_CURRICULUM.read_text(encoding="utf-8")
+        rng = random.Random(15)
+        for _ in range(50):
+            updates = []
+            for i in range(rng.randint(1, 8)):
+                week = rng.choice([0, 1, 3, 6, 9, 11, 12, 13, 99])
+                action = rng.choice(["append", "append", "append", "new"])
+                updates.append(_cu(week, action, f"Item {i} for week {week}.", f"Section {i}"))
+            _assert_equivalent(content, updates)
+
+
 # --- create_curriculum_backup ---
 
 class TestCreateCurriculumBackup:
@@ -3,8 +3,28 @@
 import json
 import pytest
 from pathlib import Path
+from claude_code_mastery import cache
 from claude_code_mastery.cache import (
+    CACHE_FILE,
+    clear_watermarks,
+    count_applied_updates,
+    count_seen_updates,
+    evict_seen,
+    get_applied_updates,
+    get_db,
+    get_cache_dir,
+    get_last_check_time,
     get_update_key,
+    is_update_seen,
+    load_cache,
+    load_gap_results,
+    load_watermarks,
+    mark_update_applied,
+    mark_update_seen,
+    mark_updates_seen,
+    save_cache,
+    store_gap_results,
+    store_watermarks,
 )
 
 
@@ -28,3 +48,155 @@ class TestGetUpdateKey:
         key1 = get_update_key("blog", "Same Title")
         key2 = get_update_key("reddit", "Same Title")
         assert key1 != key2
+
+
+# --- SQLite-backed update store ---
+
+class TestSeenUpdates:
+    def test_mark_and_check(self):
+        assert not is_update_seen("blog::a")
+        mark_update_seen("blog::a")
+        assert is_update_seen("blog::a")
+        assert get_last_check_time() is not None
+
+    def test_batch_mark_is_idempotent(self):
+        mark_updates_seen(["a", "b", "a"])
+        mark_updates_seen(["b", "c"])
+        assert count_seen_updates() == 3
+
+    def test_trim_drops_oldest(self, monkeypatch):
+        monkeypatch.setattr(cache, "MAX_SEEN_UPDATES", 3)
+        mark_updates_seen(["z-first", "y-second"])
+        mark_updates_seen(["x-third", "a-fourth"])
+        assert count_seen_updates() == 3
+        assert not is_update_seen("z-first")
+        assert is_update_seen("a-fourth")
+
+
+    def test_eviction_is_oldest_first_not_alphabetical(self, monkeypatch):
+        monkeypatch.setattr(cache, "MAX_SEEN_UPDATES", 2)
+        mark_update_seen("b-old")
+        mark_update_seen("z-mid")
+        cache._db.close()
+        cache._db = None  # Simulate a restart
+        mark_update_seen("a-new")
+        assert not is_update_seen("b-old")
+        assert is_update_seen("z-mid") and is_update_seen("a-new")
+
+    def test_re_marking_refreshes_entry(self, monkeypatch):
+        monkeypatch.setattr(cache, "MAX_SEEN_UPDATES", 2)
+        mark_update_seen("first")
+        mark_update_seen("second")
+        mark_update_seen("first")  # Still in the feed
+        mark_update_seen("third")
+        assert is_update_seen("first")
+        assert not is_update_seen("second")
+
+    def test_ttl_eviction(self):
+        mark_updates_seen(["stale", "fresh"])
+        get_db().execute(
+            "UPDATE seen SET seen_at = '2000-01-01T00:00:00.000000+00:00' WHERE key = 'stale'"
+        )
+        assert evict_seen(ttl_days=30) == 1
+        assert not is_update_seen("stale")
+        assert count_seen_updates() == 1
+
+
+class TestAppliedUpdates:
+    def test_append_only_history(self):
+        for i in range(12):
+            mark_update_applied(f"k{i}", f"applied {i}")
+        assert count_applied_updates() == 12
+        recent = get_applied_updates(limit=10)
+        assert [a["key"] for a in recent] == [f"k{i}" for i in range(2, 12)]
+
+
+class TestCompatibility:
+    def test_load_cache_view(self):
+        mark_update_seen("a")
+        mark_update_applied("a", "details")
+        view = load_cache()
+        assert view["seen_updates"] == {"a"}
+        assert view["applied_updates"][0]["details"] == "details"
+        assert view["last_check"] == get_last_check_time()
+
+    def test_save_cache_round_trip(self):
+        mark_updates_seen(["a", "b"])
+        view = load_cache()
+        view["seen_updates"].discard("a")
+        view["seen_updates"].add("c")
+        save_cache(view)
+        assert load_cache()["seen_updates"] == {"b", "c"}
+
+    def test_migrates_json_cache(self):
+        legacy = get_cache_dir() / CACHE_FILE
+        legacy.write_text(json.dumps({
+            "seen_updates": ["blog::old"],
+            "last_check": "2026-01-01T00:00:00+00:00",
+            "applied_updates": [{"key": "k", "details": "d", "applied_at": "2026-01-01"}],
+        }), encoding="utf-8")
+
+        assert is_update_seen("blog::old")
+        assert get_last_check_time() == "2026-01-01T00:00:00+00:00"
+        assert count_applied_updates() == 1
+        assert not legacy.exists()
+
+
+class TestGapMemoStore:
+    def test_round_trip(self):
+        store_gap_results("cur-a", {"h1": {"skipped": "heuristic"}, "h2": {}})
+        assert load_gap_results("cur-a", ["h1", "h2", "h3"]) == {
+            "h1": {"skipped": "heuristic"}, "h2": {},
+        }
+
+    def test_other_curriculum_results_dropped(self):
+        store_gap_results("cur-a", {"h1": {}})
+        store_gap_results("cur-b", {"h2": {}})
+        assert load_gap_results("cur-a", ["h1"]) == {}
+        assert load_gap_results("cur-b", ["h2"]) == {"h2": {}}
+
+
+class TestThreadConnections:
+    def test_worker_thread_gets_own_connection(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        main = get_db()
+        with ThreadPoolExecutor(1) as pool:
+            assert pool.submit(get_db).result() is not main
+        assert get_db() is main
+
+    def test_worker_thread_outside_open_transaction(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        conn = get_db()
+        with ThreadPoolExecutor(1) as pool:
+            pool.submit(get_db).result()
+            conn.execute("BEGIN")
+            conn.execute("INSERT INTO seen (key, seen_at) VALUES ('pending', '')")
+            assert not pool.submit(is_update_seen, "pending").result()
+            conn.execute("ROLLBACK")
+            store = pool.submit(store_gap_results, "cur-a", {"h1": {}})
+            store.result()
+        assert load_gap_results("cur-a", ["h1"]) == {"h1": {}}
+        assert not is_update_seen("pending")
+
+
+class TestWatermarkStore:
+    def test_empty(self):
+        assert load_watermarks() == {}
+
+    def test_round_trip_and_replace(self):
+        store_watermarks({"npm_releases": {"date": "2026-01-01T00:00:00+00:00", "last_id": "1.0.0"}})
+        store_watermarks({
+            "npm_releases": {"date": "2026-02-01T00:00:00+00:00", "last_id": "1.1.0"},
+            "pypi_releases": {"date": "2026-01-15T00:00:00+00:00", "last_id": "0.9"},
+        })
+        assert load_watermarks() == {
+            "npm_releases": {"date": "2026-02-01T00:00:00+00:00", "last_id": "1.1.0"},
+            "pypi_releases": {"date": "2026-01-15T00:00:00+00:00", "last_id": "0.9"},
+        }
+
+    def test_clear(self):
+        store_watermarks({"npm_releases": {"date": "2026-01-01T00:00:00+00:00", "last_id": "1.0.0"}})
+        clear_watermarks()
+        assert load_watermarks() == {}
@@ -0,0 +1,133 @@
+"""Tests for source deadlines, the fetch budget and hedged requests."""
+
+import asyncio
+
+import pytest
+
+from claude_code_mastery.deadlines import (
+    HEDGE_MIN_SAMPLES,
+    FetchBudget,
+    LatencyTracker,
+    run_source,
+)
+
+
+def _fetcher(*delays, result="ok"):
+    """A fetch factory whose n-th call takes ``delays[n]`` seconds."""
+    calls = []
+
+    def fetch():
+        delay = delays[min(len(calls), len(delays) - 1)]
+        calls.append(delay)
+
+        async def attempt():
+            await asyncio.sleep(delay)
+            return f"{result}-{len(calls)}" if len(delays) > 1 else result
+        return attempt()
+
+    fetch.calls = calls
+    return fetch
+
+
+class TestLatencyTracker:
+    def test_percentile(self):
+        tracker = LatencyTracker()
+        for seconds in [0.1, 0.2, 0.3, 0.4, 1.0]:
+            tracker.record("src", seconds)
+        assert tracker.percentile("src", 0.5) == 0.3
+        assert tracker.percentile("src", 0.9) == 1.0
+        assert tracker.percentile("other", 0.9) is None
+
+    def test_no_hedge_delay_until_enough_samples(self):
+        tracker = LatencyTracker()
+        for _ in range(HEDGE_MIN_SAMPLES - 1):
+            tracker.record("src", 0.1)
+        assert tracker.hedge_delay("src") is None
+        tracker.record("src", 0.1)
+        assert tracker.hedge_delay("src") == 0.1
+
+
+class TestRunSource:
+    @pytest.mark.asyncio
+    async def test_returns_result_and_records_latency(self):
+        tracker = LatencyTracker()
+        result = await run_source("src", _fetcher(0), FetchBudget(5), latencies=tracker)
+        assert result == "ok"
+        assert tracker.percentile("src", 0.5) is not None
+
+    @pytest.mark.asyncio
+    async def test_source_deadline(self):
+        with pytest.raises(TimeoutError, match="source deadline"):
+            await run_source("src", _fetcher(1), FetchBudget(5), deadline=0.02,
+                             latencies=LatencyTracker())
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_deadline(self):
+        with pytest.raises(TimeoutError, match="fetch budget"):
+            await run_source("src", _fetcher(1), FetchBudget(0.02), deadline=5,
+                             latencies=LatencyTracker())
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_does_not_start(self):
+        fetch = _fetcher(0)
+        with pytest.raises(TimeoutError, match="exhausted"):
+            await run_source("src", fetch, FetchBudget(0), latencies=LatencyTracker())
+        assert fetch.calls == []
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_first_request_stalls(self):
+        tracker = LatencyTracker()
+        for _ in range(HEDGE_MIN_SAMPLES):
+            tracker.record("src", 0.01)
+        fetch = _fetcher(1, 0)  # First request hangs, hedge answers at once
+        result = await run_source("src", fetch, FetchBudget(5), hedge=True, latencies=tracker)
+        assert result == "ok-2"
+        assert len(fetch.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self):
+        fetch = _fetcher(0.05)
+        await run_source("src", fetch, FetchBudget(5), hedge=True, latencies=LatencyTracker())
+        assert len(fetch.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_first_request_is_not_hedged(self):
+        tracker = LatencyTracker()
+        for _ in range(HEDGE_MIN_SAMPLES):
+            tracker.record("src", 0.5)
+        fetch = _fetcher(0)
+        await run_source("src", fetch, FetchBudget(5), hedge=True, latencies=tracker)
+        assert len(fetch.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_does_not_beat_hedge(self):
+        tracker = LatencyTracker()
+        for _ in range(HEDGE_MIN_SAMPLES):
+            tracker.record("src", 0.01)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+
+            async def attempt(n=len(calls)):
+                if n == 1:
+                    await asyncio.sleep(0.03)
+                    raise ConnectionError("reset")  # Fails after the hedge was sent
+                await asyncio.sleep(0.05)
+                return "hedge"
+            return attempt()
+
+        result = await run_source("src", fetch, FetchBudget(5), hedge=True, latencies=tracker)
+        assert result == "hedge"
+        assert len(tracker._samples["src"]) == HEDGE_MIN_SAMPLES + 1  # Only the hedge's sample
+
+    @pytest.mark.asyncio
+    async def test_failure_records_no_latency(self):
+        tracker = LatencyTracker()
+
+        async def fail():
+            raise ConnectionError("reset")
+
+        with pytest.raises(ConnectionError):
+            await run_source("src", fail, FetchBudget(5), latencies=tracker)
+        assert tracker.percentile("src", 0.5) is None
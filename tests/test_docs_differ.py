@@ -1,12 +1,30 @@
 """Tests for the documentation diffing engine."""
 
+import asyncio
+import json
+import random
+
+import httpx
 import pytest
 from claude_code_mastery.docs_differ import (
+    DOCS_BASE_URL,
     _section_hash,
     _extract_sections,
+    _process_page,
     diff_snapshots,
     changes_to_updates,
     _extract_diff_tags,
+    _page_fingerprint,
+    _snapshot_fingerprint,
+    _legacy_snapshot_path,
+    _object_path,
+    compare_snapshots,
+    list_snapshots,
+    load_snapshot,
+    prune_snapshots,
+    save_snapshot,
+    set_snapshot_ref,
+    snapshot_docs,
 )
 
 
@@ -70,6 +88,63 @@ class TestExtractSections:
         assert "__intro__" in sections
 
 
+    def test_nested_blocks_not_duplicated(self):
+        html = """
+        <main>
+            <h2>Flags</h2>
+            <table><tr><td><ul><li>Use <code>--print</code> mode</li></ul></td></tr></table>
+        </main>
+        """
+        sections = _extract_sections(html)
+        assert sections["Flags"] == "Use--printmode"
+
+    def test_order_preserved_across_headings(self):
+        html = """
+        <main>
+            <div><p>one</p><div><p>two</p></div></div>
+            <h2>Next</h2>
+            <ul><li>three</li><li>four</li></ul>
+        </main>
+        """
+        sections = _extract_sections(html)
+        assert sections == {"__intro__": "one two", "Next": "three four"}
+
+
+# --- _process_page ---
+
+class TestProcessPage:
+    HTML = """
+    <nav><a href="/en/docs/claude-code/hooks">Hooks</a></nav>
+    <main>
+        <h1>Overview</h1>
+        <p>See <a href="/en/docs/claude-code/memory#top">memory</a></p>
+    </main>
+    """
+
+    def test_returns_sections_and_links(self):
+        sections, links = _process_page(self.HTML)
+        assert sections == _extract_sections(self.HTML)
+        # Sidebar links are discovered even though nav is stripped from sections
+        assert links == [
+            "https://docs.anthropic.com/en/docs/claude-code/hooks",
+            "https://docs.anthropic.com/en/docs/claude-code/memory",
+        ]
+        assert "Hooks" not in " ".join(sections.values())
+
+    def test_parses_once(self, monkeypatch):
+        from claude_code_mastery import docs_differ
+        calls = []
+        real = docs_differ.BeautifulSoup
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(docs_differ, "BeautifulSoup", counting)
+        _process_page(self.HTML)
+        assert len(calls) == 1
+
+
 # --- diff_snapshots ---
 
 class TestDiffSnapshots:
@@ -129,6 +204,40 @@ class TestDiffSnapshots:
         assert changes[0]["type"] == "removed"
 
 
+# --- Merkle fingerprints ---
+
+class TestFingerprints:
+    def _page(self, **sections):
+        return {"sections": {h: {"text": t, "hash": _section_hash(t)} for h, t in sections.items()}}
+
+    def test_page_fingerprint_ignores_section_order(self):
+        a = {"A": {"hash": "1"}, "B": {"hash": "2"}}
+        b = {"B": {"hash": "2"}, "A": {"hash": "1"}}
+        assert _page_fingerprint(a) == _page_fingerprint(b)
+
+    def test_page_fingerprint_changes_with_content(self):
+        assert _page_fingerprint(self._page(A="x")["sections"]) != \
+            _page_fingerprint(self._page(A="y")["sections"])
+
+    def test_root_changes_with_any_page(self):
+        old = {"u1": self._page(A="x"), "u2": self._page(A="y")}
+        new = {"u1": self._page(A="x"), "u2": self._page(A="z")}
+        assert _snapshot_fingerprint(old) != _snapshot_fingerprint(new)
+
+    def test_equal_roots_short_circuit(self):
+        old = {"pages": {"u": self._page(A="x")}, "root": "r"}
+        new = {"pages": {"u": self._page(A="changed")}, "root": "r"}
+        # Stored roots are trusted: nothing below them is inspected
+        assert diff_snapshots(old, new) == []
+
+    def test_unchanged_pages_skipped(self):
+        same = self._page(A="x")
+        old = {"pages": {"same": {**same, "fingerprint": "f"}, "u": self._page(A="1")}}
+        new = {"pages": {"same": {**self._page(A="y"), "fingerprint": "f"}, "u": self._page(A="2")}}
+        changes = diff_snapshots(old, new)
+        assert [(c["page"], c["type"]) for c in changes] == [("u", "modified")]
+
+
 # --- changes_to_updates ---
 
 class TestChangesToUpdates:
@@ -187,3 +296,124 @@ class TestExtractDiffTags:
     def test_no_special_tags(self):
         tags = _extract_diff_tags("General", "some text")
         assert tags == ["docs-change"]
+
+
+# --- snapshot_docs ---
+
+def _docs_handler(in_flight: list[int], peak: list[int]):
+    """Serve every docs URL with a page that links to one extra page."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(random.uniform(0, 0.01))  # Scramble completion order
+        in_flight[0] -= 1
+        path = request.url.path
+        html = (
+            f"<main><h2>{path}</h2><p>Body of {path}</p>"
+            f"<a href='/en/docs/claude-code/discovered'>more</a></main>"
+        )
+        return httpx.Response(200, text=html)
+
+    return handler
+
+
+class TestSnapshotDocs:
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        in_flight, peak = [0], [0]
+        transport = httpx.MockTransport(_docs_handler(in_flight, peak))
+        async with httpx.AsyncClient(transport=transport) as client:
+            snapshot = await snapshot_docs(client, concurrency=3, per_host=2)
+
+        assert 1 < peak[0] <= 2
+        assert f"{DOCS_BASE_URL}/discovered" in snapshot["pages"]
+
+    @pytest.mark.asyncio
+    async def test_deterministic_regardless_of_completion_order(self):
+        results = []
+        for _ in range(2):
+            transport = httpx.MockTransport(_docs_handler([0], [0]))
+            async with httpx.AsyncClient(transport=transport) as client:
+                snapshot = await snapshot_docs(client)
+            results.append(snapshot["pages"])
+
+        assert list(results[0]) == list(results[1])
+        assert results[0] == results[1]
+
+
+# --- Content-addressed snapshot store ---
+
+def _snapshot(timestamp: str, sections: dict[str, str]) -> dict:
+    return {
+        "timestamp": timestamp,
+        "pages": {
+            "https://docs/x": {
+                "sections": {
+                    heading: {"text": text, "hash": _section_hash(text)}
+                    for heading, text in sections.items()
+                }
+            }
+        },
+    }
+
+
+class TestSnapshotStore:
+    def test_round_trip_keeps_full_text(self):
+        long_text = "word " * 1000
+        save_snapshot(_snapshot("2026-01-01T00:00:00+00:00", {"A": long_text}))
+        loaded = load_snapshot("latest")
+        assert loaded["pages"]["https://docs/x"]["sections"]["A"]["text"] == long_text
+
+    def test_unchanged_sections_stored_once(self):
+        save_snapshot(_snapshot("2026-01-01T00:00:00+00:00", {"A": "same", "B": "one"}))
+        save_snapshot(_snapshot("2026-01-02T00:00:00+00:00", {"A": "same", "B": "two"}))
+        objects = list(_object_path(_section_hash("same")).parent.parent.glob("*/*.txt"))
+        assert len(objects) == 3
+        assert len(list_snapshots()) == 2
+
+    def test_compare_any_two_points(self):
+        save_snapshot(_snapshot("2026-01-01T00:00:00+00:00", {"A": "v1"}), "previous")
+        save_snapshot(_snapshot("2026-01-02T00:00:00+00:00", {"A": "v2"}))
+        save_snapshot(_snapshot("2026-01-03T00:00:00+00:00", {"A": "v3"}))
+
+        updates, summary = compare_snapshots("20260101", "20260103")
+        assert len(updates) == 1
+        assert updates[0].content == "v3"
+        assert "1 section(s) modified" in summary
+
+    def test_compare_unknown_snapshot(self):
+        updates, summary = compare_snapshots("19990101")
+        assert updates == []
+        assert "Unknown docs snapshot" in summary
+
+    def test_migrates_legacy_files(self):
+        legacy = _snapshot("2026-01-01T00:00:00+00:00", {"A": "legacy"})
+        _legacy_snapshot_path("latest").write_text(json.dumps(legacy), encoding="utf-8")
+
+        loaded = load_snapshot("latest")
+        assert loaded["pages"]["https://docs/x"]["sections"]["A"]["text"] == "legacy"
+        assert not _legacy_snapshot_path("latest").exists()
+
+    def test_truncated_legacy_body_replaced_by_full_text(self):
+        full = " ".join(f"word{i}" for i in range(1000))
+        legacy = _snapshot("2026-01-01T00:00:00+00:00", {"A": full})
+        legacy["pages"]["https://docs/x"]["sections"]["A"]["text"] = full[:2000]
+        _legacy_snapshot_path("latest").write_text(json.dumps(legacy), encoding="utf-8")
+        load_snapshot("latest")
+
+        save_snapshot(_snapshot("2026-01-02T00:00:00+00:00", {"A": full}))
+        loaded = load_snapshot("latest")
+        assert loaded["pages"]["https://docs/x"]["sections"]["A"]["text"] == full
+        assert compare_snapshots("20260101", "20260102")[0] == []
+
+    def test_prune_keeps_labelled_and_collects_objects(self):
+        for day in range(1, 5):
+            save_snapshot(_snapshot(f"2026-01-0{day}T00:00:00+00:00", {"A": f"v{day}"}))
+        first = list_snapshots()[0]["id"]
+        set_snapshot_ref("previous", first)
+
+        assert prune_snapshots(keep=1) == 2
+        assert [s["id"] for s in list_snapshots()][0] == first
+        assert not _object_path(_section_hash("v2")).exists()
+        assert _object_path(_section_hash("v1")).exists()
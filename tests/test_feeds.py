@@ -0,0 +1,172 @@
+"""Tests for the streaming Atom/RSS reader."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from claude_code_mastery.feeds import (
+    ATOM_ENTRY,
+    EntryStream,
+    FeedSpec,
+    atom_bodies,
+    atom_entry_date,
+    extract_atom_entry,
+    parse_feed,
+    read_feed,
+)
+from claude_code_mastery.http_cache import ResponseCache
+
+NOW = datetime.now(timezone.utc)
+URL = "https://x.test/releases.atom"
+
+SORTED_SPEC = FeedSpec(
+    entry_tag=ATOM_ENTRY,
+    extract=extract_atom_entry,
+    limit=30,
+    parse_key="test-atom",
+    finish=atom_bodies,
+    entry_date=atom_entry_date,
+)
+UNSORTED_SPEC = FeedSpec(
+    entry_tag=ATOM_ENTRY, extract=extract_atom_entry, limit=30, parse_key="test-atom-unsorted",
+)
+
+
+def _entry(i: int, age_days: float) -> str:
+    updated = (NOW - timedelta(days=age_days)).isoformat()
+    return (
+        f"<entry><title>v{i}</title><updated>{updated}</updated>"
+        f'<link rel="alternate" href="https://x.test/v{i}"/>'
+        f"<content type=\"html\">&lt;p&gt;Notes for &lt;b&gt;v{i}&lt;/b&gt;&lt;/p&gt;</content></entry>"
+    )
+
+
+def atom_feed(ages: list[float]) -> str:
+    entries = "".join(_entry(i, age) for i, age in enumerate(ages))
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>{entries}</feed>'
+
+
+class _StreamingServer:
+    """Serves a body in small chunks, counting how many were pulled."""
+
+    def __init__(self, body: str, chunk_size: int = 256, etag: str = '"v1"'):
+        self.body = body.encode()
+        self.chunk_size = chunk_size
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+        self.chunks_sent = 0
+
+    @property
+    def total_chunks(self) -> int:
+        return -(-len(self.body) // self.chunk_size)
+
+    async def _chunks(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.chunks_sent += 1
+            yield self.body[start:start + self.chunk_size]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=self._chunks(), headers={"ETag": self.etag})
+
+
+def _client(server) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(server))
+
+
+class TestEntryStream:
+    def test_entries_yielded_across_chunk_boundaries(self):
+        body = atom_feed([1, 2, 3]).encode()
+        stream = EntryStream(UNSORTED_SPEC)
+        titles = [e["title"] for i in range(0, len(body), 7) for e in stream.feed(body[i:i + 7])]
+        assert titles == ["v0", "v1", "v2"]
+
+    def test_consumed_entries_are_detached(self):
+        stream = EntryStream(UNSORTED_SPEC)
+        list(stream.feed(atom_feed([1, 2, 3])[:-len("</feed>")]))
+        root = stream._stack[0]
+        assert [child.tag.rsplit("}", 1)[-1] for child in root] == ["title"]
+
+
+class TestParseFeed:
+    def test_limit(self):
+        spec = FeedSpec(entry_tag=ATOM_ENTRY, extract=extract_atom_entry, limit=2, parse_key="k")
+        assert [e["title"] for e in parse_feed(atom_feed([1, 2, 3]), spec)] == ["v0", "v1"]
+
+    def test_sorted_feed_stops_at_cutoff(self):
+        entries = parse_feed(atom_feed([1, 2, 40, 3]), SORTED_SPEC, NOW - timedelta(days=30))
+        assert [e["title"] for e in entries] == ["v0", "v1"]
+
+    def test_unsorted_feed_ignores_cutoff(self):
+        entries = parse_feed(atom_feed([1, 40, 2]), UNSORTED_SPEC, NOW - timedelta(days=30))
+        assert [e["title"] for e in entries] == ["v0", "v1", "v2"]
+
+    def test_html_content_becomes_text_body(self):
+        entry = parse_feed(atom_feed([1]), SORTED_SPEC)[0]
+        assert entry["body"] == "Notes for\nv0"
+        assert "content" not in entry
+
+
+class TestReadFeed:
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_entry_cap(self, tmp_path):
+        server = _StreamingServer(atom_feed([1] * 500))
+        spec = FeedSpec(entry_tag=ATOM_ENTRY, extract=extract_atom_entry, limit=5, parse_key="k")
+        async with _client(server) as client:
+            entries = await read_feed(client, URL, spec, cache=ResponseCache(tmp_path))
+
+        assert len(entries) == 5
+        assert server.chunks_sent < 10 < server.total_chunks
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_cutoff(self, tmp_path):
+        server = _StreamingServer(atom_feed([1, 2] + [60 + i for i in range(500)]))
+        async with _client(server) as client:
+            entries = await read_feed(
+                client, URL, SORTED_SPEC, cutoff=NOW - timedelta(days=30), cache=ResponseCache(tmp_path),
+            )
+
+        assert [e["title"] for e in entries] == ["v0", "v1"]
+        assert server.chunks_sent < 10 < server.total_chunks
+
+    @pytest.mark.asyncio
+    async def test_bytes_read_flat_in_feed_size(self, tmp_path):
+        sent = []
+        for size in (100, 1000):
+            server = _StreamingServer(atom_feed([1] * size))
+            spec = FeedSpec(entry_tag=ATOM_ENTRY, extract=extract_atom_entry, limit=5, parse_key="k")
+            async with _client(server) as client:
+                await read_feed(client, URL, spec, cache=ResponseCache(tmp_path / str(size)))
+            sent.append(server.chunks_sent)
+        assert sent[0] == sent[1]
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_entries_for_narrower_window(self, tmp_path):
+        server = _StreamingServer(atom_feed([1, 10, 40]))
+        cache = ResponseCache(tmp_path)
+        async with _client(server) as client:
+            first = await read_feed(client, URL, SORTED_SPEC, cutoff=NOW - timedelta(days=30), cache=cache)
+            second = await read_feed(client, URL, SORTED_SPEC, cutoff=NOW - timedelta(days=7), cache=cache)
+
+        assert second == first
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_wider_window_rereads_feed(self, tmp_path):
+        server = _StreamingServer(atom_feed([1, 10, 40]))
+        cache = ResponseCache(tmp_path)
+        async with _client(server) as client:
+            await read_feed(client, URL, SORTED_SPEC, cutoff=NOW - timedelta(days=7), cache=cache)
+            wider = await read_feed(client, URL, SORTED_SPEC, cutoff=NOW - timedelta(days=30), cache=cache)
+
+        assert [e["title"] for e in wider] == ["v0", "v1"]
+        assert "If-None-Match" not in server.requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, tmp_path):
+        async with _client(lambda request: httpx.Response(503)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await read_feed(client, URL, SORTED_SPEC, cache=ResponseCache(tmp_path))
@@ -0,0 +1,186 @@
+"""Tests for the conditional-GET response cache."""
+
+import os
+import time
+
+import httpx
+import pytest
+
+from claude_code_mastery.feeds import parse_feed
+from claude_code_mastery.http_cache import CacheEntry, ResponseCache, cached_get, cached_stream
+from claude_code_mastery.sources import PYPI_RSS_FEED, fetch_pypi_releases
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class _Server:
+    """Serves one body with an ETag and answers 304 to a matching If-None-Match."""
+
+    def __init__(self, body: str, etag: str | None = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        headers = {"ETag": self.etag} if self.etag else {}
+        return httpx.Response(200, text=self.body, headers=headers)
+
+
+class TestResponseCachePruning:
+    @staticmethod
+    def _store(cache: ResponseCache, url: str, age_days: float, body: str = "x" * 1000) -> None:
+        cache.put(CacheEntry(url=url, etag='"v1"', body=body))
+        then = time.time() - age_days * 86400
+        os.utime(cache._path(url), (then, then))
+
+    def test_expired_entries_dropped(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        self._store(cache, "https://x.test/old", 40)
+        self._store(cache, "https://x.test/new", 1)
+        assert cache.prune() == 1
+        assert cache.get("https://x.test/old") is None
+        assert cache.get("https://x.test/new") is not None
+
+    def test_size_cap_drops_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        for i, age in enumerate([3, 2, 1]):
+            self._store(cache, f"https://x.test/{i}", age)
+        cache.get("https://x.test/0")  # Reading refreshes the oldest entry
+        size = cache._path("https://x.test/0").stat().st_size
+        assert cache.prune(max_bytes=2 * size) == 1
+        assert [cache.get(f"https://x.test/{i}") is not None for i in range(3)] == [True, False, True]
+
+    def test_put_prunes(self, tmp_path):
+        self._store(ResponseCache(tmp_path), "https://x.test/old", 40)
+        ResponseCache(tmp_path).put(CacheEntry(url="https://x.test/new", etag='"v1"'))
+        assert not ResponseCache(tmp_path)._path("https://x.test/old").exists()
+
+
+class TestCachedGet:
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_parse(self, tmp_path):
+        server = _Server("hello")
+        calls = []
+
+        def parse(text):
+            calls.append(text)
+            return {"upper": text.upper()}
+
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(server) as client:
+            first = await cached_get(client, "https://x.test/feed", parse, "p1", cache=cache)
+            second = await cached_get(client, "https://x.test/feed", parse, "p1", cache=cache)
+
+        assert first == second == {"upper": "HELLO"}
+        assert calls == ["hello"]  # Parsed once; the 304 reused the stored result
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_new_parse_key_reparses_stored_body(self, tmp_path):
+        server = _Server("hello")
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(server) as client:
+            await cached_get(client, "https://x.test/feed", str.upper, "p1", cache=cache)
+            result = await cached_get(client, "https://x.test/feed", len, "p2", cache=cache)
+
+        assert result == 5
+        assert len(server.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_content_is_reparsed(self, tmp_path):
+        server = _Server("old")
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(server) as client:
+            await cached_get(client, "https://x.test/feed", str.upper, "p1", cache=cache)
+            server.body, server.etag = "new", '"v2"'
+            result = await cached_get(client, "https://x.test/feed", str.upper, "p1", cache=cache)
+
+        assert result == "NEW"
+        assert cache.get("https://x.test/feed").etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_no_validators_not_stored(self, tmp_path):
+        server = _Server("hello", etag=None)
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(server) as client:
+            await cached_get(client, "https://x.test/feed", str.upper, "p1", cache=cache)
+            await cached_get(client, "https://x.test/feed", str.upper, "p1", cache=cache)
+
+        assert cache.get("https://x.test/feed") is None
+        assert "If-None-Match" not in server.requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(lambda request: httpx.Response(503)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await cached_get(client, "https://x.test/feed", str.upper, "p1", cache=cache)
+
+
+PYPI_RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item><title>9.9.9</title><link>https://pypi.org/project/anthropic/9.9.9/</link>
+  <pubDate>Fri, 01 Jan 2999 00:00:00 GMT</pubDate></item>
+  <item><title>0.0.1</title><link>https://pypi.org/project/anthropic/0.0.1/</link>
+  <pubDate>Mon, 01 Jan 2001 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class TestFeedFetchersUseCache:
+    def test_parse_pypi_rss(self):
+        items = parse_feed(PYPI_RSS, PYPI_RSS_FEED)
+        assert [i["version"] for i in items] == ["9.9.9", "0.0.1"]
+
+    @pytest.mark.asyncio
+    async def test_pypi_not_modified_gives_same_updates(self):
+        server = _Server(PYPI_RSS)
+        async with _mock_client(server) as client:
+            first = await fetch_pypi_releases(30, client=client)
+            second = await fetch_pypi_releases(30, client=client)
+
+        assert [u.title for u in first] == ["Anthropic Python SDK 9.9.9"]
+        assert [u.title for u in second] == [u.title for u in first]
+        assert "If-None-Match" in server.requests[1].headers
+
+
+class TestCachedStream:
+    @staticmethod
+    async def _read_upper(response: httpx.Response) -> str:
+        return (await response.aread()).decode().upper()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_result(self, tmp_path):
+        server = _Server("hello")
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(server) as client:
+            first = await cached_stream(client, "https://x.test/feed", self._read_upper, "p1", cache=cache)
+            second = await cached_stream(client, "https://x.test/feed", self._read_upper, "p1", cache=cache)
+
+        assert first == second == "HELLO"
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+        assert cache.get("https://x.test/feed").body == ""  # Only the result is stored
+
+    @pytest.mark.asyncio
+    async def test_unusable_result_is_not_revalidated(self, tmp_path):
+        server = _Server("hello")
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(server) as client:
+            await cached_stream(client, "https://x.test/feed", self._read_upper, "p1", cache=cache)
+            await cached_stream(
+                client, "https://x.test/feed", self._read_upper, "p1", cache=cache,
+                reusable=lambda stored: False,
+            )
+
+        assert "If-None-Match" not in server.requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        async with _mock_client(lambda request: httpx.Response(503)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await cached_stream(client, "https://x.test/feed", self._read_upper, "p1", cache=cache)
@@ -0,0 +1,76 @@
+"""Tests for the shared HTTP client."""
+
+import httpx
+import pytest
+
+from claude_code_mastery import http_client
+from claude_code_mastery.http_client import borrow_client, create_client, http_session
+from claude_code_mastery.sources import fetch_npm_releases
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+# --- borrow_client / http_session ---
+
+class TestBorrowClient:
+    @pytest.mark.asyncio
+    async def test_yields_given_client_without_closing(self):
+        client = _mock_client(lambda request: httpx.Response(200))
+        async with borrow_client(client) as borrowed:
+            assert borrowed is client
+        assert not client.is_closed
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_creates_and_closes_own_client(self):
+        async with borrow_client() as borrowed:
+            assert isinstance(borrowed, httpx.AsyncClient)
+            assert not borrowed.is_closed
+        assert borrowed.is_closed
+
+    @pytest.mark.asyncio
+    async def test_session_closes_client(self):
+        async with http_session() as client:
+            assert not client.is_closed
+        assert client.is_closed
+
+
+class TestCreateClient:
+    @pytest.mark.asyncio
+    async def test_follows_redirects(self):
+        client = create_client()
+        assert client.follow_redirects is True
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(self, monkeypatch):
+        monkeypatch.setattr(http_client, "_http2_available", False)
+        client = create_client()
+        # No h2 → plain HTTP/1.1 transport; creation must not raise
+        assert client is not None
+        await client.aclose()
+
+
+# --- Fetchers use the injected client ---
+
+class TestInjectedClient:
+    @pytest.mark.asyncio
+    async def test_npm_fetcher_uses_injected_client(self):
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(200, json={
+                "dist-tags": {"latest": "9.9.9"},
+                "time": {"9.9.9": "2999-01-01T00:00:00.000Z"},
+            })
+
+        client = _mock_client(handler)
+        updates = await fetch_npm_releases(30, client=client)
+        await client.aclose()
+
+        assert requested == ["https://registry.npmjs.org/@anthropic-ai/claude-code"]
+        assert len(updates) == 1
+        assert updates[0].title == "Claude Code npm 9.9.9 (latest)"
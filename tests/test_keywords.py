@@ -0,0 +1,44 @@
+"""Tests for the compiled keyword matcher."""
+
+import random
+
+import pytest
+
+from claude_code_mastery import keywords
+from claude_code_mastery.keywords import KeywordMatcher
+from claude_code_mastery.sources import CLAUDE_CODE_KEYWORDS
+
+BACKENDS = [False] + ([True] if keywords._ahocorasick is not None else [])
+
+
+def _random_texts(words: list[str], count: int = 500) -> list[str]:
+    rng = random.Random(0)
+    texts = []
+    for _ in range(count):
+        parts = [rng.choice(words + ["abc", " ", "x", "claude"]) for _ in range(rng.randint(0, 8))]
+        texts.append("".join(parts))
+    return texts
+
+
+@pytest.mark.parametrize("use_automaton", BACKENDS)
+class TestKeywordMatcher:
+    def test_matches_substring_checks(self, use_automaton):
+        kws = list(CLAUDE_CODE_KEYWORDS) + ["ab", "bc", "abc", "b"]
+        matcher = KeywordMatcher(kws, use_automaton=use_automaton)
+        for text in _random_texts(kws):
+            expected = {kw for kw in kws if kw in text}
+            assert matcher.find(text) == expected
+            assert matcher.any(text) == bool(expected)
+
+    def test_overlapping_and_nested_hits(self, use_automaton):
+        matcher = KeywordMatcher(["agent", "agent teams", "teams", "ntt"], use_automaton=use_automaton)
+        assert matcher.find("agent teams") == {"agent", "agent teams", "teams"}
+
+    def test_case_sensitive(self, use_automaton):
+        matcher = KeywordMatcher(["CLAUDE.md"], use_automaton=use_automaton)
+        assert matcher.find("claude.md") == set()
+
+    def test_empty(self, use_automaton):
+        matcher = KeywordMatcher([], use_automaton=use_automaton)
+        assert matcher.find("anything") == set()
+        assert matcher.any("anything") is False
@@ -0,0 +1,105 @@
+"""Tests for the curriculum outline."""
+
+from claude_code_mastery import outline as outline_module
+from claude_code_mastery.outline import CurriculumOutline, get_outline
+
+
+SAMPLE = """# Curriculum v2
+
+## Phase I: Foundation
+
+### WEEK 1: The Terminal
+- Terminal basics
+
+---
+
+### WEEK 2: Git
+- Git fundamentals
+
+## Phase II: Building
+
+### Week 9 — Hooks
+- Hook events
+
+---
+
+## Appendix A: CLI Reference
+| Flag | Description |
+
+## Appendix B: Glossary
+- Terms
+"""
+
+
+class TestCurriculumOutline:
+    def test_header_kinds(self):
+        outline = CurriculumOutline(SAMPLE)
+        assert [n.kind for n in outline.nodes] == [
+            "heading", "phase", "week", "week", "phase", "week", "appendix", "appendix",
+        ]
+        assert [n.week for n in outline.weeks] == [1, 2, 9]
+
+    def test_tree_nests_by_level(self):
+        outline = CurriculumOutline(SAMPLE)
+        assert len(outline.roots) == 1
+        root = outline.roots[0]
+        assert [c.title for c in root.children] == [
+            "Phase I: Foundation", "Phase II: Building",
+            "Appendix A: CLI Reference", "Appendix B: Glossary",
+        ]
+        phase1 = root.children[0]
+        assert [c.week for c in phase1.children] == [1, 2]
+        assert phase1.end == SAMPLE.index("## Phase II")
+        assert root.end == len(SAMPLE)
+
+    def test_offsets_point_at_headers(self):
+        outline = CurriculumOutline(SAMPLE)
+        week2 = outline.week(2)
+        assert SAMPLE[week2.start:].startswith("### WEEK 2")
+        assert SAMPLE[week2.body:].startswith("WEEK 2")
+
+    def test_week_boundary(self):
+        outline = CurriculumOutline(SAMPLE)
+        assert outline.week_boundary(1, outline.week(1).body) == outline.week(2).start
+        # Week 2 has no week 3: bounded by the next phase header
+        assert outline.week_boundary(2, outline.week(2).body) == SAMPLE.index("## Phase II")
+
+    def test_leading_zero_is_not_that_week(self):
+        outline = CurriculumOutline("### Week 01: Zero\n- x\n")
+        assert outline.week(1) is None
+
+    def test_last_separator_matches_rfind(self):
+        outline = CurriculumOutline(SAMPLE)
+        for start in range(0, len(SAMPLE), 7):
+            for end in range(start, len(SAMPLE) + 1, 11):
+                assert outline.last_separator(start, end) == SAMPLE.rfind("\n---", start, end)
+
+    def test_next_header(self):
+        outline = CurriculumOutline(SAMPLE)
+        pos = SAMPLE.index("Terminal basics")
+        assert outline.next_header(pos) is outline.week(2)
+        assert outline.next_header(len(SAMPLE)) is None
+
+    def test_week_and_appendix_sections(self):
+        outline = CurriculumOutline(SAMPLE)
+        weeks = outline.week_sections()
+        assert [(s.week, s.title) for s in weeks] == [(1, "The Terminal"), (2, "Git"), (9, "Hooks")]
+        assert "Terminal basics" in SAMPLE[weeks[0].start:weeks[0].end]
+        appendices = outline.appendix_sections()
+        assert [s.title for s in appendices] == ["Appendix A: CLI Reference", "Appendix B: Glossary"]
+        assert "Glossary" not in SAMPLE[appendices[0].start:appendices[0].end]
+
+
+class TestGetOutline:
+    def test_reuses_outline_for_same_content(self):
+        first = get_outline(SAMPLE)
+        assert get_outline(SAMPLE) is first
+        assert get_outline("".join(SAMPLE)) is first  # Equal but not identical text
+
+    def test_new_content_gets_new_outline(self):
+        assert get_outline(SAMPLE) is not get_outline(SAMPLE + "\n### WEEK 3: New\n")
+
+    def test_memo_is_bounded(self):
+        for i in range(outline_module.MAX_CACHED_OUTLINES + 3):
+            get_outline(f"### WEEK {i}\n")
+        assert len(outline_module._outline_memo) <= outline_module.MAX_CACHED_OUTLINES
@@ -0,0 +1,132 @@
+"""Tests for the parse pool and the scrapers that submit to it."""
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from claude_code_mastery import parse_pool, sources
+from claude_code_mastery.parse_pool import (
+    configure_parse_pool,
+    get_parse_executor,
+    parse_pool_settings,
+    run_parse,
+)
+from claude_code_mastery.scheduler import configure_parse_pool_from_config
+
+BLOG_HTML = """
+<html><body>
+  <a href="/news/claude-code-hooks">
+    <h3>Claude Code hooks</h3><p>Run commands on agent events.</p>
+    <time datetime="{recent}"></time>
+  </a>
+  <a href="/news/old-post">
+    <h3>Claude Code launch</h3><p>Old news about the agent.</p>
+    <time datetime="2020-01-01T00:00:00Z"></time>
+  </a>
+  <a href="/news/pancakes"><h3>Pancakes</h3><p>Breakfast.</p></a>
+</body></html>
+"""
+
+
+def _thread_name(_text: str) -> str:
+    return threading.current_thread().name
+
+
+@pytest.fixture(autouse=True)
+def default_pool():
+    configure_parse_pool()
+    yield
+    configure_parse_pool()
+
+
+def _blog_html() -> str:
+    return BLOG_HTML.format(recent=datetime.now(timezone.utc).isoformat())
+
+
+class TestConfigureParsePool:
+    def test_defaults_to_thread_pool(self):
+        assert parse_pool_settings() == ("thread", parse_pool.DEFAULT_PARSE_WORKERS)
+        assert isinstance(get_parse_executor(), ThreadPoolExecutor)
+
+    def test_worker_count(self):
+        configure_parse_pool("thread", 3)
+        assert parse_pool_settings() == ("thread", 3)
+        assert get_parse_executor()._max_workers == 3
+
+    def test_zero_workers_means_default(self):
+        configure_parse_pool("thread", 0)
+        assert parse_pool_settings()[1] == parse_pool.DEFAULT_PARSE_WORKERS
+
+    def test_process_pool(self):
+        configure_parse_pool("process", 1)
+        assert isinstance(get_parse_executor(), ProcessPoolExecutor)
+
+    def test_rejects_unknown_kind(self):
+        with pytest.raises(ValueError, match="Unknown parse executor"):
+            configure_parse_pool("fiber")
+
+    def test_reconfigure_replaces_executor(self):
+        first = get_parse_executor()
+        configure_parse_pool("thread", 2)
+        assert get_parse_executor() is not first
+
+    def test_from_config(self):
+        configure_parse_pool_from_config({"parse_executor": "thread", "parse_workers": 2})
+        assert parse_pool_settings() == ("thread", 2)
+
+    def test_invalid_config_falls_back_to_defaults(self):
+        configure_parse_pool_from_config({"parse_executor": "gpu", "parse_workers": 2})
+        assert parse_pool_settings() == ("thread", parse_pool.DEFAULT_PARSE_WORKERS)
+
+
+class TestRunParse:
+    def test_runs_off_the_event_loop_thread(self):
+        name = asyncio.run(run_parse(_thread_name, ""))
+        assert name.startswith("parse")
+
+    def test_passes_extra_arguments(self):
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+        updates = asyncio.run(run_parse(sources._parse_blog_page, _blog_html(), cutoff))
+        assert [u.title for u in updates] == ["Claude Code hooks"]
+
+    def test_process_pool_round_trips_updates(self):
+        configure_parse_pool("process", 1)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+        updates = asyncio.run(run_parse(sources._parse_blog_page, _blog_html(), cutoff))
+        assert [u.url for u in updates] == ["https://www.anthropic.com/news/claude-code-hooks"]
+        assert updates[0].source == "anthropic_blog"
+
+    def test_parse_errors_propagate(self):
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(run_parse(divmod, 1, 0))
+
+
+class TestScrapersUseParsePool:
+    def test_blog_fetch_parses_via_pool(self, monkeypatch):
+        calls = []
+        real_run_parse = sources.run_parse
+
+        async def spy(parse, *args):
+            calls.append(parse.__name__)
+            return await real_run_parse(parse, *args)
+
+        monkeypatch.setattr(sources, "run_parse", spy)
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, text=_blog_html()))
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await sources.fetch_anthropic_blog(30, client)
+
+        updates = asyncio.run(run())
+        assert calls == ["_parse_blog_page"]
+        assert [u.title for u in updates] == ["Claude Code hooks"]
+
+    def test_youtube_falls_back_to_meta_tags(self):
+        html = '<html><head><meta property="og:title" content="Claude Code in action"></head></html>'
+        updates = sources._parse_youtube_page(html, "https://www.youtube.com/@anthropic-ai/videos")
+        assert [u.title for u in updates] == ["Claude Code in action"]
+        assert updates[0].tags[0] == "video"
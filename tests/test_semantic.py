@@ -1,8 +1,11 @@
 """Tests for the semantic matching engine."""
 
 import pytest
+from claude_code_mastery import semantic
 from claude_code_mastery.semantic import (
     SemanticIndex,
+    get_index,
+    index_key,
     _normalise,
     _expand_with_synonyms,
     _fallback_keyword_check,
@@ -146,6 +149,73 @@ class TestSemanticIndex:
         assert week == 11
 
 
+# --- Batched matching ---
+
+class TestMatchBatch:
+    TEXTS = [
+        "lifecycle event callbacks",
+        "mcp server configuration",
+        "multi-agent orchestration and subagents",
+        "quantum computing blockchain",
+    ]
+
+    def test_matches_single_queries(self, sample_curriculum):
+        idx = SemanticIndex()
+        if not idx.build(sample_curriculum):
+            pytest.skip("scikit-learn not available")
+        matches = idx.match_batch(self.TEXTS, coverage_threshold=0.30)
+
+        assert len(matches) == len(self.TEXTS)
+        for text, match in zip(self.TEXTS, matches):
+            assert match.best_week == idx.best_week(text)
+            assert match.covered == idx.is_covered(text, threshold=0.30)
+
+    def test_unbuilt_index(self):
+        matches = SemanticIndex().match_batch(["anything"])
+        assert matches[0].best_week is None
+        assert matches[0].covered is False
+
+
+# --- Persisted index ---
+
+class TestPersistedIndex:
+    QUERIES = ["lifecycle event callbacks", "mcp server configuration", "subagents"]
+
+    def test_save_load_round_trip(self, sample_curriculum, tmp_path):
+        idx = SemanticIndex()
+        if not idx.build(sample_curriculum):
+            pytest.skip("scikit-learn not available")
+        idx.save(tmp_path / "idx")
+        loaded = SemanticIndex.load(tmp_path / "idx")
+
+        for q in self.QUERIES:
+            assert loaded.query(q) == pytest.approx(idx.query(q))
+
+    def test_get_index_reuses_disk_copy(self, sample_curriculum, monkeypatch):
+        if get_index(sample_curriculum) is None:
+            pytest.skip("scikit-learn not available")
+        semantic._index_memo.clear()  # As in a new process
+
+        def no_refit(self, *args, **kwargs):
+            raise AssertionError("index was refit")
+
+        monkeypatch.setattr(SemanticIndex, "build", no_refit)
+        idx = get_index(sample_curriculum)
+        assert idx.best_week("multi-agent orchestration and subagents") == 11
+
+    def test_memoised_in_process(self, sample_curriculum):
+        first = get_index(sample_curriculum)
+        if first is None:
+            pytest.skip("scikit-learn not available")
+        assert get_index(sample_curriculum) is first
+
+    def test_key_changes_with_curriculum_and_topic_map(self, sample_curriculum):
+        base = index_key(sample_curriculum)
+        assert index_key(sample_curriculum + "\n- new topic") != base
+        assert index_key(sample_curriculum, {1: {"title": "x"}}) != base
+        assert index_key(sample_curriculum) == base
+
+
 # --- is_semantically_covered (integration) ---
 
 class TestIsSemanticallyCovered:
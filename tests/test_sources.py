@@ -1,13 +1,26 @@
 """Tests for the data source fetchers."""
 
+import asyncio
+import json
+
 import pytest
+from claude_code_mastery import sources
+from claude_code_mastery.cache import load_watermarks, store_watermarks
 from claude_code_mastery.sources import (
     _is_claude_relevant,
     _extract_title,
     _extract_tags,
     _content_hash,
     _is_within_window,
+    commit_watermarks,
+    fetch_all_updates,
+    fetch_all_updates_cached,
+    iter_source_results,
+    iter_source_results_cached,
+    iter_updates,
+    FetchResult,
     Update,
+    Watermark,
 )
 from datetime import datetime, timezone, timedelta
 
@@ -122,3 +135,601 @@ class TestIsWithinWindow:
         recent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         cutoff = datetime.now(timezone.utc) - timedelta(days=7)
         assert _is_within_window(recent, cutoff) is True
+
+
+# --- fetch_all_updates_cached ---
+
+def _dated_update(title: str, days_ago: int) -> Update:
+    date = (datetime.now(timezone.utc) - timedelta(days=days_ago)).isoformat()
+    return Update(source="anthropic_blog", title=title, content="", url="", date=date)
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    """Replace the network fan-out with a counting stub."""
+    calls = []
+
+    async def fetch(days_back, client=None):
+        calls.append(days_back)
+        await asyncio.sleep(0.01)
+        return FetchResult(
+            updates=[_dated_update("recent", 1), _dated_update("older", 20)],
+            errors=["X: blocked"],
+        )
+
+    monkeypatch.setattr(sources, "fetch_all_updates", fetch)
+    return calls
+
+
+class TestFetchAllUpdatesCached:
+    @pytest.mark.asyncio
+    async def test_repeat_call_reuses_result(self, fake_fetch):
+        first = await fetch_all_updates_cached(30)
+        second = await fetch_all_updates_cached(30)
+        assert fake_fetch == [30]
+        assert [u.title for u in second.updates] == [u.title for u in first.updates]
+        assert second.errors == ["X: blocked"]
+
+    @pytest.mark.asyncio
+    async def test_larger_window_serves_smaller(self, fake_fetch):
+        await fetch_all_updates_cached(30)
+        narrowed = await fetch_all_updates_cached(7)
+        assert fake_fetch == [30]
+        assert [u.title for u in narrowed.updates] == ["recent"]
+
+    @pytest.mark.asyncio
+    async def test_smaller_window_does_not_serve_larger(self, fake_fetch):
+        await fetch_all_updates_cached(7)
+        await fetch_all_updates_cached(30)
+        assert fake_fetch == [7, 30]
+
+    @pytest.mark.asyncio
+    async def test_expired_or_zero_ttl_refetches(self, fake_fetch):
+        await fetch_all_updates_cached(30)
+        await fetch_all_updates_cached(30, ttl=0)
+        assert fake_fetch == [30, 30]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self, fake_fetch):
+        results = await asyncio.gather(
+            fetch_all_updates_cached(30),
+            fetch_all_updates_cached(30),
+            fetch_all_updates_cached(14),
+        )
+        assert fake_fetch == [30]
+        assert [len(r.updates) for r in results] == [2, 2, 1]
+        assert not sources._fetch_inflight
+
+    @pytest.mark.asyncio
+    async def test_result_with_errors_expires_early(self, fake_fetch):
+        await fetch_all_updates_cached(30)
+        sources._fetch_cache[30].fetched_at -= sources.FETCH_ERROR_CACHE_TTL + 1
+        await fetch_all_updates_cached(30)
+        assert fake_fetch == [30, 30]
+
+    @pytest.mark.asyncio
+    async def test_result_without_errors_kept_for_full_ttl(self, monkeypatch):
+        calls = []
+
+        async def fetch(days_back, client=None):
+            calls.append(days_back)
+            return FetchResult(updates=[_dated_update("recent", 1)], errors=[])
+
+        monkeypatch.setattr(sources, "fetch_all_updates", fetch)
+        await fetch_all_updates_cached(30)
+        sources._fetch_cache[30].fetched_at -= sources.FETCH_ERROR_CACHE_TTL + 1
+        await fetch_all_updates_cached(30)
+        assert calls == [30]
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self, monkeypatch):
+        async def broken(days_back, client=None):
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(sources, "fetch_all_updates", broken)
+        with pytest.raises(RuntimeError):
+            await fetch_all_updates_cached(30)
+        assert not sources._fetch_cache
+        assert not sources._fetch_inflight
+
+
+# --- fetch_all_updates scheduling ---
+
+ALL_FETCHERS = [
+    "fetch_github_releases_atom", "fetch_reddit_atom", "fetch_pypi_releases",
+    "fetch_npm_releases", "fetch_boris_x_posts", "fetch_anthropic_blog",
+    "fetch_anthropic_changelog", "fetch_claude_code_docs", "fetch_anthropic_youtube",
+    "fetch_github_releases", "fetch_reddit_claude",
+]
+
+
+@pytest.fixture
+def stub_fetchers(monkeypatch):
+    """Replace every fetcher with a stub; returns (configure, events)."""
+    events = []
+    behaviour = {}
+
+    def make(name):
+        async def fetch(*args, **kwargs):
+            delay, outcome = behaviour.get(name, (0, []))
+            events.append(("start", name))
+            await asyncio.sleep(delay)
+            events.append(("end", name))
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return fetch
+
+    for name in ALL_FETCHERS:
+        monkeypatch.setattr(sources, name, make(name))
+    return behaviour, events
+
+
+class TestFetchAllUpdatesScheduling:
+    @pytest.mark.asyncio
+    async def test_tiers_start_together(self, stub_fetchers):
+        behaviour, events = stub_fetchers
+        behaviour["fetch_reddit_atom"] = (0.05, [_dated_update("reddit", 1)])
+        behaviour["fetch_github_releases_atom"] = (0, [_dated_update("gh", 1)])
+        await fetch_all_updates(30, client=object())
+        # Every scraper starts before the slow feed finishes
+        reddit_end = events.index(("end", "fetch_reddit_atom"))
+        started_before = {name for kind, name in events[:reddit_end] if kind == "start"}
+        assert {
+            "fetch_boris_x_posts", "fetch_anthropic_blog", "fetch_anthropic_changelog",
+            "fetch_claude_code_docs", "fetch_anthropic_youtube",
+        } <= started_before
+
+    @pytest.mark.asyncio
+    async def test_fallback_starts_when_its_feed_fails(self, stub_fetchers):
+        behaviour, events = stub_fetchers
+        behaviour["fetch_github_releases_atom"] = (0, RuntimeError("feed down"))
+        behaviour["fetch_reddit_atom"] = (0.05, [_dated_update("reddit", 1)])
+        behaviour["fetch_github_releases"] = (0, [_dated_update("gh html", 1)])
+        result = await fetch_all_updates(30, client=object())
+        assert events.index(("start", "fetch_github_releases")) < events.index(("end", "fetch_reddit_atom"))
+        assert ("start", "fetch_reddit_claude") not in events
+        assert [u.title for u in result.updates] == ["reddit", "gh html"]
+        assert result.errors == ["GitHub Releases (Atom): RuntimeError: feed down"]
+
+    @pytest.mark.asyncio
+    async def test_empty_feed_triggers_fallback(self, stub_fetchers):
+        behaviour, events = stub_fetchers
+        behaviour["fetch_github_releases_atom"] = (0, [_dated_update("gh", 1)])
+        behaviour["fetch_reddit_claude"] = (0, RuntimeError("blocked"))
+        result = await fetch_all_updates(30, client=object())
+        assert ("start", "fetch_reddit_claude") in events
+        assert ("start", "fetch_github_releases") not in events
+        assert result.errors == ["Reddit r/ClaudeAI (JSON): RuntimeError: blocked"]
+
+    @pytest.mark.asyncio
+    async def test_slow_source_misses_deadline_others_returned(self, stub_fetchers):
+        behaviour, _ = stub_fetchers
+        behaviour["fetch_anthropic_blog"] = (1, [_dated_update("blog", 1)])
+        behaviour["fetch_github_releases_atom"] = (0, [_dated_update("gh", 1)])
+        behaviour["fetch_reddit_atom"] = (0, [_dated_update("reddit", 1)])
+        result = await fetch_all_updates(30, client=object(), source_deadline=0.05)
+        assert [u.title for u in result.updates] == ["gh", "reddit"]
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Anthropic Blog: TimeoutError:")
+        assert "source deadline" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_budget_bounds_feed_plus_fallback(self, stub_fetchers):
+        behaviour, _ = stub_fetchers
+        behaviour["fetch_github_releases_atom"] = (0.03, RuntimeError("feed down"))
+        behaviour["fetch_github_releases"] = (1, [_dated_update("gh html", 1)])
+        behaviour["fetch_reddit_atom"] = (0, [_dated_update("reddit", 1)])
+        result = await fetch_all_updates(30, client=object(), budget=0.1)
+        assert [u.title for u in result.updates] == ["reddit"]
+        assert any(
+            e.startswith("GitHub Releases (HTML): TimeoutError:") and "fetch budget" in e
+            for e in result.errors
+        )
+
+
+# --- Streaming ---
+
+class TestIterSourceResultsCached:
+    @staticmethod
+    async def _follow(days_back: int) -> list:
+        return [r async for r in iter_source_results_cached(days_back, client=object())]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_fetch_each_source_once(self, stub_fetchers):
+        behaviour, events = stub_fetchers
+        behaviour["fetch_anthropic_blog"] = (0.02, [_dated_update("recent", 1), _dated_update("older", 20)])
+        behaviour["fetch_github_releases_atom"] = (0.04, [_dated_update("gh", 2)])
+
+        wide, narrow, batch = await asyncio.gather(
+            self._follow(30), self._follow(7), fetch_all_updates_cached(30),
+        )
+
+        started = [name for kind, name in events if kind == "start"]
+        assert sorted(started) == sorted(set(started))
+        assert len(wide) == len(narrow) == len(set(started))
+        assert sorted(u.title for r in wide for u in r.updates) == ["gh", "older", "recent"]
+        assert sorted(u.title for r in narrow for u in r.updates) == ["gh", "recent"]
+        assert sorted(u.title for u in batch.updates) == ["gh", "older", "recent"]
+        assert not sources._fetch_inflight
+
+    @pytest.mark.asyncio
+    async def test_late_follower_replays_delivered_results(self, stub_fetchers):
+        behaviour, events = stub_fetchers
+        behaviour["fetch_anthropic_youtube"] = (0.05, [])
+        first = asyncio.ensure_future(self._follow(30))
+        await asyncio.sleep(0.02)
+        late = await self._follow(30)
+        assert len(late) == len(await first) == 11  # Nine sources plus both fallbacks
+        assert events.count(("start", "fetch_anthropic_youtube")) == 1
+
+    @pytest.mark.asyncio
+    async def test_joins_batch_fetch_in_flight(self, stub_fetchers):
+        behaviour, events = stub_fetchers
+        behaviour["fetch_anthropic_blog"] = (0.02, [_dated_update("blog", 1)])
+        behaviour["fetch_anthropic_changelog"] = (0, RuntimeError("blocked"))
+        batch = asyncio.ensure_future(fetch_all_updates_cached(30, client=object()))
+        await asyncio.sleep(0)
+        results = await self._follow(30)
+        assert events.count(("start", "fetch_anthropic_blog")) == 1
+        assert [u.title for r in results for u in r.updates] == ["blog"]
+        assert [r.error for r in results if r.error] == (await batch).errors
+
+    @pytest.mark.asyncio
+    async def test_result_is_cached(self, stub_fetchers):
+        _, events = stub_fetchers
+        await self._follow(30)
+        assert sources.get_cached_fetch(30) is not None
+        assert not sources._fetch_inflight
+
+
+class TestIterSourceResults:
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self, stub_fetchers):
+        behaviour, _ = stub_fetchers
+        behaviour["fetch_github_releases_atom"] = (0.05, [_dated_update("gh", 1)])
+        behaviour["fetch_reddit_atom"] = (0, [_dated_update("reddit", 1)])
+        names = [r.name async for r in iter_source_results(30, client=object())]
+        assert names.index("Reddit r/ClaudeAI (Atom)") < names.index("GitHub Releases (Atom)")
+        assert len(names) == 9
+
+    @pytest.mark.asyncio
+    async def test_duplicates_dropped_across_sources(self, stub_fetchers):
+        behaviour, _ = stub_fetchers
+        same = _dated_update("same", 1)
+        behaviour["fetch_anthropic_blog"] = (0, [same])
+        behaviour["fetch_anthropic_changelog"] = (0.02, [same])
+        titles = [u.title async for u in iter_updates(30, client=object())]
+        assert titles == ["same"]
+
+    @pytest.mark.asyncio
+    async def test_early_close_cancels_running_sources(self, stub_fetchers):
+        behaviour, events = stub_fetchers
+        behaviour["fetch_anthropic_youtube"] = (5, [])
+        stream = iter_source_results(30, client=object())
+        async for _ in stream:
+            break
+        await stream.aclose()
+        assert ("end", "fetch_anthropic_youtube") not in events
+
+    @pytest.mark.asyncio
+    async def test_batch_wrapper_keeps_source_order(self, stub_fetchers):
+        behaviour, _ = stub_fetchers
+        behaviour["fetch_github_releases_atom"] = (0.03, [_dated_update("gh", 1)])
+        behaviour["fetch_anthropic_blog"] = (0, [_dated_update("blog", 1)])
+        behaviour["fetch_npm_releases"] = (0.01, [_dated_update("npm", 1)])
+        result = await fetch_all_updates(30, client=object())
+        assert [u.title for u in result.updates] == ["gh", "npm", "blog"]
+
+
+# --- npm releases ---
+
+def _packument(versions: int, recent: int) -> dict:
+    """``versions`` releases, the last ``recent`` of them within the past week."""
+    now = datetime.now(timezone.utc)
+    times = {"created": "2020-01-01T00:00:00.000Z", "modified": now.isoformat()}
+    for i in range(versions):
+        age = timedelta(hours=versions - i) if i >= versions - recent else timedelta(days=400 + i)
+        times[f"1.0.{i}"] = (now - age).isoformat().replace("+00:00", "Z")
+    return {
+        "name": "@anthropic-ai/claude-code",
+        "dist-tags": {"latest": f"1.0.{versions - 1}"},
+        "versions": {v: {"name": "x", "version": v, "dependencies": {}} for v in times if v[0].isdigit()},
+        "time": times,
+        "readme": "# Claude Code\n" * 100,
+    }
+
+
+class TestStrictFetchers:
+    """Hedged fetchers raise on failure so a failed attempt cannot win."""
+
+    @staticmethod
+    async def _run(fetch, handler, **kwargs):
+        import httpx
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await fetch(30, client, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_reddit_atom(self):
+        import httpx
+
+        handler = lambda request: httpx.Response(503)
+        assert await self._run(sources.fetch_reddit_atom, handler) == []
+        with pytest.raises(httpx.HTTPStatusError):
+            await self._run(sources.fetch_reddit_atom, handler, strict=True)
+
+    @pytest.mark.asyncio
+    async def test_reddit_json_raises_only_when_html_fallback_fails_too(self):
+        import httpx
+
+        def handler(request):
+            if request.url.path.endswith(".json"):
+                return httpx.Response(503)
+            return httpx.Response(200 if html_ok else 503, text="<html></html>")
+
+        html_ok = True
+        assert await self._run(sources.fetch_reddit_claude, handler, strict=True) == []
+        html_ok = False
+        with pytest.raises(httpx.HTTPStatusError):
+            await self._run(sources.fetch_reddit_claude, handler, strict=True)
+
+    @pytest.mark.asyncio
+    async def test_youtube_raises_when_no_url_answers(self):
+        import httpx
+
+        def handler(request):
+            return httpx.Response(200 if answering in request.url.path else 500, text="<html></html>")
+
+        answering = "/@AnthropicAI/"
+        assert await self._run(sources.fetch_anthropic_youtube, handler, strict=True) == []
+        answering = "/nowhere/"
+        with pytest.raises(RuntimeError, match="HTTP 500"):
+            await self._run(sources.fetch_anthropic_youtube, handler, strict=True)
+
+
+class TestRecentNpmVersions:
+    def test_matches_full_sort(self):
+        time_map = _packument(200, 50)["time"]
+        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+        expected = sorted(
+            (datetime.fromisoformat(t.replace("Z", "+00:00")), v)
+            for v, t in time_map.items() if v[0].isdigit()
+        )[::-1]
+        expected = [(dt, v) for dt, v in expected if dt >= cutoff][:sources.NPM_MAX_RELEASES]
+        assert sources._recent_npm_versions(time_map, cutoff) == expected
+
+    def test_limit_and_order(self):
+        time_map = _packument(20, 10)["time"]
+        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+        versions = [v for _, v in sources._recent_npm_versions(time_map, cutoff, limit=3)]
+        assert versions == ["1.0.19", "1.0.18", "1.0.17"]
+
+    def test_skips_bookkeeping_and_unparseable_keys(self):
+        time_map = {"created": "2999-01-01T00:00:00Z", "modified": "2999-01-01T00:00:00Z", "1.0.0": "soon"}
+        assert sources._recent_npm_versions(time_map, datetime(2000, 1, 1, tzinfo=timezone.utc)) == []
+
+
+class TestFetchNpmReleases:
+    async def _fetch(self, packument: dict) -> list[Update]:
+        import httpx
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=packument))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await sources.fetch_npm_releases(7, client=client)
+
+    @pytest.mark.asyncio
+    async def test_without_ijson(self, monkeypatch):
+        monkeypatch.setattr(sources, "_ijson", None)
+        updates = await self._fetch(_packument(100, 5))
+        assert [u.title for u in updates][:2] == ["Claude Code npm 1.0.99 (latest)", "Claude Code npm 1.0.98"]
+        assert len(updates) == 5
+
+    @pytest.mark.asyncio
+    async def test_with_ijson(self, monkeypatch):
+        monkeypatch.setattr(sources, "_ijson", pytest.importorskip("ijson"))
+        updates = await self._fetch(_packument(100, 5))
+        assert [u.title for u in updates][:2] == ["Claude Code npm 1.0.99 (latest)", "Claude Code npm 1.0.98"]
+        assert len(updates) == 5
+
+    @pytest.mark.asyncio
+    async def test_ijson_stops_after_time_map(self, monkeypatch):
+        import httpx
+
+        monkeypatch.setattr(sources, "_ijson", pytest.importorskip("ijson"))
+        packument = _packument(50, 5)
+        packument["readme"] = "# Claude Code\n" * 20000
+        body = json.dumps(packument).encode()
+        sent = []
+
+        async def chunks():
+            for start in range(0, len(body), 4096):
+                sent.append(start)
+                yield body[start:start + 4096]
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+        async with httpx.AsyncClient(transport=transport) as client:
+            updates = await sources.fetch_npm_releases(7, client=client)
+
+        assert len(updates) == 5
+        assert len(sent) * 4096 < body.index(b'"readme"') + 4096
+
+
+# --- Incremental watermarks ---
+
+def _atom(entries: list[tuple[str, datetime]]) -> str:
+    body = "".join(
+        f"<entry><title>{title}</title><updated>{when.isoformat()}</updated>"
+        f'<link rel="alternate" href="https://github.com/r/{title}"/></entry>'
+        for title, when in entries
+    )
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">{body}</feed>'
+
+
+def _reddit_post(name: str, age: timedelta, score: int = 10) -> dict:
+    created = (datetime.now(timezone.utc) - age).timestamp()
+    return {"data": {
+        "name": name, "title": f"Claude Code tip {name}", "selftext": "", "url": "",
+        "permalink": f"/r/ClaudeAI/comments/{name}/", "created_utc": created, "score": score,
+    }}
+
+
+class TestWatermark:
+    def test_advance_is_monotonic(self):
+        mark = Watermark()
+        newer = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        mark.advance(newer, "b")
+        mark.advance(datetime(2026, 1, 1, tzinfo=timezone.utc), "a")
+        assert (mark.since(), mark.last_id) == (newer, "b")
+
+    def test_empty_has_no_since(self):
+        assert Watermark().since() is None
+
+
+class TestIncrementalFetchers:
+    @staticmethod
+    async def _run(fetch, handler, **kwargs):
+        import httpx
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await fetch(30, client, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_github_atom_reports_only_newer_releases(self):
+        import httpx
+
+        now = datetime.now(timezone.utc)
+        feed = _atom([("v3", now - timedelta(days=1)), ("v2", now - timedelta(days=3)), ("v1", now - timedelta(days=5))])
+        mark = Watermark(date=(now - timedelta(days=3)).isoformat())
+        updates = await self._run(
+            sources.fetch_github_releases_atom,
+            lambda request: httpx.Response(200, text=feed),
+            watermark=mark,
+        )
+        assert [u.title for u in updates] == ["Claude Code v3"]
+        assert mark.read and mark.last_id == "https://github.com/r/v3"
+
+    @pytest.mark.asyncio
+    async def test_npm_reports_only_newer_versions(self):
+        import httpx
+
+        packument = _packument(10, 3)
+        times = {v: t for v, t in packument["time"].items() if v.startswith("1.0.")}
+        mark = Watermark(date=datetime.fromisoformat(times["1.0.8"].replace("Z", "+00:00")).isoformat())
+        updates = await self._run(
+            sources.fetch_npm_releases,
+            lambda request: httpx.Response(200, json=packument),
+            watermark=mark,
+        )
+        assert [u.title for u in updates] == ["Claude Code npm 1.0.9 (latest)"]
+        assert mark.last_id == "1.0.9"
+
+    @staticmethod
+    def _reddit_listing(posts: list[dict], requests: list[dict]):
+        """Serve ``posts`` (newest first) as Reddit's paged /new listing."""
+        import httpx
+
+        def handler(request):
+            params = dict(request.url.params)
+            requests.append(params)
+            names = [p["data"]["name"] for p in posts]
+            start = names.index(params["after"]) + 1 if "after" in params else 0
+            page = posts[start:start + int(params["limit"])]
+            after = page[-1]["data"]["name"] if start + len(page) < len(posts) else None
+            return httpx.Response(200, json={"data": {"children": page, "after": after}})
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_reddit_pages_newest_first_to_anchor(self):
+        posts = [_reddit_post(f"t3_{i}", timedelta(minutes=30 * i)) for i in range(150)]
+        anchor = posts[80]["data"]
+        requests = []
+        mark = Watermark(
+            date=datetime.fromtimestamp(anchor["created_utc"], tz=timezone.utc).isoformat(),
+            last_id=anchor["name"],
+        )
+        updates = await self._run(
+            sources.fetch_reddit_claude, self._reddit_listing(posts, requests), watermark=mark,
+        )
+        assert [r.get("after") for r in requests] == [None, "t3_49"]
+        assert not any("before" in r for r in requests)
+        assert [u.title for u in updates] == [f"Claude Code tip t3_{i}" for i in range(80)]
+        assert mark.last_id == "t3_48"  # Newer posts may still gain score
+
+    @pytest.mark.asyncio
+    async def test_reddit_deleted_anchor_stops_at_its_date(self):
+        posts = [_reddit_post(f"t3_{i}", timedelta(days=i)) for i in range(5)]
+        requests = []
+        mark = Watermark(date=(datetime.now(timezone.utc) - timedelta(days=2, hours=12)).isoformat(), last_id="t3_gone")
+        updates = await self._run(
+            sources.fetch_reddit_claude, self._reddit_listing(posts, requests), watermark=mark,
+        )
+        assert [u.title for u in updates] == ["Claude Code tip t3_0", "Claude Code tip t3_1", "Claude Code tip t3_2"]
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_reddit_paging_is_capped(self):
+        posts = [_reddit_post(f"t3_{i}", timedelta(minutes=i)) for i in range(1000)]
+        requests = []
+        mark = Watermark(date=(datetime.now(timezone.utc) - timedelta(days=29)).isoformat(), last_id="t3_gone")
+        updates = await self._run(
+            sources.fetch_reddit_claude, self._reddit_listing(posts, requests), watermark=mark,
+        )
+        assert len(requests) == sources.REDDIT_MAX_PAGES
+        assert len(updates) == sources.REDDIT_MAX_PAGES * sources.REDDIT_PAGE_SIZE
+
+    @pytest.mark.asyncio
+    async def test_reddit_nothing_new_skips_html_fallback(self):
+        import httpx
+
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            return httpx.Response(200, json={"data": {"children": [_reddit_post("t3_a", timedelta(days=4))]}})
+
+        mark = Watermark(date=(datetime.now(timezone.utc) - timedelta(days=3)).isoformat())
+        assert await self._run(sources.fetch_reddit_claude, handler, watermark=mark) == []
+        assert requested == ["/r/ClaudeAI/new.json"]
+
+
+class TestIncrementalFetchAll:
+    @pytest.mark.asyncio
+    async def test_watermarks_passed_and_returned_uncommitted(self, stub_fetchers, monkeypatch):
+        behaviour, _ = stub_fetchers
+        seen = {}
+
+        async def npm(days_back, client=None, watermark=None):
+            seen["npm"] = watermark
+            watermark.advance(datetime(2026, 3, 1, tzinfo=timezone.utc), "2.0.0")
+            watermark.read = True
+            return []
+
+        monkeypatch.setattr(sources, "fetch_npm_releases", npm)
+        store_watermarks({"npm_releases": {"date": "2026-01-01T00:00:00+00:00", "last_id": "1.0.0"}})
+
+        result = await fetch_all_updates(30, client=object(), incremental=True)
+        assert seen["npm"].last_id == "2.0.0"
+        assert list(result.watermarks) == ["npm_releases"]  # Only sources that answered
+        assert load_watermarks()["npm_releases"]["last_id"] == "1.0.0"
+
+        commit_watermarks(result)
+        assert load_watermarks()["npm_releases"] == {"date": "2026-03-01T00:00:00+00:00", "last_id": "2.0.0"}
+
+    @pytest.mark.asyncio
+    async def test_answered_feed_with_nothing_new_skips_fallback(self, stub_fetchers, monkeypatch):
+        _, events = stub_fetchers
+
+        async def atom(days_back, client=None, watermark=None):
+            watermark.read = True
+            return []
+
+        monkeypatch.setattr(sources, "fetch_github_releases_atom", atom)
+        await fetch_all_updates(30, client=object(), incremental=True)
+        assert ("start", "fetch_github_releases") not in events
+
+    @pytest.mark.asyncio
+    async def test_not_incremental_by_default(self, stub_fetchers):
+        result = await fetch_all_updates(30, client=object())
+        assert result.watermarks == {}